@@ -0,0 +1,265 @@
+"""
+Модуль пакетной симуляции двигателей.
+
+Содержит класс EngineBatch, который хранит состояние двигателей N автомобилей
+(или N стратегий переключения) в параллельных массивах NumPy и продвигает
+их все одним векторизованным шагом по тем же правилам, что Engine, Car и Race.
+"""
+
+import numpy as np
+
+from src.game.game_car import Car
+from src.game.game_clock import PHYSICS_STEP
+from src.game.game_race import Race, TrackDistance
+
+
+class EngineBatch:
+    """
+    Класс пакетной симуляции заездов.
+
+    Каждая позиция массивов — отдельный заезд со своими характеристиками
+    автомобиля и оборотами переключения. Шаг повторяет Engine.update_throttle,
+    Engine.is_boost, Engine.is_good_shift, множители буста и штрафа из Car.update
+    и таймеры Race, поэтому результаты совпадают с RaceSimulator и
+    ShiftPolicyRevolutions.
+
+    Attributes:
+        size (int): Количество заездов в пакете.
+        revolutions (np.ndarray): Обороты двигателей.
+        throttle (np.ndarray): Уровень открытия дросселя.
+        acceleration_progress (np.ndarray): Прогресс ускорения.
+        current_gear (np.ndarray): Текущие передачи.
+        boost_frames_remaining (np.ndarray): Оставшиеся шаги буста.
+        boost_frames_total (int): Длительность буста Car.BOOST_TIME в шагах dt.
+        penalty_frames_total (int): Длительность штрафа Race.PENALTY_TIME в шагах dt.
+        shift_revolutions (np.ndarray): Обороты переключения, массив N x (передачи + 1).
+        speed (np.ndarray): Скорость прокрутки трека на последнем шаге.
+        distance_traveled (np.ndarray): Пройденное расстояние в метрах.
+        ticks (np.ndarray): Количество шагов от старта до финиша.
+    """
+
+    def __init__(self, cars, shift_revolutions=None, distance_total=4020, dt=PHYSICS_STEP):
+        """
+        Инициализирует пакет заездов.
+
+        Args:
+            cars (list): Автомобили Car (обычно с is_headless=True), по одному на заезд.
+                         Один и тот же объект можно передать несколько раз.
+            shift_revolutions (array-like, optional): Обороты переключения с каждой передачи,
+                                                      массив N x (передачи + 1). По умолчанию —
+                                                      середина зоны буста, как в ShiftPolicyRevolutions.
+            distance_total (float): Длина трека в метрах. По умолчанию 4020.
+            dt (float): Длительность шага физики в секундах.
+        """
+        self.size = len(cars)
+        self.dt = dt
+        self.distance_total = distance_total
+
+        engines = [car.engine for car in cars]
+        gears_total = max(engine.count_gear for engine in engines) + 1
+
+        self.count_gear = np.array([engine.count_gear for engine in engines], dtype=np.int64)
+        self.min_revolutions = np.array([engine.min_revolutions for engine in engines], dtype=np.float64)
+        self.max_revolutions = np.array([engine.max_revolutions for engine in engines], dtype=np.float64)
+        self.range_revolutions = self.max_revolutions - self.min_revolutions
+        self.min_revolutions_to_good_shift = np.array(
+            [engine.min_revolutions_to_good_shift for engine in engines], dtype=np.float64)
+        self.max_revolutions_to_good_shift = np.array(
+            [engine.max_revolutions_to_good_shift for engine in engines], dtype=np.float64)
+        self.min_revolutions_to_boost = np.array(
+            [engine.min_revolutions_to_boost for engine in engines], dtype=np.float64)
+        self.max_revolutions_to_boost = np.array(
+            [engine.max_revolutions_to_boost for engine in engines], dtype=np.float64)
+
+        self.boost_frames_total = round(Car.BOOST_TIME / dt)
+        self.penalty_frames_total = round(Race.PENALTY_TIME / dt)
+        self.frames_after_shift_total = np.array(
+            [round(car.frames_after_shift * PHYSICS_STEP / dt) for car in cars], dtype=np.int64)
+
+        self.speed_factor = np.zeros((self.size, gears_total), dtype=np.float64)
+        self.time_max_throttle = np.zeros((self.size, gears_total), dtype=np.float64)
+        for i, engine in enumerate(engines):
+            self.speed_factor[i, :engine.count_gear + 1] = engine._speed_factors
+            self.time_max_throttle[i, :engine.count_gear + 1] = engine._times_max_throttle
+
+        if shift_revolutions is None:
+            middle = (self.min_revolutions_to_boost + self.max_revolutions_to_boost) / 2
+            shift_revolutions = np.repeat(middle[:, None], gears_total, axis=1)
+        self.shift_revolutions = np.minimum(np.asarray(shift_revolutions, dtype=np.float64),
+                                            self.max_revolutions[:, None])
+        self.shift_revolutions[:, 0] = 0
+
+        self._index = np.arange(self.size)
+        self.reset()
+
+    def reset(self):
+        """
+        Возвращает все заезды в состояние на момент зеленого сигнала.
+        """
+        n = self.size
+        self.revolutions = self.min_revolutions.copy()
+        self.throttle = np.zeros(n)
+        self.acceleration_progress = np.zeros(n)
+        self.current_gear = np.zeros(n, dtype=np.int64)
+        self.boost_frames_remaining = np.zeros(n, dtype=np.int64)
+
+        self.speed = np.zeros(n)
+        self.speed_kmh = np.zeros(n)
+        self.speed_sum = np.zeros(n)
+        self.distance_traveled = np.zeros(n)
+
+        self.frames_after_shift = np.zeros(n, dtype=np.int64)
+        self.frames_bad_shift_penalty = np.zeros(n, dtype=np.int64)
+
+        self.count_good_shift = np.zeros(n, dtype=np.int64)
+        self.count_boost_shift = np.zeros(n, dtype=np.int64)
+        self.count_lose_shift = np.zeros(n, dtype=np.int64)
+
+        self.is_finished = np.zeros(n, dtype=bool)
+        self.ticks = np.zeros(n, dtype=np.int64)
+
+    def is_boost(self):
+        """
+        Векторный аналог Engine.is_boost.
+
+        Returns:
+            np.ndarray: Маска заездов, у которых обороты в зоне буста.
+        """
+        return (self.min_revolutions_to_boost <= self.revolutions) & (self.revolutions <= self.max_revolutions_to_boost)
+
+    def is_good_shift(self, new_gear):
+        """
+        Векторный аналог Engine.is_good_shift.
+
+        Как и Engine, проверяет обороты на момент нажатия: после Engine.shift_gear
+        текущая и новая передачи совпадают, поэтому прогноз оборотов равен текущим.
+
+        Args:
+            new_gear (np.ndarray): Новые передачи.
+
+        Returns:
+            np.ndarray: Маска корректных переключений.
+        """
+        rpm_after = np.maximum(self.min_revolutions, self.revolutions)
+        in_range = (self.min_revolutions_to_good_shift <= rpm_after) & (rpm_after <= self.max_revolutions_to_good_shift)
+        return (new_gear == 1) | in_range
+
+    def shift(self, mask):
+        """
+        Повышает передачу у заездов из маски.
+
+        Повторяет Car.shift_gear и правила Race.press_key: буст за переключение
+        в синей зоне, штраф за плохое переключение и блокировку после переключения.
+
+        Args:
+            mask (np.ndarray): Маска заездов, в которых нажата клавиша переключения.
+        """
+        mask = mask & (self.frames_after_shift <= 0) & (self.current_gear < self.count_gear) & ~self.is_finished
+        if not mask.any():
+            return
+
+        is_boost = self.is_boost()
+        new_gear = self.current_gear + 1
+        is_good = self.is_good_shift(new_gear)
+
+        self.acceleration_progress = np.where(mask, self.throttle * 0.6, self.acceleration_progress)
+        self.current_gear = np.where(mask, new_gear, self.current_gear)
+
+        boost = mask & is_boost & is_good
+        bad = mask & ~is_good
+        self.boost_frames_remaining[boost] = self.boost_frames_total
+        self.frames_after_shift[mask] = self.frames_after_shift_total[mask]
+        self.frames_bad_shift_penalty[bad] = self.penalty_frames_total
+
+        self.count_good_shift += mask & is_good
+        self.count_boost_shift += boost
+        self.count_lose_shift += bad
+
+    def step(self):
+        """
+        Выполняет один шаг физики для всех незавершенных заездов.
+
+        Повторяет Engine.update_throttle, Engine.get_current_speed, Car.update
+        и обновление таймеров и дистанции из Race.step.
+        """
+        active = ~self.is_finished
+        gear = self.current_gear
+        rows = self._index
+
+        total_time = self.time_max_throttle[rows, gear]
+        has_time = total_time != 0
+        progress = np.minimum(self.acceleration_progress + self.dt / np.where(has_time, total_time, 1.0), 1.0)
+        progress = np.where(has_time, progress, 0.0)
+        throttle = progress
+        revolutions = self.min_revolutions + throttle * self.range_revolutions
+
+        speed_kmh = np.ceil(revolutions * self.speed_factor[rows, gear])
+        base_speed = speed_kmh * Car.SPEED_TO_PIXELS
+
+        is_boost = self.boost_frames_remaining > 0
+        speed = np.where(is_boost, base_speed * 1.5, base_speed)
+        boost_frames = np.where(is_boost, self.boost_frames_remaining - 1, self.boost_frames_remaining)
+
+        is_penalty = self.frames_bad_shift_penalty > 0
+        speed = np.where(is_penalty, speed * 0.5, speed)
+        throttle = np.where(is_penalty, throttle * 0.5, throttle)
+        progress = np.where(is_penalty, progress * 0.5, progress)
+        boost_frames = np.where(is_penalty, 0, boost_frames)
+
+        self.revolutions = np.where(active, revolutions, self.revolutions)
+        self.throttle = np.where(active, throttle, self.throttle)
+        self.acceleration_progress = np.where(active, progress, self.acceleration_progress)
+        self.boost_frames_remaining = np.where(active, boost_frames, self.boost_frames_remaining)
+        self.speed = np.where(active, speed, self.speed)
+        self.speed_kmh = np.where(active, speed_kmh, self.speed_kmh)
+        self.speed_sum += np.where(active, speed_kmh, 0.0)
+
+        self.frames_after_shift -= active & (self.frames_after_shift > 0)
+        self.frames_bad_shift_penalty -= active & is_penalty
+
+        self.distance_traveled += np.where(active, speed * TrackDistance.DISTANCE_PER_SPEED, 0.0)
+        self.ticks += active
+        self.is_finished |= active & (self.distance_traveled >= self.distance_total)
+
+    def run(self, max_steps=20000):
+        """
+        Прогоняет все заезды пакета до финиша.
+
+        Первый шаг — старт на нейтральной передаче, далее перед каждым шагом
+        переключаются заезды, достигшие оборотов переключения.
+
+        Args:
+            max_steps (int): Ограничение количества шагов. По умолчанию 20000.
+
+        Returns:
+            dict: Массивы результатов с ключами 'is_finished', 'time_spend', 'speed_average',
+                  'speed_finish', 'count_good_shift', 'count_boost_shift', 'count_lose_shift'.
+        """
+        self.reset()
+        self.step()
+
+        for _ in range(max_steps):
+            if self.is_finished.all():
+                break
+            target = self.shift_revolutions[self._index, self.current_gear]
+            self.shift(self.revolutions >= target)
+            self.step()
+
+        return self.get_result()
+
+    def get_result(self):
+        """
+        Собирает результаты заездов пакета.
+
+        Returns:
+            dict: Массивы результатов (см. run).
+        """
+        return {
+            'is_finished': self.is_finished.copy(),
+            'time_spend': self.ticks * self.dt,
+            'speed_average': self.speed_sum / (self.ticks + 1),
+            'speed_finish': self.speed_kmh.copy(),
+            'count_good_shift': self.count_good_shift.copy(),
+            'count_boost_shift': self.count_boost_shift.copy(),
+            'count_lose_shift': self.count_lose_shift.copy()
+        }
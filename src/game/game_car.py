@@ -7,10 +7,12 @@
 
 import pygame
 import math
-import datetime
-import json
+import os
 
+from src.utils.utils_assets import AssetCache
+from src.utils.utils_atlas import SpriteAtlas
 from src.utils.utils_paths import Utils
+from src.game.game_clock import PHYSICS_STEP
 
 
 class Car(pygame.sprite.Sprite):
@@ -25,24 +27,49 @@ class Car(pygame.sprite.Sprite):
         current_gear (int): Текущая передача автомобиля.
         engine (Engine): Экземпляр двигателя автомобиля.
         speed (float): Текущая скорость автомобиля.
-        boost_frames_remaining (int): Количество кадров, оставшихся для буста.
+        boost_frames_remaining (int): Количество шагов физики, оставшихся для буста.
+        is_headless (bool): Флаг работы без дисплея (изображение не загружается).
+        count_frames (int): Количество кадров анимации (1, если анимации нет).
     """
 
-    def __init__(self, name):
+    SPEED_TO_PIXELS = 0.2778 * 2
+    BOOST_TIME = 1.0
+
+    def __init__(self, name, is_headless=False, data=None):
         """
         Инициализирует автомобиль с заданным именем.
 
         Args:
             name (str): Идентификатор автомобиля для загрузки конфигурации.
+            is_headless (bool, optional): Если True, изображение не загружается и
+                                          автомобиль можно использовать без окна
+                                          Pygame (например, в симуляции). По умолчанию False.
+            data (dict, optional): Готовые характеристики в формате car_{name}.json.
+                                   Если заданы, файл не читается. По умолчанию None.
 
         Raises:
             ValueError: Если не удается загрузить характеристики или изображение.
         """
         super().__init__()
         self.name = name
-        self.current_gear = 0
-        self._load_assets()
+        self.is_headless = is_headless
+        self._load_assets(data)
+
+        self.reset()
+        self.max_speed = self.get_max_speed()
+        self.count_frames = 1
+        if not self.is_headless:
+            self._preload_frames()
+            self._load_image(0)
+
+    def reset(self):
+        """
+        Возвращает автомобиль в состояние перед стартом.
 
+        Создает новый двигатель по характеристикам автомобиля
+        и сбрасывает передачу, скорость и буст.
+        """
+        self.current_gear = 0
         self.engine = Engine(
             self.get_gap_to_boost(),
             self.dict_gear_ratio_pair,
@@ -51,74 +78,135 @@ class Car(pygame.sprite.Sprite):
             self.min_revolutions,
             self.max_revolutions
         )
-        self.max_speed = self.get_max_speed()
-        self._load_image(0)
         self.speed = 0
 
         self.boost_frames_remaining = 0
 
-    def _load_assets(self):
+    def _load_assets(self, data=None):
         """
         Загружает характеристики автомобиля из JSON-файла.
 
-        Читает конфигурационный файл car_{name}.json и инициализирует
-        все атрибуты автомобиля из этого файла.
+        Читает конфигурационный файл car_{name}.json (если характеристики
+        не переданы явно) и инициализирует все атрибуты автомобиля.
+
+        Args:
+            data (dict, optional): Готовые характеристики автомобиля.
 
         Raises:
             ValueError: Если не удается загрузить или распарсить JSON-файл.
         """
         try:
-            with open(Utils().get_asset_path('cars', f'car_{self.name}.json'), 'r', encoding='utf-8') as asset_car:
-                data = json.load(asset_car)
-                self.first_image = data['image']
-                self.title = data['name']
-                self.car_class = data['class']
-                self.animation = data["animation"]
-                self.score_to_unlocking = data['score_to_unlocking']
-                self.horse_power = data['horse_power']
-                self.scale = data['scale']
-                self.coordinate_x = data['coordinate_x']
-                self.coordinate_y = data['coordinate_y']
-                self.dict_gear_ratio_pair = data['dict_gear_ratio_pair']
-                self.time_max_throttle = data['time_max_throttle']
-                self.frames_after_shift = data['frames_after_shift']
-                self.wheel_circle = data['wheel_circle']
-                self.min_revolutions = data['min_revolutions']
-                self.max_revolutions = data['max_revolutions']
+            if data is None:
+                data = AssetCache().get_json(Utils().get_asset_path('cars', f'car_{self.name}.json'))
+            self.first_image = data['image']
+            self.title = data['name']
+            self.car_class = data['class']
+            self.animation = data["animation"]
+            self.score_to_unlocking = data['score_to_unlocking']
+            self.horse_power = data['horse_power']
+            self.scale = data['scale']
+            self.coordinate_x = data['coordinate_x']
+            self.coordinate_y = data['coordinate_y']
+            self.dict_gear_ratio_pair = data['dict_gear_ratio_pair']
+            self.time_max_throttle = data['time_max_throttle']
+            self.frames_after_shift = data['frames_after_shift']
+            self.wheel_circle = data['wheel_circle']
+            self.min_revolutions = data['min_revolutions']
+            self.max_revolutions = data['max_revolutions']
         except Exception as e:
             print(f"Ошибка загрузки машины '{self.name}': {type(e).__name__}: {e}")
             raise ValueError(f"Характеристики машины '{self.name}' не были загружены. "
                              f"Ошибка: {e}")
 
-    def _load_image(self, state):
+    def _preload_frames(self):
+        """
+        Загружает все кадры анимации автомобиля.
+
+        Сначала кадры берутся из атласа SpriteAtlas (одна страница вместо
+        файла на кадр). Если атлас не собран или устарел, кадры
+        car_{name}_state{N}.png перебираются по порядку до первого
+        отсутствующего файла. Для автомобиля без анимации загружается
+        только нулевой кадр. Кадры берутся из AssetCache по ключу
+        (путь кадра, масштаб), поэтому каждый файл читается, конвертируется
+        и масштабируется один раз, а автомобиль держит ссылки на свои кадры.
+
+        Raises:
+            ValueError: Если не удается загрузить файл изображения.
+        """
+        frames = SpriteAtlas().get_frames(self.name, self.scale, self.animation)
+        if frames:
+            self._frames = frames
+            self.count_frames = len(self._frames)
+            return
+
+        self._frames = [self._get_frame(0)]
+        while self.animation and os.path.isfile(self._get_frame_path(len(self._frames))):
+            self._frames.append(self._get_frame(len(self._frames)))
+        self.count_frames = len(self._frames)
+
+    def _get_frame_path(self, state):
         """
-        Загружает и масштабирует изображение автомобиля.
+        Возвращает путь к файлу кадра анимации.
 
-        Создает pygame Surface из файла изображения, применяет масштабирование
-        и устанавливает начальную позицию спрайта.
+        Args:
+            state (int): Номер кадра.
+
+        Returns:
+            str: Абсолютный путь к car_{name}_state{state}.png.
+        """
+        return Utils().get_resource_path('images', 'cars', f'car_{self.name}', f'car_{self.name}_state{state}.png')
+
+    def _get_frame(self, state):
+        """
+        Возвращает масштабированный кадр автомобиля из кэша ресурсов.
+
+        Args:
+            state (int): Номер кадра.
+
+        Returns:
+            pygame.Surface: Кадр автомобиля.
 
         Raises:
             ValueError: Если не удается загрузить файл изображения.
         """
         try:
-            self.original_image = pygame.image.load(
-                Utils().get_resource_path('images', 'cars',f'car_{self.name}', f'car_{self.name}_state{state}.png')
-            ).convert_alpha()
-            if self.scale != 1.0:
-                new_size = (
-                    int(self.original_image.get_width() * self.scale),
-                    int(self.original_image.get_height() * self.scale)
-                )
-                self.original_image = pygame.transform.scale(self.original_image, new_size)
-            self.image = self.original_image
-            self.rect = self.image.get_rect()
-            self.rect.x = self.coordinate_x
-            self.rect.y = self.coordinate_y
+            return AssetCache().get_image(self._get_frame_path(state), scale=self.scale)
         except Exception as e:
             print(f"Ошибка загрузки изображения машины '{self.first_image}': {type(e).__name__}: {e}")
             raise ValueError(f"Изображение машины '{self.first_image}' не было загружено. "
                              f"Ошибка: {e}")
 
+    def _load_image(self, state):
+        """
+        Устанавливает изображение автомобиля и его начальную позицию.
+
+        Args:
+            state (int): Номер кадра.
+        """
+        self.original_image = self._frames[state]
+        self.image = self.original_image
+        self.rect = self.image.get_rect()
+        self.rect.x = self.coordinate_x
+        self.rect.y = self.coordinate_y
+
+    def get_frames(self):
+        """
+        Возвращает кадры анимации автомобиля.
+
+        Returns:
+            list: Поверхности кадров по номеру кадра.
+        """
+        return self._frames
+
+    def set_frame(self, state):
+        """
+        Переключает кадр анимации без обращения к диску.
+
+        Args:
+            state (int): Номер кадра (0 <= state < count_frames).
+        """
+        self.original_image = self.image = self._frames[state]
+
     def get_gap_to_boost(self):
         """
         Возвращает диапазон оборотов для активации буста в зависимости от класса автомобиля.
@@ -147,18 +235,20 @@ class Car(pygame.sprite.Sprite):
         )
         return max_speed
 
-    def update(self, is_good_shift):
+    def update(self, is_good_shift, dt=PHYSICS_STEP):
         """
-        Обновляет состояние автомобиля на каждом кадре.
+        Обновляет состояние автомобиля на одном шаге физики.
 
         Обновляет обороты двигателя, вычисляет текущую скорость с учетом буста
         и применяет штрафы за плохое переключение передачи.
 
         Args:
             is_good_shift (bool): True, если последнее переключение было хорошим.
+            dt (float): Длительность шага симуляции в секундах.
         """
-        self.engine.update_throttle()
-        base_speed = self.engine.get_current_speed() * 0.2778 * 2
+        engine = self.engine
+        engine.update_throttle(dt)
+        base_speed = engine.speed_kmh * self.SPEED_TO_PIXELS
 
         if self.boost_frames_remaining > 0:
             self.speed = base_speed * 1.5
@@ -168,8 +258,8 @@ class Car(pygame.sprite.Sprite):
 
         if not is_good_shift:
             self.speed *= 0.5
-            self.engine.throttle *= 0.5
-            self.engine.acceleration_progress *= 0.5
+            engine.throttle *= 0.5
+            engine.acceleration_progress *= 0.5
             self.boost_frames_remaining = 0
 
     def start_engine(self):
@@ -180,15 +270,16 @@ class Car(pygame.sprite.Sprite):
         """
         self.engine.start_acceleration()
 
-    def shift_gear(self, new_gear):
+    def shift_gear(self, new_gear, dt=PHYSICS_STEP):
         """
         Переключает передачу и определяет качество переключения.
 
         Проверяет, было ли переключение выполнено в зоне буста, и активирует
-        буст на 60 кадров при успешном переключении.
+        буст на BOOST_TIME секунд времени симуляции при успешном переключении.
 
         Args:
             new_gear (int): Номер новой передачи.
+            dt (float): Длительность шага симуляции в секундах.
 
         Returns:
             bool: True, если переключение было выполнено корректно.
@@ -201,7 +292,7 @@ class Car(pygame.sprite.Sprite):
         is_good = self.engine.is_good_shift(new_gear)
 
         if is_boost_shift and is_good:
-            self.boost_frames_remaining = 60
+            self.boost_frames_remaining = round(self.BOOST_TIME / dt)
 
         return is_good
 
@@ -227,13 +318,29 @@ class Engine:
     Моделирует работу двигателя: обороты, дроссель, переключение передач,
     расчет скорости и определение зон для буста и корректных переключений.
 
+    Характеристики автомобиля при создании компилируются в таблицы,
+    индексируемые номером передачи, а скорость пересчитывается один раз
+    за шаг физики, поэтому горячий путь не форматирует строки и не делит.
+
     Attributes:
         current_gear (int): Текущая передача.
         revolutions (float): Текущие обороты двигателя (об/мин).
         throttle (float): Уровень открытия дросселя (0.0-1.0).
         acceleration_progress (float): Прогресс ускорения (0.0-1.0).
+        is_accelerating (bool): Флаг набора оборотов после старта.
+        speed_kmh (int): Скорость в км/ч, вычисленная на последнем шаге.
     """
 
+    __slots__ = (
+        'current_gear', 'count_gear', 'revolutions', 'throttle', 'acceleration_progress',
+        'is_accelerating', 'speed_kmh',
+        'min_revolutions', 'max_revolutions', 'min_revolutions_to_good_shift',
+        'max_revolutions_to_good_shift', 'min_revolutions_to_boost', 'max_revolutions_to_boost',
+        'gear_ratio_main_pair', 'gear_ratio_current_pair',
+        '_gear_ratios', '_times_max_throttle', '_speed_factors', '_range_revolutions',
+        '_speed_factor_current', '_time_max_throttle_current'
+    )
+
     def __init__(self, gap_to_boost, dict_gear_ratio_pair, time_max_throttle,
                  wheel_circle, min_revolutions, max_revolutions):
         """
@@ -247,11 +354,6 @@ class Engine:
             min_revolutions (int): Минимальные обороты двигателя.
             max_revolutions (int): Максимальные обороты двигателя.
         """
-        self.current_gear = 0
-        self._dict_gear_ratio_pair = dict_gear_ratio_pair
-        self._time_max_throttle = time_max_throttle
-        self._wheel_circle = wheel_circle
-
         self.min_revolutions = min_revolutions
         self.min_revolutions_to_good_shift = self.min_revolutions * 2
 
@@ -261,81 +363,122 @@ class Engine:
         self.max_revolutions_to_boost = self.max_revolutions_to_good_shift - gap_to_boost
         self.min_revolutions_to_boost = self.max_revolutions_to_boost - gap_to_boost
 
+        self.count_gear = len(dict_gear_ratio_pair) - 2
+        self.gear_ratio_main_pair = dict_gear_ratio_pair["main"]
+        self._compile_tables(dict_gear_ratio_pair, time_max_throttle, wheel_circle)
+
+        self.current_gear = 0
         self.revolutions = self.min_revolutions
         self.throttle = 0.0
-        self.start_time = None
+        self.is_accelerating = False
         self.acceleration_progress = 0.0
-        self.count_gear = len(self._dict_gear_ratio_pair) - 2
+        self._set_gear(self.current_gear)
+        self.speed_kmh = self._calculate_speed()
+
+    def _compile_tables(self, dict_gear_ratio_pair, time_max_throttle, wheel_circle):
+        """
+        Строит таблицы характеристик, индексируемые номером передачи.
 
-        self.gear_ratio_main_pair = self._dict_gear_ratio_pair["main"]
-        self.gear_ratio_current_pair = self._dict_gear_ratio_pair[str(self.current_gear)]
+        Для каждой передачи сохраняются передаточное число, время разгона
+        и коэффициент перевода оборотов в скорость (0 для нейтрали).
+
+        Args:
+            dict_gear_ratio_pair (dict): Словарь передаточных чисел.
+            time_max_throttle (dict): Словарь времени разгона на каждой передаче.
+            wheel_circle (float): Длина окружности колеса в метрах.
+        """
+        gears = range(self.count_gear + 1)
+        self._gear_ratios = tuple(dict_gear_ratio_pair[str(gear)] for gear in gears)
+        self._times_max_throttle = tuple(time_max_throttle[str(gear)] for gear in gears)
+        self._speed_factors = tuple(
+            0.0 if gear == 0 or ratio == 0
+            else (wheel_circle * 60) / (self.gear_ratio_main_pair * ratio * 1000)
+            for gear, ratio in zip(gears, self._gear_ratios)
+        )
+        self._range_revolutions = self.max_revolutions - self.min_revolutions
+
+    def _set_gear(self, gear):
+        """
+        Выбирает значения таблиц для передачи gear.
+
+        Args:
+            gear (int): Номер передачи.
+        """
+        self.gear_ratio_current_pair = self._gear_ratios[gear]
+        self._speed_factor_current = self._speed_factors[gear]
+        self._time_max_throttle_current = self._times_max_throttle[gear]
+
+    def _calculate_speed(self):
+        """
+        Вычисляет скорость по текущим оборотам и передаче.
+
+        Returns:
+            int: Скорость в км/ч, округленная вверх.
+        """
+        if self._speed_factor_current == 0.0:
+            return 0
+        return math.ceil(self.revolutions * self._speed_factor_current)
 
     def start_acceleration(self):
         """
         Начинает процесс ускорения двигателя.
 
-        Устанавливает начальное время для расчета прогресса ускорения.
+        После вызова каждый шаг симуляции увеличивает прогресс ускорения.
         """
-        self.start_time = datetime.datetime.now()
+        self.is_accelerating = True
 
-    def update_throttle(self):
+    def update_throttle(self, dt=PHYSICS_STEP):
         """
-        Обновляет уровень дросселя и обороты двигателя.
+        Обновляет уровень дросселя, обороты двигателя и скорость.
 
-        Вычисляет прогресс ускорения на основе прошедшего времени
-        и обновляет текущие обороты двигателя.
+        Вычисляет прогресс ускорения на основе длительности шага симуляции,
+        обновляет текущие обороты двигателя и один раз пересчитывает скорость.
+
+        Args:
+            dt (float): Длительность шага симуляции в секундах.
         """
-        if self.start_time is not None:
-            current_time = datetime.datetime.now()
-            elapsed = (current_time - self.start_time).total_seconds()
-            total_time = self._time_max_throttle[str(self.current_gear)]
+        if self.is_accelerating:
+            total_time = self._time_max_throttle_current
 
             if total_time == 0:
                 self.throttle = 0
                 self.acceleration_progress = 0
             else:
-                new_progress = min(self.acceleration_progress + (elapsed / total_time), 1.0)
+                new_progress = self.acceleration_progress + dt / total_time
+                if new_progress > 1.0:
+                    new_progress = 1.0
                 self.acceleration_progress = new_progress
                 self.throttle = new_progress
 
-            self.revolutions = self.min_revolutions + (
-                    self.throttle * (self.max_revolutions - self.min_revolutions)
-            )
-
-            self.start_time = current_time
+            self.revolutions = self.min_revolutions + self.throttle * self._range_revolutions
+            self.speed_kmh = self._calculate_speed()
 
     def shift_gear(self, new_gear):
         """
         Переключает передачу и сбрасывает прогресс ускорения.
 
-        При переключении сохраняется 60% текущего прогресса ускорения,
-        обновляется передаточное число и перезапускается таймер.
+        При переключении сохраняется 60% текущего прогресса ускорения
+        и обновляется передаточное число.
 
         Args:
             new_gear (int): Номер новой передачи.
         """
         self.acceleration_progress = self.throttle * 0.6
-        self.current_gear = new_gear  # ИСПРАВЛЕНИЕ: переименовано с current_broadcast
-        self.gear_ratio_current_pair = self._dict_gear_ratio_pair[str(new_gear)]
-        self.start_time = datetime.datetime.now()
+        self.current_gear = new_gear
+        self._set_gear(new_gear)
+        self.speed_kmh = self._calculate_speed()
 
     def get_current_speed(self):
         """
-        Вычисляет текущую скорость автомобиля в км/ч.
+        Возвращает текущую скорость автомобиля в км/ч.
 
-        Использует текущие обороты, передаточные числа и длину окружности колеса
-        для расчета скорости.
+        Скорость вычисляется один раз на шаге физики (в update_throttle
+        и shift_gear), поэтому вызов не требует вычислений.
 
         Returns:
             int: Текущая скорость в км/ч, округленная вверх.
         """
-        if self.gear_ratio_current_pair == 0 or self.current_gear == 0:
-            return 0
-        else:
-            return math.ceil(
-                (self.revolutions * self._wheel_circle * 60)
-                / (self.gear_ratio_main_pair * self.gear_ratio_current_pair * 1000)
-            )
+        return self.speed_kmh
 
     def calculate_rpm_after_shift(self, new_gear):
         """
@@ -353,9 +496,8 @@ class Engine:
         if self.current_gear == 0 or new_gear == 0:
             return self.min_revolutions
 
-        current_ratio = self._dict_gear_ratio_pair[
-            str(self.current_gear)]
-        new_ratio = self._dict_gear_ratio_pair[str(new_gear)]
+        current_ratio = self._gear_ratios[self.current_gear]
+        new_ratio = self._gear_ratios[new_gear]
 
         rpm_after = self.revolutions * (new_ratio / current_ratio)
         rpm_after = max(self.min_revolutions, rpm_after)
@@ -0,0 +1,123 @@
+"""
+Модуль часов симуляции.
+
+Содержит класс SimulationClock — часы с фиксированным шагом физики,
+которые не зависят от системного времени и от частоты кадров отрисовки.
+"""
+
+PHYSICS_STEPS_PER_SECOND = 60
+PHYSICS_STEP = 1 / PHYSICS_STEPS_PER_SECOND
+
+
+class SimulationClock:
+    """
+    Класс часов симуляции с фиксированным шагом.
+
+    Накапливает реальное время кадров в аккумуляторе и выдает его
+    целыми шагами физики одинаковой длительности. Благодаря этому
+    результат гонки не зависит от рывков отрисовки и мощности машины.
+
+    Attributes:
+        step (float): Длительность одного шага физики в секундах.
+        max_steps_per_frame (int): Максимум шагов физики за один кадр.
+        ticks (int): Количество выполненных шагов физики.
+        accumulator (float): Накопленное, но еще не просимулированное время в секундах.
+    """
+
+    def __init__(self, steps_per_second=PHYSICS_STEPS_PER_SECOND, max_steps_per_frame=5):
+        """
+        Инициализирует часы симуляции.
+
+        Args:
+            steps_per_second (int): Количество шагов физики в секунду. По умолчанию 60.
+            max_steps_per_frame (int): Максимум шагов физики за кадр. Лишнее время
+                                       отбрасывается, чтобы медленный кадр не вызывал
+                                       лавинообразного отставания. По умолчанию 5.
+        """
+        self.step = 1 / steps_per_second
+        self.max_steps_per_frame = max_steps_per_frame
+        self.ticks = 0
+        self.accumulator = 0.0
+
+    @property
+    def time(self):
+        """
+        Возвращает время симуляции.
+
+        Returns:
+            float: Время в секундах, прошедшее с начала симуляции.
+        """
+        return self.ticks * self.step
+
+    @property
+    def alpha(self):
+        """
+        Возвращает долю шага для интерполяции при отрисовке.
+
+        Returns:
+            float: Значение от 0.0 до 1.0 — насколько текущий кадр
+                   опережает последнее состояние физики.
+        """
+        return min(self.accumulator / self.step, 1.0)
+
+    def advance(self, frame_time):
+        """
+        Добавляет реальное время кадра в аккумулятор.
+
+        Args:
+            frame_time (float): Длительность прошедшего кадра в секундах.
+
+        Returns:
+            int: Количество шагов физики, которые нужно выполнить в этом кадре.
+        """
+        self.accumulator += max(frame_time, 0.0)
+        steps = int(self.accumulator / self.step)
+
+        if steps > self.max_steps_per_frame:
+            steps = self.max_steps_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+
+        return steps
+
+    def tick(self):
+        """
+        Отмечает выполнение одного шага физики.
+
+        Returns:
+            float: Длительность шага в секундах.
+        """
+        self.ticks += 1
+        return self.step
+
+    def get_steps(self, seconds):
+        """
+        Переводит длительность в секундах в количество шагов физики.
+
+        Args:
+            seconds (float): Длительность в секундах времени симуляции.
+
+        Returns:
+            int: Ближайшее целое количество шагов.
+        """
+        return round(seconds / self.step)
+
+    def get_elapsed(self, ticks_from):
+        """
+        Возвращает время симуляции, прошедшее с указанного шага.
+
+        Args:
+            ticks_from (int): Номер шага, от которого ведется отсчет.
+
+        Returns:
+            float: Прошедшее время в секундах.
+        """
+        return (self.ticks - ticks_from) * self.step
+
+    def reset(self):
+        """
+        Сбрасывает часы в начальное состояние.
+        """
+        self.ticks = 0
+        self.accumulator = 0.0
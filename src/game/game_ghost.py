@@ -0,0 +1,212 @@
+"""
+Модуль автомобиля-призрака.
+
+Содержит класс GhostTrack — заранее рассчитанную траекторию лучшего заезда
+пользователя, и спрайт GhostCar, который рисует полупрозрачный автомобиль
+по этой траектории рядом с автомобилем игрока.
+"""
+
+import os
+from array import array
+
+import pygame
+
+from src.game.game_replay import Replay, ReplayPlayer
+
+
+class GhostTrack:
+    """
+    Класс траектории призрака.
+
+    Хранит смещение прокрутки фона после каждого шага физики записанного
+    заезда, начиная со старта. Смещение считается так же, как в
+    WindowBackgroundSegments, поэтому разница со смещением игрока — это
+    расстояние между автомобилями на экране, а поиск позиции занимает O(1).
+    После финиша призрак продолжает движение со скоростью последнего шага.
+
+    Attributes:
+        replay (Replay): Запись заезда, по которой построена траектория.
+        offsets (array): Смещение прокрутки после каждого шага от старта (индекс 0 — до старта).
+    """
+
+    _best_tracks = {}
+
+    def __init__(self, replay, offsets):
+        """
+        Инициализирует траекторию.
+
+        Args:
+            replay (Replay): Запись заезда.
+            offsets (array): Смещения прокрутки по шагам физики от старта.
+        """
+        self.replay = replay
+        self.offsets = offsets
+
+    @classmethod
+    def from_replay(cls, replay, player=None):
+        """
+        Строит траекторию воспроизведением записи.
+
+        Args:
+            replay (Replay): Запись заезда.
+            player (ReplayPlayer, optional): Проигрыватель. По умолчанию создается новый.
+
+        Returns:
+            tuple: Траектория GhostTrack и результат воспроизведения ReplayPlayer.play.
+        """
+        offsets = array('d', [0.0])
+
+        def record(race):
+            offsets.append(offsets[-1] + race.car.speed)
+
+        result = (player or ReplayPlayer()).play(replay, record)
+        return cls(replay, offsets), result
+
+    @classmethod
+    def load_best(cls, user_name, car_name, track_name):
+        """
+        Загружает траекторию лучшего заезда пользователя на автомобиле и треке.
+
+        Записи перебираются по возрастанию записанного времени; берется первая,
+        которая воспроизводится без фальстарта и с записанным временем.
+        Результат запоминается для пользователя, автомобиля и трека вместе со
+        списком файлов записей: пока новых записей нет, повторный вызов
+        не воспроизводит записи заново.
+
+        Args:
+            user_name (str): Идентификатор пользователя.
+            car_name (str): Идентификатор автомобиля.
+            track_name (str): Название трека.
+
+        Returns:
+            GhostTrack or None: Траектория или None, если подходящих записей нет.
+        """
+        replay_dir = Replay.get_replay_dir(user_name)
+        if not os.path.isdir(replay_dir):
+            return None
+
+        file_names = tuple(sorted(file_name for file_name in os.listdir(replay_dir)
+                                  if file_name.startswith(f'replay_{car_name}_') and file_name.endswith('.bin')))
+        key = (user_name, car_name, track_name)
+        cached = cls._best_tracks.get(key)
+        if cached is not None and cached[0] == file_names:
+            return cached[1]
+
+        ghost_track = cls._find_best(replay_dir, file_names, car_name, track_name)
+        cls._best_tracks[key] = (file_names, ghost_track)
+        return ghost_track
+
+    @classmethod
+    def _find_best(cls, replay_dir, file_names, car_name, track_name):
+        """
+        Воспроизводит записи и возвращает траекторию лучшей подходящей.
+
+        Args:
+            replay_dir (str): Директория записей пользователя.
+            file_names (tuple): Имена файлов записей автомобиля.
+            car_name (str): Идентификатор автомобиля.
+            track_name (str): Название трека.
+
+        Returns:
+            GhostTrack or None: Траектория или None, если подходящих записей нет.
+        """
+        replays = []
+        for file_name in file_names:
+            try:
+                replay = Replay.load(os.path.join(replay_dir, file_name))
+            except (IOError, ValueError):
+                continue
+            if replay.car_name == car_name and replay.track_name == track_name and replay.ticks_finish > 0:
+                replays.append(replay)
+
+        player = ReplayPlayer()
+        for replay in sorted(replays, key=lambda item: item.ticks_finish):
+            ghost_track, result = cls.from_replay(replay, player)
+            if result['is_consistent'] and not result['is_false_start']:
+                return ghost_track
+        return None
+
+    def get_offset(self, ticks, alpha=1.0):
+        """
+        Возвращает смещение прокрутки призрака.
+
+        Args:
+            ticks (int): Количество шагов физики от старта (включая шаг старта).
+            alpha (float): Доля шага физики для интерполяции между ticks - 1 и ticks.
+
+        Returns:
+            float: Смещение прокрутки в пикселях.
+        """
+        last = len(self.offsets) - 1
+        if ticks <= 0:
+            return 0.0
+        if ticks > last:
+            speed = self.offsets[last] - self.offsets[last - 1] if last > 0 else 0.0
+            return self.offsets[last] + (ticks - 1 + alpha - last) * speed
+        previous = self.offsets[ticks - 1]
+        return previous + (self.offsets[ticks] - previous) * alpha
+
+
+class GhostCar(pygame.sprite.Sprite):
+    """
+    Класс спрайта автомобиля-призрака.
+
+    Кадры анимации берутся у автомобиля игрока и один раз делаются
+    полупрозрачными. Кадр призрака выбирается по его собственному
+    пройденному пути (смена кадра каждые ANIM_DISTANCE пикселей
+    прокрутки), а не по кадру автомобиля игрока.
+
+    Attributes:
+        ghost_track (GhostTrack): Траектория призрака.
+        image (pygame.Surface): Полупрозрачное изображение текущего кадра.
+        rect (pygame.Rect): Положение спрайта на экране.
+    """
+
+    ALPHA = 110
+    ANIM_DISTANCE = 40
+
+    def __init__(self, car, ghost_track):
+        """
+        Инициализирует спрайт призрака.
+
+        Args:
+            car (Car): Автомобиль игрока (используются его кадры и начальное положение).
+            ghost_track (GhostTrack): Траектория призрака.
+        """
+        super().__init__()
+        self.ghost_track = ghost_track
+        self._frames = []
+        for frame in car.get_frames():
+            frame = frame.copy()
+            frame.set_alpha(self.ALPHA)
+            self._frames.append(frame)
+        self._state = 0
+        self.image = self._frames[0]
+        self.rect = self.image.get_rect(topleft=(car.coordinate_x, car.coordinate_y))
+        self._x_base = car.coordinate_x
+
+    def set_frame(self, state):
+        """
+        Переключает кадр анимации призрака.
+
+        Args:
+            state (int): Номер кадра (0 <= state < количества кадров автомобиля).
+        """
+        self._state = state
+        self.image = self._frames[state]
+
+    def set_position(self, ticks, player_offset, alpha=1.0):
+        """
+        Сдвигает призрака относительно автомобиля игрока.
+
+        Args:
+            ticks (int): Количество шагов физики от старта игрока.
+            player_offset (float): Смещение прокрутки фона игрока на кадре.
+            alpha (float): Доля шага физики для интерполяции.
+        """
+        offset = self.ghost_track.get_offset(ticks, alpha)
+        self.rect.x = self._x_base + round(offset - player_offset)
+
+        state = int(offset // self.ANIM_DISTANCE) % len(self._frames)
+        if state != self._state:
+            self.set_frame(state)
@@ -0,0 +1,346 @@
+"""
+Модуль аналитического прогноза заезда.
+
+Содержит класс RacePredictor, который по расписанию переключений передач
+вычисляет время заезда, скорость на финише и события буста и штрафа
+без пошаговой симуляции: внутри передачи дроссель и обороты растут линейно
+по времени, а скорость линейна по оборотам, поэтому пройденное расстояние
+суммируется в замкнутом виде за O(количество передач).
+
+Сравнение прогноза с пошаговой симуляцией:
+    python -m src.game.game_predictor audi_rs6 0 1.5 3.5 6.5 9
+"""
+
+import math
+import sys
+
+from src.game.game_car import Car
+from src.game.game_clock import PHYSICS_STEP
+from src.game.game_race import Race, TrackDistance
+
+
+class RacePredictor:
+    """
+    Класс аналитического прогноза заезда.
+
+    Повторяет правила Engine, Car и Race (буст Car.BOOST_TIME, штраф Race.PENALTY_TIME,
+    блокировка после переключения, проверка качества переключения по оборотам
+    на момент нажатия), но складывает шаги каждого участка передачи
+    арифметической или геометрической прогрессией. Округление скорости вверх
+    учитывается средней поправкой CEIL_BIAS, поэтому время прогноза совпадает
+    с RaceSimulator с точностью до нескольких шагов физики и может служить
+    эталоном для проверки пошаговой симуляции.
+
+    Attributes:
+        car (Car): Автомобиль без изображения.
+        distance_total (float): Длина трека в метрах.
+        dt (float): Длительность шага физики в секундах.
+        max_steps (int): Ограничение количества шагов заезда.
+        boost_frames_total (int): Длительность буста Car.BOOST_TIME в шагах dt.
+        penalty_frames_total (int): Длительность штрафа Race.PENALTY_TIME в шагах dt.
+        frames_after_shift_total (int): Блокировка после переключения в шагах dt.
+    """
+
+    CEIL_BIAS = 0.5
+
+    def __init__(self, car, distance_total=4020, dt=PHYSICS_STEP, max_steps=20000):
+        """
+        Инициализирует прогноз.
+
+        Args:
+            car (Car or str): Автомобиль или его идентификатор для загрузки конфигурации.
+            distance_total (float): Длина трека в метрах. По умолчанию 4020.
+            dt (float): Длительность шага физики в секундах.
+            max_steps (int): Ограничение количества шагов заезда. По умолчанию 20000.
+        """
+        self.car = Car(car, is_headless=True) if isinstance(car, str) else car
+        self.distance_total = distance_total
+        self.dt = dt
+        self.max_steps = max_steps
+
+        self.boost_frames_total = round(Car.BOOST_TIME / dt)
+        self.penalty_frames_total = round(Race.PENALTY_TIME / dt)
+        self.frames_after_shift_total = round(self.car.frames_after_shift * PHYSICS_STEP / dt)
+
+        engine = self.car.engine
+        self._times_max_throttle = engine._times_max_throttle
+        self._speed_factors = engine._speed_factors
+        self._distance_per_kmh = Car.SPEED_TO_PIXELS * TrackDistance.DISTANCE_PER_SPEED
+        self._range_revolutions = engine.max_revolutions - engine.min_revolutions
+
+    def get_shift_steps(self, shift_times):
+        """
+        Переводит моменты переключений в номера шагов после старта.
+
+        Повторяет ShiftPolicySchedule: клавиша нажимается перед первым шагом,
+        на котором время заезда не меньше заданного, но не раньше окончания
+        блокировки после предыдущего переключения.
+
+        Args:
+            shift_times (list): Моменты переключений в секундах от старта.
+
+        Returns:
+            list: Номера шагов, перед которыми нажимается клавиша
+                  (не больше количества передач).
+        """
+        steps = []
+        step_min = 1
+        for shift_time in shift_times[:self.car.engine.count_gear]:
+            step = max(step_min, math.ceil((shift_time - 1e-9) / self.dt))
+            while step > step_min and (step - 1) * self.dt >= shift_time - 1e-9:
+                step -= 1
+            while step * self.dt < shift_time - 1e-9:
+                step += 1
+            steps.append(step)
+            step_min = step + self.frames_after_shift_total
+        return steps
+
+    def predict(self, shift_times):
+        """
+        Прогнозирует заезд с переключениями по расписанию.
+
+        Args:
+            shift_times (list): Моменты переключений в секундах от старта.
+                                Первое значение — включение первой передачи.
+
+        Returns:
+            dict: Прогноз с ключами 'is_finished', 'time_spend', 'speed_average',
+                  'speed_finish', 'count_good_shift', 'count_boost_shift',
+                  'count_lose_shift', 'steps' и 'events' — список переключений
+                  со временем, передачей, оборотами и типом ('boost', 'good', 'penalty').
+        """
+        engine = self.car.engine
+        shift_steps = self.get_shift_steps(shift_times) + [self.max_steps + 1]
+
+        self._gear = 0
+        self._progress = 0.0
+        self._boost = 0
+        self._penalty = 0
+        self._steps = 0
+        self._distance = 0.0
+        self._speed_sum = 0.0
+        self._speed_kmh = 0
+        self._is_finished = False
+
+        events = []
+        for index, shift_step in enumerate(shift_steps):
+            self._run_until(shift_step - 1)
+            if self._is_finished or index == len(shift_steps) - 1:
+                break
+
+            revolutions = engine.min_revolutions + self._get_throttle() * self._range_revolutions
+            new_gear = self._gear + 1
+            is_boost = engine.min_revolutions_to_boost <= revolutions <= engine.max_revolutions_to_boost
+            is_good = new_gear == 1 or (engine.min_revolutions_to_good_shift
+                                        <= max(engine.min_revolutions, revolutions)
+                                        <= engine.max_revolutions_to_good_shift)
+
+            self._progress = self._get_throttle() * 0.6
+            self._gear = new_gear
+            if not is_good:
+                self._penalty = self.penalty_frames_total
+                event_type = 'penalty'
+            elif is_boost:
+                self._boost = self.boost_frames_total
+                event_type = 'boost'
+            else:
+                event_type = 'good'
+
+            events.append({
+                'time': (self._steps + 1) * self.dt,
+                'gear': new_gear,
+                'revolutions': revolutions,
+                'type': event_type
+            })
+
+        return {
+            'is_finished': self._is_finished,
+            'time_spend': (self._steps + 1) * self.dt,
+            'speed_average': self._speed_sum / (self._steps + 2),
+            'speed_finish': self._speed_kmh,
+            'count_good_shift': sum(1 for event in events if event['type'] != 'penalty'),
+            'count_boost_shift': sum(1 for event in events if event['type'] == 'boost'),
+            'count_lose_shift': sum(1 for event in events if event['type'] == 'penalty'),
+            'steps': self._steps,
+            'events': events
+        }
+
+    def _get_throttle(self):
+        """
+        Возвращает уровень дросселя на текущей передаче.
+
+        Returns:
+            float: Прогресс ускорения (0, если время разгона передачи равно нулю).
+        """
+        return self._progress if self._times_max_throttle[self._gear] else 0.0
+
+    def _run_until(self, step_end):
+        """
+        Продвигает прогноз на текущей передаче до шага step_end включительно.
+
+        Делит оставшиеся шаги передачи на участки штрафа, буста, разгона
+        и максимальных оборотов и складывает каждый участок в замкнутом виде.
+
+        Args:
+            step_end (int): Номер последнего шага перед следующим переключением.
+        """
+        total_time = self._times_max_throttle[self._gear]
+        delta = self.dt / total_time if total_time else 0.0
+
+        while self._steps < step_end and not self._is_finished:
+            count = step_end - self._steps
+            if self._penalty > 0:
+                self._add_penalty(min(self._penalty, count), delta)
+                continue
+
+            if self._boost > 0:
+                count = min(count, self._boost)
+
+            steps_to_cap = math.ceil((1.0 - self._progress) / delta) - 1 if delta else 0
+            if steps_to_cap > 0:
+                self._add_linear(min(count, steps_to_cap), delta)
+            else:
+                self._add_linear(count, 0.0)
+
+    def _add_linear(self, count, delta):
+        """
+        Добавляет участок без штрафа, на котором прогресс растет линейно.
+
+        Args:
+            count (int): Количество шагов участка.
+            delta (float): Прирост прогресса за шаг. 0 — участок на постоянных
+                           оборотах (максимальных или минимальных, если время
+                           разгона передачи равно нулю).
+        """
+        engine = self.car.engine
+        factor = self._speed_factors[self._gear]
+        multiplier = 1.5 if self._boost > 0 else 1.0
+        progress_start = self._progress
+
+        if delta:
+            base = (engine.min_revolutions + progress_start * self._range_revolutions) * factor
+            slope = delta * self._range_revolutions * factor
+            bias = self.CEIL_BIAS if factor else 0.0
+
+            def get_progress(k):
+                return progress_start + k * delta
+
+            def get_speed_sum(k):
+                return k * (base + bias) + slope * k * (k + 1) / 2
+        else:
+            progress = 1.0 if self._times_max_throttle[self._gear] else 0.0
+            speed = self._get_speed(progress, factor)
+
+            def get_progress(k):
+                return progress
+
+            def get_speed_sum(k):
+                return k * speed
+
+        self._add_steps(count, get_speed_sum, multiplier, multiplier,
+                        lambda k: self._get_speed(get_progress(k), factor))
+        self._progress = get_progress(count)
+        if self._boost > 0:
+            self._boost -= count
+
+    def _add_penalty(self, count, delta):
+        """
+        Добавляет участок штрафа за плохое переключение.
+
+        На каждом шаге штрафа прогресс после прироста делится пополам,
+        поэтому он сходится к 2 * delta геометрической прогрессией со
+        знаменателем 1/2. Буст сбрасывается на первом шаге штрафа.
+
+        Args:
+            count (int): Количество шагов участка.
+            delta (float): Прирост прогресса за шаг.
+        """
+        engine = self.car.engine
+        factor = self._speed_factors[self._gear]
+        first_multiplier = 0.75 if self._boost > 0 else 0.5
+        first = min(self._progress + delta, 1.0) if delta else 0.0
+        limit = 2 * delta
+
+        def get_progress(k):
+            return limit + (first - limit) / 2 ** (k - 1)
+
+        bias = self.CEIL_BIAS if factor else 0.0
+
+        def get_speed_sum(k):
+            progress_sum = k * limit + (first - limit) * 2 * (1 - 0.5 ** k)
+            return (k * (engine.min_revolutions * factor + bias)
+                    + progress_sum * self._range_revolutions * factor)
+
+        self._add_steps(count, get_speed_sum, 0.5, first_multiplier,
+                        lambda k: self._get_speed(get_progress(k), factor))
+        self._progress = get_progress(count) / 2
+        self._boost = 0
+        self._penalty -= count
+
+    def _add_steps(self, count, get_speed_sum, multiplier, first_multiplier, get_speed):
+        """
+        Добавляет участок шагов и проверяет пересечение финиша.
+
+        Args:
+            count (int): Количество шагов участка.
+            get_speed_sum (callable): Сумма скоростей (км/ч) за первые k шагов участка.
+            multiplier (float): Множитель скорости прокрутки (буст или штраф).
+            first_multiplier (float): Множитель скорости прокрутки на первом шаге участка.
+            get_speed (callable): Скорость (км/ч) на k-м шаге участка.
+        """
+        def get_distance(k):
+            if k == 0:
+                return 0.0
+            speed_sum = get_speed_sum(k)
+            first_correction = (first_multiplier - multiplier) * get_speed_sum(1)
+            return (speed_sum * multiplier + first_correction) * self._distance_per_kmh
+
+        distance_left = self.distance_total - self._distance
+        if get_distance(count) >= distance_left:
+            low, high = 1, count
+            while low < high:
+                middle = (low + high) // 2
+                if get_distance(middle) >= distance_left:
+                    high = middle
+                else:
+                    low = middle + 1
+            count = low
+            self._is_finished = True
+
+        self._distance += get_distance(count)
+        self._speed_sum += get_speed_sum(count)
+        self._speed_kmh = get_speed(count)
+        self._steps += count
+
+    def _get_speed(self, progress, factor):
+        """
+        Вычисляет скорость на шаге так же, как Engine.
+
+        Args:
+            progress (float): Прогресс ускорения на шаге.
+            factor (float): Коэффициент перевода оборотов в скорость передачи.
+
+        Returns:
+            int: Скорость в км/ч, округленная вверх.
+        """
+        if factor == 0.0:
+            return 0
+        return math.ceil((self.car.engine.min_revolutions + progress * self._range_revolutions) * factor)
+
+
+if __name__ == "__main__":
+    from src.game.game_simulator import RaceSimulator, ShiftPolicySchedule
+
+    if len(sys.argv) < 3:
+        print("Использование: python -m src.game.game_predictor <машина> <время переключения> ...")
+        sys.exit(1)
+
+    times = [float(value) for value in sys.argv[2:]]
+    prediction = RacePredictor(sys.argv[1]).predict(times)
+    simulation = RaceSimulator(sys.argv[1]).run(ShiftPolicySchedule(times), seed=0)
+
+    for key in ('time_spend', 'speed_finish', 'speed_average', 'count_boost_shift', 'count_lose_shift'):
+        print(f"{key}: прогноз {prediction[key]:.3f}, симуляция {simulation[key]:.3f}")
+    for event in prediction['events']:
+        print(f"{event['time']:.3f} сек: передача {event['gear']}, "
+              f"{event['revolutions']:.0f} об/мин, {event['type']}")
@@ -0,0 +1,359 @@
+"""
+Модуль логики заезда.
+
+Содержит классы TrackDistance и Race, описывающие правила гонки
+(светофор, переключения, буст, штрафы и дистанцию) без привязки
+к окну и отрисовке Pygame.
+"""
+
+import random
+
+from src.game.game_clock import PHYSICS_STEP, SimulationClock
+from src.game.game_telemetry import Telemetry
+
+
+class TrackDistance:
+    """
+    Класс модели дистанции трека.
+
+    Переводит скорость автомобиля на каждом шаге физики в пройденное
+    расстояние и определяет момент пересечения финиша.
+
+    Attributes:
+        distance_traveled (float): Пройденное расстояние в метрах.
+        distance_total (float): Общая длина трека в метрах.
+    """
+
+    DISTANCE_PER_SPEED = 0.1
+
+    def __init__(self, distance_total=4020):
+        """
+        Инициализирует модель дистанции.
+
+        Args:
+            distance_total (float): Общая длина трека в метрах. По умолчанию 4020.
+        """
+        self.distance_traveled = 0
+        self.distance_total = distance_total
+        self._is_finished = False
+
+    def update(self, car_speed):
+        """
+        Добавляет расстояние, пройденное за один шаг физики.
+
+        Args:
+            car_speed (float): Текущая скорость автомобиля.
+
+        Returns:
+            bool: True, если гонка завершена; False в противном случае.
+        """
+        if self._is_finished:
+            return True
+
+        self.distance_traveled += car_speed * self.DISTANCE_PER_SPEED
+
+        if self.distance_traveled >= self.distance_total:
+            self._is_finished = True
+            return True
+
+        return False
+
+    def reset(self):
+        """
+        Возвращает трек в состояние перед стартом.
+        """
+        self.distance_traveled = 0
+        self._is_finished = False
+
+
+class Race:
+    """
+    Класс одного заезда.
+
+    Хранит состояние гонки и выполняет ее правила на каждом шаге физики:
+    отсчет светофора, фальстарт, переключения передач, буст, штраф за плохое
+    переключение и финиш. Не использует дисплей, поэтому одинаково работает
+    в окне RaceManager и в безголовой симуляции.
+
+    Attributes:
+        car (Car): Автомобиль участника.
+        track (TrackDistance): Модель дистанции трека.
+        simulation_clock (SimulationClock): Часы симуляции.
+        seed (int): Зерно генератора фаз светофора.
+        telemetry (Telemetry): Телеметрия заезда: обороты, передача, дроссель, скорость,
+                               дистанция и буст по шагам физики.
+        count_lose_shift (int): Количество неудачных переключений передач.
+        count_good_shift (int): Количество корректных переключений передач.
+        count_boost_shift (int): Количество переключений, активировавших буст.
+        frames_warning (int): Оставшиеся шаги показа предупреждения о плохом переключении.
+        frames_after_shift (int): Оставшиеся шаги блокировки переключения после переключения передачи.
+        frames_bad_shift_penalty (int): Оставшиеся шаги штрафа за плохое переключение.
+        frames_traffic (int): Оставшееся количество шагов работы светофора.
+        ticks_start_race (int): Шаг часов симуляции, на котором стартовала гонка.
+    """
+
+    START_BANNER_TIME = 1.0
+    WARNING_TIME = 1.0
+    PENALTY_TIME = 1.0
+    TRAFFIC_TIME_MIN = 5.0
+    TRAFFIC_TIME_MAX = 8.0
+    TRAFFIC_JITTER_TIME = 1 / 3
+
+    def __init__(self, car, track=None, seed=None, simulation_clock=None, telemetry=None):
+        """
+        Инициализирует заезд.
+
+        Длительности таймеров задаются в секундах времени симуляции
+        (константы *_TIME) и переводятся в шаги физики часов simulation_clock.
+        Блокировка после переключения frames_after_shift из конфигурации
+        автомобиля задана в шагах PHYSICS_STEP. Расстояние, скорость с бустом
+        и штраф накапливаются за шаг, поэтому частота шагов фиксирована
+        (PHYSICS_STEPS_PER_SECOND), а от частоты кадров результат не зависит.
+
+        Args:
+            car (Car): Автомобиль участника.
+            track (TrackDistance, optional): Трек с методом update(speed). По умолчанию
+                                             создается TrackDistance стандартной длины.
+            seed (int, optional): Зерно генератора фаз светофора. По умолчанию None
+                                  (случайные фазы).
+            simulation_clock (SimulationClock, optional): Часы симуляции с шагом PHYSICS_STEP.
+                                                          По умолчанию создаются часы на 60 шагов
+                                                          в секунду.
+            telemetry (Telemetry, optional): Буфер телеметрии. По умолчанию создается
+                                             буфер стандартного размера.
+
+        Raises:
+            ValueError: Если шаг часов симуляции отличается от PHYSICS_STEP.
+        """
+        if simulation_clock is not None and simulation_clock.step != PHYSICS_STEP:
+            print(f"Ошибка: физика заезда рассчитана на шаг {PHYSICS_STEP} с, у часов шаг {simulation_clock.step} с")
+            raise ValueError(f"Некорректный шаг часов симуляции: {simulation_clock.step}")
+
+        self.car = car
+        self.track = track if track is not None else TrackDistance()
+        self.simulation_clock = simulation_clock if simulation_clock is not None else SimulationClock()
+        self.seed = seed
+        self._random = random.Random(seed)
+
+        clock = self.simulation_clock
+        self._steps_start_banner = clock.get_steps(self.START_BANNER_TIME)
+        self._steps_warning = clock.get_steps(self.WARNING_TIME)
+        self._steps_penalty = clock.get_steps(self.PENALTY_TIME)
+        self._steps_after_shift = clock.get_steps(self.car.frames_after_shift * PHYSICS_STEP)
+
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        self.telemetry.reset()
+        self._record_telemetry()
+        self.count_lose_shift = 0
+        self.count_good_shift = 0
+        self.count_boost_shift = 0
+        self.ticks_start_race = None
+
+        self.frames_warning = 0
+        self.frames_after_shift = 0
+        self.frames_boost = 0
+        self.frames_start = 0
+        self.frames_bad_shift_penalty = 0
+
+        self.frames_traffic_total = self._random.randint(clock.get_steps(self.TRAFFIC_TIME_MIN),
+                                                        clock.get_steps(self.TRAFFIC_TIME_MAX))
+        self.frames_traffic = self.frames_traffic_total
+
+        self._generate_traffic_phases()
+
+        self.is_false_start = False
+        self.is_good_shift = True
+        self.is_boost = False
+
+        self.is_start = False
+        self.is_finished = False
+
+    def _generate_traffic_phases(self):
+        """
+        Генерирует случайные длительности для каждой фазы светофора.
+
+        Разделяет общее время светофора на 4 рандомные части для каждого ряда огней.
+        Гарантирует, что сумма всех фаз равна общему времени.
+        """
+        total = self.frames_traffic_total
+        jitter = self.simulation_clock.get_steps(self.TRAFFIC_JITTER_TIME)
+
+        split1 = self._random.randint(int(total * 0.1), int(total * 0.4))
+        split2 = self._random.randint(int(total * 0.1), int(total * 0.4))
+        split3 = self._random.randint(int(total * 0.1), int(total * 0.4))
+
+        split4 = total - split1 - split2 - split3
+
+        if split4 < int(total * 0.1):
+            quarter = total // 4
+            split1 = quarter + self._random.randint(-jitter, jitter)
+            split2 = quarter + self._random.randint(-jitter, jitter)
+            split3 = quarter + self._random.randint(-jitter, jitter)
+            split4 = total - split1 - split2 - split3
+
+        self.traffic_phase_4 = split4
+        self.traffic_phase_3 = split4 + split3
+        self.traffic_phase_2 = split4 + split3 + split2
+        self.traffic_phase_1 = total
+
+    def get_traffic_state(self):
+        """
+        Возвращает текущее состояние светофора.
+
+        Returns:
+            str or None: "red", "yellow_1", "yellow_2", "yellow_3", "green"
+                         или None, если светофор уже погас.
+        """
+        if self.frames_traffic <= 0:
+            return None
+        if self.is_false_start:
+            return "red"
+        if self.frames_traffic > self.traffic_phase_2:
+            return "yellow_1"
+        if self.frames_traffic > self.traffic_phase_3:
+            return "yellow_2"
+        if self.frames_traffic > self.traffic_phase_4:
+            return "yellow_3"
+        return "green"
+
+    def start_race(self):
+        """
+        Запускает гонку.
+
+        Инициирует ускорение двигателя автомобиля и фиксирует шаг старта
+        по часам симуляции.
+        """
+        self.car.start_engine()
+        self.ticks_start_race = self.simulation_clock.ticks
+
+    def press_key(self, is_shift_key=True):
+        """
+        Обрабатывает нажатие клавиши участником.
+
+        Нажатие любой клавиши до зеленого сигнала считается фальстартом.
+        Клавиша переключения повышает передачу, если не действует
+        блокировка после предыдущего переключения.
+
+        Args:
+            is_shift_key (bool): True, если нажата клавиша переключения передачи.
+        """
+        if not self.is_start:
+            self.is_false_start = True
+            self.is_start = True
+            self.start_race()
+            self.frames_start = self._steps_start_banner
+
+        if is_shift_key and self.frames_after_shift <= 0 and not self.is_finished:
+            current_gear = self.car.current_gear
+            if current_gear < self.car.engine.count_gear:
+                new_gear = current_gear + 1
+
+                self.is_boost = self.car.engine.is_boost()
+                self.is_good_shift = self.car.shift_gear(new_gear, self.simulation_clock.step)
+                self.frames_after_shift = self._steps_after_shift
+
+                if not self.is_good_shift:
+                    self.count_lose_shift += 1
+                    self.frames_warning = self._steps_warning
+                    self.frames_bad_shift_penalty = self._steps_penalty
+                else:
+                    self.count_good_shift += 1
+                    if self.is_boost:
+                        self.count_boost_shift += 1
+
+    def _update_traffic(self):
+        """
+        Отсчитывает фазы светофора на одном шаге физики.
+
+        Стартует гонку, когда отсчет доходит до зеленого сигнала.
+        """
+        if self.frames_traffic <= 0:
+            return
+
+        self.frames_traffic -= 1
+
+        if self.frames_traffic == self.traffic_phase_4:
+            self.is_start = True
+            self.start_race()
+            self.frames_start = self._steps_start_banner
+
+    def skip_traffic(self):
+        """
+        Мгновенно доводит отсчет светофора до зеленого сигнала.
+
+        Продвигает часы симуляции на пропущенное количество шагов, поэтому
+        результат совпадает с пошаговым отсчетом. Используется в симуляции,
+        где ожидание светофора не нужно отрисовывать.
+        """
+        if self.is_start:
+            return
+
+        skipped = self.frames_traffic - self.traffic_phase_4 - 1
+        self.simulation_clock.ticks += skipped
+        self.frames_traffic -= skipped
+        self.step()
+
+    def step(self):
+        """
+        Выполняет один шаг физики заезда.
+
+        Обновляет светофор, состояние автомобиля, записывает текущую скорость,
+        обновляет таймеры, проверяет завершение гонки и продвигает часы симуляции.
+        """
+        self._update_traffic()
+
+        if self.is_start and not self.is_finished:
+            car = self.car
+            car.update(self.frames_bad_shift_penalty <= 0, self.simulation_clock.step)
+
+            self.frames_boost = car.boost_frames_remaining
+
+            if self.frames_warning > 0:
+                self.frames_warning -= 1
+
+            if self.frames_after_shift > 0:
+                self.frames_after_shift -= 1
+
+            if self.frames_start > 0:
+                self.frames_start -= 1
+
+            if self.frames_bad_shift_penalty > 0:
+                self.frames_bad_shift_penalty -= 1
+                if self.frames_bad_shift_penalty == 0:
+                    self.is_good_shift = True
+
+            self.is_finished = self.track.update(car.speed)
+            self._record_telemetry()
+
+        self.simulation_clock.tick()
+
+    def get_time_spend(self):
+        """
+        Возвращает время заезда по часам симуляции.
+
+        Returns:
+            float: Время от старта в секундах (0.0, если гонка не началась).
+        """
+        if self.ticks_start_race is None:
+            return 0.0
+        return self.simulation_clock.get_elapsed(self.ticks_start_race)
+
+    def _record_telemetry(self):
+        """
+        Записывает текущее состояние автомобиля и дистанции в телеметрию.
+        """
+        car = self.car
+        engine = car.engine
+        self.telemetry.record(engine.revolutions, car.current_gear, engine.throttle, engine.speed_kmh,
+                              self.track.distance_traveled, car.boost_frames_remaining)
+
+    def get_speed_average(self):
+        """
+        Возвращает среднюю скорость за заезд.
+
+        Учитывает состояние перед стартом и все шаги после старта.
+
+        Returns:
+            float: Средняя скорость в км/ч.
+        """
+        return self.telemetry.get_speed_average()
@@ -0,0 +1,415 @@
+"""
+Модуль записи и воспроизведения заездов.
+
+Содержит класс Replay — компактную запись заезда (зерно светофора и нажатия
+клавиш с номерами шагов физики) в двоичном файле рядом с данными пользователя,
+и класс ReplayPlayer, который детерминированно воспроизводит запись
+без окна Pygame.
+
+Проверка лучших результатов пользователя по его записям:
+    python -m src.game.game_replay audit admin
+Воспроизведение одной записи (с необязательной выгрузкой телеметрии в CSV):
+    python -m src.game.game_replay play assets/users/user_admin/replays/replay_....bin telemetry.csv
+"""
+
+import os
+import struct
+import sys
+import time
+
+from src.game.game_car import Car
+from src.game.game_clock import PHYSICS_STEPS_PER_SECOND, SimulationClock
+from src.game.game_race import Race, TrackDistance
+from src.utils.utils_paths import Utils
+
+
+class Replay:
+    """
+    Класс записи заезда.
+
+    Заезд полностью определяется автомобилем, зерном фаз светофора и
+    нажатиями клавиш, поэтому запись хранит только их. Формат файла
+    (little-endian): заголовок HEADER, имя автомобиля и название трека
+    (длина в байте и UTF-8), затем по 4 байта на нажатие: номер шага
+    физики, сдвинутый на бит влево, и флаг клавиши переключения в младшем бите.
+
+    Attributes:
+        car_name (str): Идентификатор автомобиля.
+        track_name (str): Название трека.
+        seed (int): Зерно генератора фаз светофора.
+        steps_per_second (int): Частота шагов физики.
+        events (list): Нажатия клавиш: кортежи (номер шага, клавиша переключения).
+        ticks_finish (int): Время заезда в шагах физики (0, если заезд не завершен).
+    """
+
+    MAGIC = b'DRRP'
+    MAX_PER_TRACK = 10
+    VERSION = 1
+    HEADER = struct.Struct('<4sBIHIH')
+    EVENT = struct.Struct('<I')
+
+    def __init__(self, car_name, track_name, seed, steps_per_second=PHYSICS_STEPS_PER_SECOND):
+        """
+        Инициализирует пустую запись.
+
+        Args:
+            car_name (str): Идентификатор автомобиля.
+            track_name (str): Название трека.
+            seed (int): Зерно генератора фаз светофора (0 <= seed < 2**32).
+            steps_per_second (int): Частота шагов физики. По умолчанию 60.
+        """
+        self.car_name = car_name
+        self.track_name = track_name
+        self.seed = seed
+        self.steps_per_second = steps_per_second
+        self.events = []
+        self.ticks_finish = 0
+
+    def add_event(self, tick, is_shift_key):
+        """
+        Добавляет нажатие клавиши.
+
+        Args:
+            tick (int): Номер шага физики от начала заезда, перед которым нажата клавиша.
+            is_shift_key (bool): True, если нажата клавиша переключения (K_UP).
+        """
+        self.events.append((tick, bool(is_shift_key)))
+
+    def get_time_spend(self):
+        """
+        Возвращает записанное время заезда.
+
+        Returns:
+            float: Время заезда в секундах.
+        """
+        return self.ticks_finish / self.steps_per_second
+
+    def to_bytes(self):
+        """
+        Упаковывает запись в двоичный формат.
+
+        Returns:
+            bytes: Содержимое файла записи.
+
+        Raises:
+            ValueError: Если значения не помещаются в поля формата.
+        """
+        car_name = self.car_name.encode('utf-8')
+        track_name = self.track_name.encode('utf-8')
+        limits = (
+            ('seed', self.seed, 2 ** 32),
+            ('ticks_finish', self.ticks_finish, 2 ** 32),
+            ('количество нажатий', len(self.events), 2 ** 16),
+            ('номер шага нажатия', max((tick for tick, _ in self.events), default=0), 2 ** 31),
+            ('длина имени автомобиля', len(car_name), 2 ** 8),
+            ('длина названия трека', len(track_name), 2 ** 8)
+        )
+        for name, value, limit in limits:
+            if not 0 <= value < limit:
+                print(f"Ошибка записи заезда: {name} {value} вне диапазона [0, {limit})")
+                raise ValueError(f"Некорректное значение записи заезда: {name} {value}")
+        parts = [
+            self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.steps_per_second,
+                             self.ticks_finish, len(self.events)),
+            bytes([len(car_name)]), car_name,
+            bytes([len(track_name)]), track_name
+        ]
+        parts.extend(self.EVENT.pack(tick << 1 | is_shift_key) for tick, is_shift_key in self.events)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Распаковывает запись из двоичного формата.
+
+        Args:
+            data (bytes): Содержимое файла записи.
+
+        Returns:
+            Replay: Запись заезда.
+
+        Raises:
+            ValueError: Если данные не являются записью заезда поддерживаемой версии
+                        или записаны с частотой шагов, отличной от PHYSICS_STEPS_PER_SECOND.
+        """
+        try:
+            magic, version, seed, steps_per_second, ticks_finish, count = cls.HEADER.unpack_from(data)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(f"неизвестный формат {magic!r} версии {version}")
+            if steps_per_second != PHYSICS_STEPS_PER_SECOND:
+                raise ValueError(f"частота шагов {steps_per_second} вместо {PHYSICS_STEPS_PER_SECOND}")
+
+            offset = cls.HEADER.size
+            names = []
+            for _ in range(2):
+                length = data[offset]
+                names.append(data[offset + 1:offset + 1 + length].decode('utf-8'))
+                offset += 1 + length
+
+            replay = cls(names[0], names[1], seed, steps_per_second)
+            replay.ticks_finish = ticks_finish
+            for (value,) in cls.EVENT.iter_unpack(data[offset:offset + count * cls.EVENT.size]):
+                replay.add_event(value >> 1, value & 1)
+        except (struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+            print(f"Ошибка чтения записи заезда: {e}")
+            raise ValueError(f"Некорректная запись заезда: {e}")
+
+        if len(replay.events) != count:
+            print(f"Ошибка чтения записи заезда: ожидалось {count} нажатий, прочитано {len(replay.events)}")
+            raise ValueError("Запись заезда обрезана")
+        return replay
+
+    def save(self, path):
+        """
+        Сохраняет запись в файл.
+
+        Args:
+            path (str): Путь к файлу записи.
+
+        Raises:
+            ValueError: Если значения не помещаются в поля формата.
+        """
+        data = self.to_bytes()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Загружает запись из файла.
+
+        Args:
+            path (str): Путь к файлу записи.
+
+        Returns:
+            Replay: Запись заезда.
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+    @staticmethod
+    def get_replay_dir(user_name):
+        """
+        Возвращает директорию записей пользователя.
+
+        Args:
+            user_name (str): Идентификатор пользователя.
+
+        Returns:
+            str: Абсолютный путь к assets/users/user_{name}/replays.
+        """
+        return Utils().get_asset_path('users', f'user_{user_name}', 'replays')
+
+    def get_path(self, user_name):
+        """
+        Возвращает путь для новой записи пользователя.
+
+        Args:
+            user_name (str): Идентификатор пользователя.
+
+        Returns:
+            str: Путь вида replays/replay_{car}_{время}_{seed}.bin.
+        """
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        return os.path.join(self.get_replay_dir(user_name), f'replay_{self.car_name}_{stamp}_{self.seed}.bin')
+
+
+    @classmethod
+    def prune(cls, user_name, car_name, track_name, count_keep=MAX_PER_TRACK):
+        """
+        Удаляет лишние записи пользователя на автомобиле и треке.
+
+        Оставляет count_keep записей с лучшим записанным временем; незавершенные
+        записи считаются худшими. Файлы, которые не удается прочитать, не удаляются.
+
+        Args:
+            user_name (str): Идентификатор пользователя.
+            car_name (str): Идентификатор автомобиля.
+            track_name (str): Название трека.
+            count_keep (int): Количество оставляемых записей. По умолчанию MAX_PER_TRACK.
+
+        Returns:
+            int: Количество удаленных файлов.
+        """
+        replay_dir = cls.get_replay_dir(user_name)
+        if not os.path.isdir(replay_dir):
+            return 0
+
+        replays = []
+        for file_name in os.listdir(replay_dir):
+            if not (file_name.startswith(f'replay_{car_name}_') and file_name.endswith('.bin')):
+                continue
+            path = os.path.join(replay_dir, file_name)
+            try:
+                replay = cls.load(path)
+            except (IOError, ValueError):
+                continue
+            if replay.car_name == car_name and replay.track_name == track_name:
+                replays.append((replay.ticks_finish <= 0, replay.ticks_finish, file_name, path))
+
+        replays.sort()
+        for _, _, _, path in replays[count_keep:]:
+            os.remove(path)
+        return max(len(replays) - count_keep, 0)
+
+
+class ReplayPlayer:
+    """
+    Класс воспроизведения записей заездов.
+
+    Прогоняет заезд по правилам Race с тем же зерном светофора и теми же
+    нажатиями на тех же шагах физики, поэтому результат совпадает с заездом
+    в окне RaceManager. Автомобили загружаются без изображений и
+    переиспользуются между записями.
+
+    Attributes:
+        max_steps (int): Ограничение количества шагов одного воспроизведения.
+    """
+
+    def __init__(self, max_steps=30000):
+        """
+        Инициализирует проигрыватель.
+
+        Args:
+            max_steps (int): Ограничение количества шагов воспроизведения. По умолчанию 30000.
+        """
+        self.max_steps = max_steps
+        self._cars = {}
+
+    def play(self, replay, on_step=None):
+        """
+        Воспроизводит запись.
+
+        Args:
+            replay (Replay): Запись заезда.
+            on_step (callable, optional): Вызывается с Race после каждого шага
+                                          физики, начиная с шага старта.
+
+        Returns:
+            dict: Результат с ключами 'is_finished', 'is_false_start', 'time_spend',
+                  'ticks_finish', 'speed_average', 'count_lose_shift', 'is_consistent'
+                  (True, если время совпало с записанным) и 'telemetry' (Telemetry заезда).
+        """
+        car = self._cars.get(replay.car_name)
+        if car is None:
+            car = self._cars[replay.car_name] = Car(replay.car_name, is_headless=True)
+        car.reset()
+
+        race = Race(car, TrackDistance(), replay.seed, SimulationClock(replay.steps_per_second))
+        clock = race.simulation_clock
+        events = replay.events
+        index = 0
+
+        while not race.is_finished and clock.ticks < self.max_steps:
+            while index < len(events) and events[index][0] <= clock.ticks:
+                race.press_key(events[index][1])
+                index += 1
+            race.step()
+            if on_step is not None and race.is_start:
+                on_step(race)
+
+        ticks_finish = clock.ticks - race.ticks_start_race if race.is_finished else 0
+        return {
+            'is_finished': race.is_finished,
+            'is_false_start': race.is_false_start,
+            'time_spend': race.get_time_spend(),
+            'ticks_finish': ticks_finish,
+            'speed_average': race.get_speed_average(),
+            'count_lose_shift': race.count_lose_shift,
+            'is_consistent': ticks_finish == replay.ticks_finish,
+            'telemetry': race.telemetry
+        }
+
+    def audit_user(self, user_name):
+        """
+        Проверяет лучшие результаты пользователя по его записям.
+
+        Лучшее время по машине считается подтвержденным, если хотя бы одна
+        запись без фальстарта воспроизводится с таким же (с точностью до
+        округления) или лучшим временем. Записи, которые не удается прочитать
+        (в том числе записанные с другой частотой шагов) или воспроизвести
+        (например, машина удалена или переименована), пропускаются.
+
+        Args:
+            user_name (str): Идентификатор пользователя.
+
+        Returns:
+            dict: По названию машины — словарь с ключами 'best_time' (из user_{name}_races.json),
+                  'replay_time' (лучшее воспроизведенное время или None), 'is_confirmed'
+                  и 'count_inconsistent' (записи, время которых не совпало с записанным).
+        """
+        from src.game.game_user import User
+
+        user = User(user_name)
+        replay_dir = Replay.get_replay_dir(user_name)
+        files = sorted(os.listdir(replay_dir)) if os.path.isdir(replay_dir) else []
+
+        replay_times = {}
+        count_inconsistent = {}
+        for file_name in files:
+            if not file_name.endswith('.bin'):
+                continue
+            try:
+                replay = Replay.load(os.path.join(replay_dir, file_name))
+                result = self.play(replay)
+                title = self._cars[replay.car_name].title
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Запись {file_name} пропущена: {type(e).__name__}: {e}")
+                continue
+
+            if not result['is_consistent']:
+                count_inconsistent[title] = count_inconsistent.get(title, 0) + 1
+            if result['is_finished'] and not result['is_false_start']:
+                best = replay_times.get(title)
+                if best is None or result['time_spend'] < best:
+                    replay_times[title] = result['time_spend']
+
+        report = {}
+        for title, stats in user.data.items():
+            best_time = stats.get('best_time')
+            replay_time = replay_times.get(title)
+            report[title] = {
+                'best_time': best_time,
+                'replay_time': replay_time,
+                'is_confirmed': best_time is None or (replay_time is not None
+                                                      and round(replay_time, 2) <= best_time),
+                'count_inconsistent': count_inconsistent.get(title, 0)
+            }
+        return report
+
+
+def main():
+    """
+    Точка входа командной строки записей заездов.
+    """
+    if len(sys.argv) not in (3, 4) or sys.argv[1] not in ('audit', 'play'):
+        print("Использование: python -m src.game.game_replay audit <пользователь>")
+        print("               python -m src.game.game_replay play <файл записи> [телеметрия.csv]")
+        sys.exit(1)
+
+    player = ReplayPlayer()
+    if sys.argv[1] == 'play':
+        replay = Replay.load(sys.argv[2])
+        time_start = time.perf_counter()
+        result = player.play(replay)
+        time_real = time.perf_counter() - time_start
+        print(f"{replay.car_name}, {replay.track_name}, зерно {replay.seed}, нажатий {len(replay.events)}")
+        print(f"Время: {result['time_spend']:.2f} сек (записано {replay.get_time_spend():.2f}), "
+              f"фальстарт: {result['is_false_start']}, совпадение: {result['is_consistent']}")
+        print(f"Скорость воспроизведения: x{result['time_spend'] / max(time_real, 1e-9):.0f}")
+        if len(sys.argv) == 4:
+            result['telemetry'].save_csv(sys.argv[3])
+            print(f"Телеметрия: {result['telemetry'].get_size()} шагов в {sys.argv[3]}")
+        return
+
+    for title, item in player.audit_user(sys.argv[2]).items():
+        status = "подтверждено" if item['is_confirmed'] else "НЕ ПОДТВЕРЖДЕНО"
+        replay_time = "нет записей" if item['replay_time'] is None else f"{item['replay_time']:.2f}"
+        if item['count_inconsistent']:
+            status += f", расхождений с записанным временем: {item['count_inconsistent']}"
+        print(f"{title}: лучшее время {item['best_time']}, по записям {replay_time} — {status}")
+
+
+if __name__ == "__main__":
+    main()
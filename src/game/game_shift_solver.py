@@ -0,0 +1,225 @@
+"""
+Модуль поиска оптимальных оборотов переключения.
+
+Содержит класс ShiftSolver, который подбирает для каждой передачи автомобиля
+обороты переключения с минимальным временем заезда и кэширует результат
+на диске по хэшу характеристик автомобиля.
+
+Запуск для всех автомобилей из assets/cars:
+    python -m src.game.game_shift_solver
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from src.game.game_batch import EngineBatch
+from src.game.game_car import Car
+from src.utils.utils_paths import Utils
+
+
+class ShiftSolver:
+    """
+    Класс поиска оптимальных оборотов переключения.
+
+    Перебирает обороты переключения покоординатно (передача за передачей)
+    на сетке оборотов, оценивая все варианты одной передачи одним пакетом
+    EngineBatch. Найденные обороты сохраняются в assets/cache/shift_points
+    и пересчитываются только при изменении характеристик автомобиля.
+
+    Attributes:
+        revolutions_step (int): Шаг сетки оборотов.
+        passes (int): Максимальное количество проходов по передачам.
+        distance_total (float): Длина трека в метрах.
+    """
+
+    VERSION = 2
+
+    def __init__(self, revolutions_step=25, passes=4, distance_total=4020):
+        """
+        Инициализирует решатель.
+
+        Args:
+            revolutions_step (int): Шаг сетки оборотов. По умолчанию 25.
+            passes (int): Максимальное количество проходов по передачам. По умолчанию 4.
+            distance_total (float): Длина трека в метрах. По умолчанию 4020.
+        """
+        self.revolutions_step = revolutions_step
+        self.passes = passes
+        self.distance_total = distance_total
+
+    def get_spec_hash(self, car):
+        """
+        Вычисляет хэш характеристик автомобиля, влияющих на время заезда.
+
+        Args:
+            car (Car): Автомобиль.
+
+        Returns:
+            str: Шестнадцатеричный SHA-256 характеристик и параметров решателя.
+        """
+        spec = {
+            'version': self.VERSION,
+            'revolutions_step': self.revolutions_step,
+            'passes': self.passes,
+            'distance_total': self.distance_total,
+            'class': car.car_class,
+            'dict_gear_ratio_pair': car.dict_gear_ratio_pair,
+            'time_max_throttle': car.time_max_throttle,
+            'frames_after_shift': car.frames_after_shift,
+            'wheel_circle': car.wheel_circle,
+            'min_revolutions': car.min_revolutions,
+            'max_revolutions': car.max_revolutions
+        }
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_cache_path(spec_hash):
+        """
+        Возвращает путь к файлу кэша для хэша характеристик.
+
+        Args:
+            spec_hash (str): Хэш характеристик автомобиля.
+
+        Returns:
+            str: Абсолютный путь к JSON-файлу кэша.
+        """
+        return Utils().get_asset_path('cache', 'shift_points', f'shift_points_{spec_hash}.json')
+
+    def get_cached(self, car):
+        """
+        Возвращает ранее найденные обороты переключения без пересчета.
+
+        Args:
+            car (Car): Автомобиль.
+
+        Returns:
+            dict or None: Результат решателя или None, если кэша нет.
+        """
+        try:
+            with open(self.get_cache_path(self.get_spec_hash(car)), 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        data['shift_revolutions'] = {int(gear): rpm for gear, rpm in data['shift_revolutions'].items()}
+        return data
+
+    def solve(self, car):
+        """
+        Возвращает оптимальные обороты переключения автомобиля.
+
+        Берет результат из кэша, а при его отсутствии запускает поиск
+        и сохраняет результат.
+
+        Args:
+            car (Car or str): Автомобиль или его идентификатор.
+
+        Returns:
+            dict: Словарь с ключами 'shift_revolutions' (обороты по номеру передачи),
+                  'time_spend', 'speed_average', 'count_boost_shift', 'count_lose_shift'.
+        """
+        if isinstance(car, str):
+            car = Car(car, is_headless=True)
+
+        cached = self.get_cached(car)
+        if cached is not None:
+            return cached
+
+        result = self._optimize(car)
+
+        cache_path = self.get_cache_path(self.get_spec_hash(car))
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as file:
+                json.dump(result, file, indent=2, ensure_ascii=False)
+        except IOError as e:
+            print(f"Ошибка записи кэша оборотов переключения для '{car.name}': {e}")
+
+        return result
+
+    def solve_all(self):
+        """
+        Находит обороты переключения для всех автомобилей из assets/cars.
+
+        Returns:
+            dict: Результаты решателя по идентификатору автомобиля.
+        """
+        return {name: self.solve(name) for name in Utils().get_list_cars()}
+
+    def _evaluate(self, car, candidates):
+        """
+        Прогоняет пакет заездов с заданными оборотами переключения.
+
+        Args:
+            car (Car): Автомобиль.
+            candidates (np.ndarray): Обороты переключения, массив K x (передачи + 1).
+
+        Returns:
+            tuple: Индекс лучшего варианта и словарь результатов EngineBatch.
+        """
+        result = EngineBatch([car] * len(candidates), candidates, self.distance_total).run()
+        time_spend = np.where(result['is_finished'], result['time_spend'], np.inf)
+        best = np.lexsort((-result['speed_average'], time_spend))[0]
+        return best, result
+
+    def _optimize(self, car):
+        """
+        Выполняет покоординатный поиск оборотов переключения.
+
+        Args:
+            car (Car): Автомобиль.
+
+        Returns:
+            dict: Результат решателя (см. solve).
+        """
+        engine = car.engine
+        gears_total = engine.count_gear + 1
+        grid = np.arange(engine.min_revolutions, engine.max_revolutions + self.revolutions_step,
+                         self.revolutions_step, dtype=np.float64)
+        grid = np.minimum(grid, engine.max_revolutions)
+
+        targets = np.full(gears_total, (engine.min_revolutions_to_boost + engine.max_revolutions_to_boost) / 2)
+        targets[0] = 0
+        best_index, best_result = self._evaluate(car, targets[None, :])
+        best_key = (best_result['time_spend'][best_index], -best_result['speed_average'][best_index])
+
+        for _ in range(self.passes):
+            is_improved = False
+            for gear in range(1, engine.count_gear):
+                candidates = np.repeat(targets[None, :], len(grid), axis=0)
+                candidates[:, gear] = grid
+
+                index, result = self._evaluate(car, candidates)
+                if not result['is_finished'][index]:
+                    continue
+
+                key = (result['time_spend'][index], -result['speed_average'][index])
+                if key < best_key:
+                    targets[gear] = grid[index]
+                    best_key = key
+                    best_index, best_result = index, result
+                    is_improved = True
+
+            if not is_improved:
+                break
+
+        return {
+            'shift_revolutions': {gear: float(targets[gear]) for gear in range(1, engine.count_gear)},
+            'time_spend': float(best_result['time_spend'][best_index]),
+            'speed_average': float(best_result['speed_average'][best_index]),
+            'count_boost_shift': int(best_result['count_boost_shift'][best_index]),
+            'count_lose_shift': int(best_result['count_lose_shift'][best_index])
+        }
+
+
+if __name__ == "__main__":
+    solver = ShiftSolver()
+    for car_name, solution in solver.solve_all().items():
+        car_spec = Car(car_name, is_headless=True)
+        shifts = ", ".join(f"{gear}: {round(rpm)}" for gear, rpm in solution['shift_revolutions'].items())
+        print(f"{car_spec.title}: время {solution['time_spend']:.2f} сек, "
+              f"средняя скорость {solution['speed_average']:.1f} км/ч, "
+              f"очки для разблокировки {car_spec.score_to_unlocking}, переключения {{{shifts}}}")
@@ -0,0 +1,185 @@
+"""
+Модуль безголовой симуляции гонки.
+
+Содержит стратегии переключения передач и класс RaceSimulator, который
+прогоняет полный заезд по правилам Race без окна Pygame и возвращает
+время заезда, среднюю скорость и качество переключений.
+"""
+
+from src.game.game_car import Car
+from src.game.game_race import Race, TrackDistance
+
+
+class ShiftPolicyRevolutions:
+    """
+    Стратегия переключения передач по оборотам двигателя.
+
+    Переключает передачу, как только обороты на текущей передаче
+    достигают заданного значения.
+
+    Attributes:
+        revolutions_by_gear (dict): Обороты переключения для каждой передачи (ключ — int).
+    """
+
+    def __init__(self, revolutions_by_gear=None):
+        """
+        Инициализирует стратегию.
+
+        Args:
+            revolutions_by_gear (dict, optional): Обороты переключения по номеру передачи.
+                                                  Для отсутствующих передач используется
+                                                  середина зоны буста.
+        """
+        self.revolutions_by_gear = revolutions_by_gear or {}
+
+    def get_target(self, engine, gear):
+        """
+        Возвращает обороты, на которых нужно переключиться с передачи gear.
+
+        Args:
+            engine (Engine): Двигатель автомобиля.
+            gear (int): Текущая передача.
+
+        Returns:
+            float: Целевые обороты переключения.
+        """
+        if gear == 0:
+            return 0
+        if gear in self.revolutions_by_gear:
+            return min(self.revolutions_by_gear[gear], engine.max_revolutions)
+        return (engine.min_revolutions_to_boost + engine.max_revolutions_to_boost) / 2
+
+    def __call__(self, race):
+        """
+        Решает, нужно ли нажать клавишу переключения на текущем шаге.
+
+        Args:
+            race (Race): Текущий заезд.
+
+        Returns:
+            bool: True, если нужно переключить передачу.
+        """
+        engine = race.car.engine
+        return engine.revolutions >= self.get_target(engine, race.car.current_gear)
+
+
+class ShiftPolicySchedule:
+    """
+    Стратегия переключения передач по расписанию.
+
+    Переключает передачи в заданные моменты времени после старта.
+    Первое значение — включение первой передачи.
+
+    Attributes:
+        shift_times (list): Моменты переключений в секундах от старта.
+    """
+
+    def __init__(self, shift_times):
+        """
+        Инициализирует стратегию.
+
+        Args:
+            shift_times (list): Моменты переключений в секундах от старта.
+        """
+        self.shift_times = list(shift_times)
+
+    def __call__(self, race):
+        """
+        Решает, нужно ли нажать клавишу переключения на текущем шаге.
+
+        Args:
+            race (Race): Текущий заезд.
+
+        Returns:
+            bool: True, если подошло время очередного переключения.
+        """
+        index = race.count_good_shift + race.count_lose_shift
+        if index >= len(self.shift_times):
+            return False
+        return race.get_time_spend() >= self.shift_times[index] - 1e-9
+
+
+class RaceSimulator:
+    """
+    Класс безголовой симуляции гонки.
+
+    Загружает характеристики автомобиля один раз и прогоняет заезды
+    с заданной стратегией переключения, не открывая окно Pygame.
+
+    Attributes:
+        car (Car): Автомобиль без изображения, переиспользуемый между заездами.
+        distance_total (float): Длина трека в метрах.
+        max_steps (int): Ограничение количества шагов одного заезда.
+    """
+
+    def __init__(self, car, distance_total=4020, max_steps=20000):
+        """
+        Инициализирует симулятор.
+
+        Args:
+            car (Car or str): Автомобиль или его идентификатор для загрузки конфигурации.
+            distance_total (float): Длина трека в метрах. По умолчанию 4020.
+            max_steps (int): Ограничение количества шагов одного заезда. По умолчанию 20000.
+        """
+        self.car = Car(car, is_headless=True) if isinstance(car, str) else car
+        self.distance_total = distance_total
+        self.max_steps = max_steps
+
+    def run(self, shift_policy, seed=None, reaction_steps=0):
+        """
+        Прогоняет один заезд.
+
+        Ждет зеленый сигнал светофора, затем на каждом шаге спрашивает
+        стратегию, нужно ли переключить передачу, до пересечения финиша.
+
+        Args:
+            shift_policy (callable): Стратегия: принимает Race и возвращает True,
+                                     если нужно нажать клавишу переключения.
+            seed (int, optional): Зерно фаз светофора. По умолчанию None.
+            reaction_steps (int): Задержка реакции на зеленый сигнал в шагах. По умолчанию 0.
+
+        Returns:
+            dict: Результат заезда с ключами 'is_finished', 'time_spend', 'speed_average',
+                  'speed_finish', 'count_good_shift', 'count_boost_shift',
+                  'count_lose_shift', 'shift_quality' и 'steps'.
+        """
+        self.car.reset()
+        race = Race(self.car, TrackDistance(self.distance_total), seed)
+
+        race.skip_traffic()
+        for _ in range(reaction_steps):
+            race.step()
+
+        steps = 0
+        while not race.is_finished and steps < self.max_steps:
+            if race.frames_after_shift <= 0 and shift_policy(race):
+                race.press_key()
+            race.step()
+            steps += 1
+
+        return self.get_result(race, steps)
+
+    @staticmethod
+    def get_result(race, steps):
+        """
+        Собирает результат завершенного заезда.
+
+        Args:
+            race (Race): Заезд.
+            steps (int): Количество шагов от старта.
+
+        Returns:
+            dict: Результат заезда (см. run).
+        """
+        count_shift = race.count_good_shift + race.count_lose_shift
+        return {
+            'is_finished': race.is_finished,
+            'time_spend': race.get_time_spend(),
+            'speed_average': race.get_speed_average(),
+            'speed_finish': race.car.engine.get_current_speed(),
+            'count_good_shift': race.count_good_shift,
+            'count_boost_shift': race.count_boost_shift,
+            'count_lose_shift': race.count_lose_shift,
+            'shift_quality': race.count_good_shift / count_shift if count_shift else 0.0,
+            'steps': steps
+        }
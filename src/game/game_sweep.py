@@ -0,0 +1,262 @@
+"""
+Модуль перебора настроек автомобиля.
+
+Содержит класс CarSweep, который строит варианты базового автомобиля
+по диапазонам передаточных чисел, времени разгона, длины окружности колеса
+и максимальных оборотов, прогоняет их в пуле процессов и построчно
+записывает результаты в CSV по мере готовности.
+
+Пример запуска:
+    python -m src.game.game_sweep audi_rs6 --wheel-circle 1.9:2.2:0.05 \\
+        --max-revolutions 6500:7500:250 --output sweep_audi_rs6.csv
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+
+from src.game.game_car import Car
+from src.game.game_simulator import RaceSimulator, ShiftPolicyRevolutions
+from src.utils.utils_paths import Utils
+
+_worker_base_data = None
+_worker_seed = 0
+
+
+def parse_range(text):
+    """
+    Разбирает диапазон значений из командной строки.
+
+    Args:
+        text (str): Одно значение ("2.05") или диапазон "начало:конец:шаг"
+                    (конец включается).
+
+    Returns:
+        list: Список значений диапазона.
+
+    Raises:
+        ValueError: Если диапазон задан неверно или его конец меньше начала.
+    """
+    parts = [float(part) for part in text.split(':')]
+    if len(parts) == 1:
+        return parts
+    if len(parts) != 3 or parts[2] <= 0:
+        print(f"Ошибка: неверный диапазон '{text}', ожидается 'начало:конец:шаг' с шагом больше 0")
+        raise ValueError(f"Неверный диапазон '{text}', ожидается 'начало:конец:шаг'")
+
+    start, stop, step = parts
+    if stop < start:
+        print(f"Ошибка: конец диапазона '{text}' меньше начала")
+        raise ValueError(f"Неверный диапазон '{text}': конец {stop} меньше начала {start}")
+
+    count = int(round((stop - start) / step)) + 1
+    return [round(start + i * step, 10) for i in range(count)]
+
+
+def _init_worker(base_data, seed):
+    """
+    Инициализирует процесс пула.
+
+    Сохраняет базовые характеристики автомобиля и фиксирует зерно
+    генератора случайных чисел процесса.
+
+    Args:
+        base_data (dict): Базовые характеристики автомобиля.
+        seed (int): Базовое зерно перебора.
+    """
+    global _worker_base_data, _worker_seed
+    _worker_base_data = base_data
+    _worker_seed = seed
+    random.seed(seed)
+
+
+def _simulate_variant(task):
+    """
+    Прогоняет заезд одного варианта автомобиля в процессе пула.
+
+    Зерно светофора зависит только от номера варианта, поэтому результат
+    не зависит от того, какой процесс его посчитал.
+
+    Args:
+        task (tuple): Номер варианта и словарь его параметров.
+
+    Returns:
+        dict: Строка CSV с параметрами и результатом заезда.
+    """
+    index, params = task
+    data = CarSweep.build_variant(_worker_base_data, params)
+    car = Car(data.get('name', 'sweep'), is_headless=True, data=data)
+
+    seed = _worker_seed + index
+    result = RaceSimulator(car).run(ShiftPolicyRevolutions(), seed=seed)
+
+    row = {'index': index, 'seed': seed}
+    row.update(params)
+    row.update({key: result[key] for key in CarSweep.RESULT_FIELDS})
+    return row
+
+
+class CarSweep:
+    """
+    Класс перебора настроек автомобиля.
+
+    Attributes:
+        base_data (dict): Базовые характеристики автомобиля.
+        ranges (dict): Значения перебираемых параметров по имени параметра.
+        seed (int): Базовое зерно светофора.
+        workers (int): Количество процессов пула.
+    """
+
+    SWEEP_FIELDS = ('gear_ratio_main', 'gear_ratio_scale', 'time_max_throttle_scale',
+                    'wheel_circle', 'max_revolutions')
+    RESULT_FIELDS = ('is_finished', 'time_spend', 'speed_average', 'speed_finish',
+                     'count_good_shift', 'count_boost_shift', 'count_lose_shift')
+
+    def __init__(self, base_data, ranges, seed=0, workers=None):
+        """
+        Инициализирует перебор.
+
+        Args:
+            base_data (dict): Базовые характеристики в формате car_{name}.json.
+            ranges (dict): Списки значений для параметров из SWEEP_FIELDS.
+                           Отсутствующие параметры берутся из базового автомобиля.
+            seed (int): Базовое зерно светофора. По умолчанию 0.
+            workers (int, optional): Количество процессов. По умолчанию — все ядра.
+        """
+        self.base_data = base_data
+        self.ranges = {field: list(values) for field, values in ranges.items() if values}
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+
+    @staticmethod
+    def build_variant(base_data, params):
+        """
+        Строит характеристики варианта автомобиля.
+
+        Args:
+            base_data (dict): Базовые характеристики автомобиля.
+            params (dict): Значения параметров варианта.
+
+        Returns:
+            dict: Новые характеристики автомобиля.
+        """
+        data = copy.deepcopy(base_data)
+        gear_ratio = data['dict_gear_ratio_pair']
+        time_max_throttle = data['time_max_throttle']
+
+        if 'gear_ratio_main' in params:
+            gear_ratio['main'] = params['gear_ratio_main']
+        if 'gear_ratio_scale' in params:
+            for gear in gear_ratio:
+                if gear not in ('main', '0'):
+                    gear_ratio[gear] = gear_ratio[gear] * params['gear_ratio_scale']
+        if 'time_max_throttle_scale' in params:
+            for gear in time_max_throttle:
+                if gear != '0':
+                    time_max_throttle[gear] = time_max_throttle[gear] * params['time_max_throttle_scale']
+        if 'wheel_circle' in params:
+            data['wheel_circle'] = params['wheel_circle']
+        if 'max_revolutions' in params:
+            data['max_revolutions'] = params['max_revolutions']
+
+        return data
+
+    def get_count(self):
+        """
+        Возвращает количество вариантов перебора.
+
+        Returns:
+            int: Произведение размеров всех диапазонов.
+        """
+        count = 1
+        for values in self.ranges.values():
+            count *= len(values)
+        return count
+
+    def get_variants(self):
+        """
+        Лениво перечисляет варианты перебора.
+
+        Yields:
+            tuple: Номер варианта и словарь значений его параметров.
+        """
+        fields = [field for field in self.SWEEP_FIELDS if field in self.ranges]
+        for index, values in enumerate(itertools.product(*(self.ranges[field] for field in fields))):
+            yield index, dict(zip(fields, values))
+
+    def run(self, output_path):
+        """
+        Прогоняет все варианты и записывает результаты в CSV.
+
+        Строки записываются в порядке завершения и сразу сбрасываются на диск,
+        поэтому частичный результат доступен во время перебора.
+
+        Args:
+            output_path (str): Путь к CSV-файлу результатов.
+
+        Returns:
+            int: Количество записанных строк.
+        """
+        fields = [field for field in self.SWEEP_FIELDS if field in self.ranges]
+        columns = ['index', 'seed'] + fields + list(self.RESULT_FIELDS)
+        chunksize = max(1, self.get_count() // (self.workers * 16))
+
+        count = 0
+        with open(output_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+
+            with multiprocessing.Pool(self.workers, _init_worker, (self.base_data, self.seed)) as pool:
+                for row in pool.imap_unordered(_simulate_variant, self.get_variants(), chunksize):
+                    writer.writerow(row)
+                    file.flush()
+                    count += 1
+
+        return count
+
+
+def load_base_data(car):
+    """
+    Загружает базовые характеристики автомобиля.
+
+    Args:
+        car (str): Путь к JSON-файлу или идентификатор автомобиля из assets/cars.
+
+    Returns:
+        dict: Характеристики автомобиля.
+    """
+    path = car if os.path.isfile(car) else Utils().get_asset_path('cars', f'car_{car}.json')
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def main():
+    """
+    Точка входа командной строки перебора настроек.
+    """
+    parser = argparse.ArgumentParser(description="Перебор настроек автомобиля в пуле процессов.")
+    parser.add_argument('car', help="Путь к JSON автомобиля или его идентификатор (audi_rs6)")
+    parser.add_argument('--gear-ratio-main', type=parse_range, help="Главная пара, 'начало:конец:шаг'")
+    parser.add_argument('--gear-ratio-scale', type=parse_range, help="Множитель передаточных чисел передач")
+    parser.add_argument('--time-max-throttle-scale', type=parse_range, help="Множитель времени разгона передач")
+    parser.add_argument('--wheel-circle', type=parse_range, help="Длина окружности колеса, м")
+    parser.add_argument('--max-revolutions', type=parse_range, help="Максимальные обороты")
+    parser.add_argument('--output', default='sweep.csv', help="CSV-файл результатов")
+    parser.add_argument('--seed', type=int, default=0, help="Базовое зерно светофора")
+    parser.add_argument('--workers', type=int, default=None, help="Количество процессов (по умолчанию все ядра)")
+    args = parser.parse_args()
+
+    ranges = {field: getattr(args, field) for field in CarSweep.SWEEP_FIELDS}
+    sweep = CarSweep(load_base_data(args.car), ranges, args.seed, args.workers)
+    print(f"Вариантов: {sweep.get_count()}, процессов: {sweep.workers}")
+    count = sweep.run(args.output)
+    print(f"Записано строк: {count} в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
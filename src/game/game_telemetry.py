@@ -0,0 +1,164 @@
+"""
+Модуль телеметрии заезда.
+
+Содержит класс Telemetry — кольцевой буфер фиксированного размера
+с каналами оборотов, передачи, дросселя, скорости, дистанции и буста
+и накопительными агрегатами скорости.
+"""
+
+import csv
+from array import array
+
+
+class Telemetry:
+    """
+    Класс телеметрии заезда.
+
+    Каналы хранятся в заранее выделенных массивах array на capacity
+    шагов физики, поэтому память не растет с длиной заезда: при
+    переполнении перезаписываются самые старые шаги. Сумма, количество
+    и максимум скорости считаются по всем записанным шагам, поэтому
+    средняя скорость доступна за O(1) в любой момент.
+
+    Attributes:
+        capacity (int): Размер буфера в шагах физики.
+        count (int): Количество записанных шагов за все время.
+        speed_sum (int): Сумма скоростей (км/ч) всех записанных шагов.
+        speed_max (int): Максимальная скорость (км/ч).
+    """
+
+    CHANNELS = ('rpm', 'gear', 'throttle', 'speed', 'distance', 'boost')
+    TYPECODES = {'rpm': 'f', 'gear': 'B', 'throttle': 'f', 'speed': 'H', 'distance': 'f', 'boost': 'B'}
+
+    def __init__(self, capacity=4096):
+        """
+        Инициализирует буфер телеметрии.
+
+        Args:
+            capacity (int): Размер буфера в шагах физики. По умолчанию 4096
+                            (больше минуты при 60 шагах в секунду, около 64 КБ).
+
+        Raises:
+            ValueError: Если capacity не положительный.
+        """
+        if capacity <= 0:
+            print(f"Ошибка: размер буфера телеметрии должен быть больше 0, получено: {capacity}")
+            raise ValueError(f"Некорректный размер буфера телеметрии: {capacity}")
+
+        self.capacity = capacity
+        self._channels = {name: array(self.TYPECODES[name], [0]) * capacity for name in self.CHANNELS}
+        self._rpm = self._channels['rpm']
+        self._gear = self._channels['gear']
+        self._throttle = self._channels['throttle']
+        self._speed = self._channels['speed']
+        self._distance = self._channels['distance']
+        self._boost = self._channels['boost']
+        self.reset()
+
+    def reset(self):
+        """
+        Очищает буфер и агрегаты.
+        """
+        self._index = 0
+        self.count = 0
+        self.speed_sum = 0
+        self.speed_max = 0
+
+    def record(self, rpm, gear, throttle, speed, distance, boost):
+        """
+        Записывает один шаг физики.
+
+        Args:
+            rpm (float): Обороты двигателя.
+            gear (int): Текущая передача.
+            throttle (float): Уровень дросселя (0.0-1.0).
+            speed (int): Скорость в км/ч.
+            distance (float): Пройденное расстояние в метрах.
+            boost (int): Оставшиеся шаги буста (0 — буст не активен).
+        """
+        index = self._index
+        self._rpm[index] = rpm
+        self._gear[index] = gear
+        self._throttle[index] = throttle
+        self._speed[index] = speed
+        self._distance[index] = distance
+        self._boost[index] = boost
+
+        index += 1
+        self._index = 0 if index == self.capacity else index
+        self.count += 1
+        self.speed_sum += speed
+        if speed > self.speed_max:
+            self.speed_max = speed
+
+    def get_speed_average(self):
+        """
+        Возвращает среднюю скорость по всем записанным шагам.
+
+        Returns:
+            float: Средняя скорость в км/ч (0, если шагов нет).
+        """
+        return self.speed_sum / self.count if self.count else 0
+
+    def get_size(self):
+        """
+        Возвращает количество шагов, хранящихся в буфере.
+
+        Returns:
+            int: Не больше capacity.
+        """
+        return min(self.count, self.capacity)
+
+    def get_channel(self, name):
+        """
+        Возвращает значения канала в хронологическом порядке.
+
+        Args:
+            name (str): Имя канала из CHANNELS.
+
+        Returns:
+            list: Значения последних get_size() шагов.
+
+        Raises:
+            ValueError: Если канал неизвестен.
+        """
+        if name not in self._channels:
+            print(f"Ошибка: неизвестный канал телеметрии '{name}'")
+            raise ValueError(f"Канал телеметрии '{name}' не существует")
+
+        channel = self._channels[name]
+        if self.count <= self.capacity:
+            return channel[:self.count].tolist()
+        return channel[self._index:].tolist() + channel[:self._index].tolist()
+
+    def export(self):
+        """
+        Выгружает все каналы и агрегаты.
+
+        Returns:
+            dict: Ключи 'count', 'speed_average', 'speed_max' и списки значений
+                  по имени каждого канала.
+        """
+        data = {
+            'count': self.count,
+            'speed_average': self.get_speed_average(),
+            'speed_max': self.speed_max
+        }
+        for name in self.CHANNELS:
+            data[name] = self.get_channel(name)
+        return data
+
+    def save_csv(self, path):
+        """
+        Сохраняет каналы в CSV-файл, одна строка на шаг физики.
+
+        Args:
+            path (str): Путь к CSV-файлу.
+        """
+        channels = [self.get_channel(name) for name in self.CHANNELS]
+        first_step = self.count - self.get_size()
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(('step',) + self.CHANNELS)
+            for offset, row in enumerate(zip(*channels)):
+                writer.writerow((first_step + offset,) + row)
@@ -0,0 +1,322 @@
+"""
+Модуль менеджера сцен.
+
+Содержит класс Scene — базовый класс окна приложения, и класс SceneManager,
+который владеет единственным окном Pygame, главным циклом и стеком сцен.
+Переход между окнами — это операция со стеком, а не запуск нового цикла
+внутри текущего окна, поэтому глубина стека вызовов и память не растут
+от количества переходов. Класс MenuScene — основа меню, которые рисуются
+по грязным прямоугольникам через DirtyRenderer.
+
+Главный цикл замеряет фазы кадра профилировщиком FrameProfiler;
+клавиша F3 показывает и скрывает его оверлей.
+"""
+
+import time
+
+import pygame
+
+from src.ui.tools.tool_window_designer import WindowPattern
+from src.utils.utils_profiler import FrameProfiler
+
+
+class Scene:
+    """
+    Базовый класс сцены (окна приложения).
+
+    Сцена получает события, обновляет состояние и рисует кадр в окне
+    SceneManager. Переходы выполняются через SceneManager().push, pop,
+    replace и pop_to_root.
+
+    Attributes:
+        screen (pygame.Surface): Поверхность окна приложения.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует сцену в окне менеджера сцен.
+        """
+        self.screen = SceneManager().screen
+
+    def on_enter(self):
+        """
+        Вызывается, когда сцена оказывается на вершине стека.
+        """
+
+    def handle_event(self, event):
+        """
+        Обрабатывает событие Pygame (кроме pygame.QUIT).
+
+        Args:
+            event (pygame.event.Event): Событие Pygame.
+        """
+
+    def update(self, frame_time):
+        """
+        Обновляет состояние сцены.
+
+        Args:
+            frame_time (float): Длительность предыдущего кадра в секундах.
+        """
+
+    def draw(self):
+        """
+        Рисует кадр на поверхности окна.
+        """
+
+    def present(self, rect=None):
+        """
+        Передает нарисованный кадр на дисплей.
+
+        Args:
+            rect (pygame.Rect, optional): Область, нарисованная поверх кадра после
+                                          draw() (оверлей профилировщика).
+        """
+        pygame.display.flip()
+
+    def invalidate(self):
+        """
+        Запрашивает полную перерисовку следующего кадра.
+        """
+
+
+class MenuScene(Scene):
+    """
+    Базовый класс меню, которое рисуется по грязным прямоугольникам.
+
+    Наследник создает в __init__ атрибут renderer (DirtyRenderer) и в draw()
+    рисует виджеты с этим renderer.
+
+    Attributes:
+        renderer (DirtyRenderer): Отрисовка меню по грязным прямоугольникам.
+    """
+
+    def on_enter(self):
+        """
+        Перерисовывает меню целиком, когда оно становится активным.
+        """
+        self.renderer.reset()
+
+    def handle_event(self, event):
+        """
+        Запрашивает полную перерисовку после восстановления окна.
+
+        Args:
+            event (pygame.event.Event): Событие Pygame.
+        """
+        self.renderer.handle_event(event)
+
+    def present(self, rect=None):
+        """
+        Передает на дисплей только изменившиеся области кадра.
+
+        Args:
+            rect (pygame.Rect, optional): Область, нарисованная поверх кадра после draw().
+        """
+        if rect is not None:
+            self.renderer.invalidate(rect)
+        self.renderer.present()
+
+    def invalidate(self):
+        """
+        Запрашивает полную перерисовку следующего кадра.
+        """
+        self.renderer.invalidate()
+
+
+class SceneManager:
+    """
+    Класс менеджера сцен (Singleton).
+
+    Создает окно один раз и выполняет единственный главный цикл: события
+    передаются сцене на вершине стека, затем она обновляется, рисуется
+    и передает кадр на дисплей. Если во время кадра вершина стека
+    сменилась, прежняя сцена больше не получает ни оставшиеся события
+    кадра, ни update(), а новая сцена получает on_enter и начинает
+    со следующего кадра с нулевой длительностью предыдущего кадра.
+
+    Частота кадров и способ ожидания конца кадра берутся из config_ui_app.json:
+    при "fps": null цикл работает без ограничения (режим замеров), при
+    tick_busy_loop кадр выдерживается точнее ценой занятого ядра. Игровая
+    логика от частоты кадров не зависит: сцены получают длительность кадра
+    в update(), а физика заезда идет фиксированными шагами SimulationClock.
+
+    Если профилировщик включен, длительности фаз каждого кадра (события,
+    update, draw, present и ожидание clock.tick) записываются в него.
+
+    Attributes:
+        screen (pygame.Surface): Поверхность окна приложения.
+        fps (int): Ограничение частоты кадров главного цикла (0 — без ограничения).
+        is_tick_busy_loop (bool): True, если кадр выдерживается через clock.tick_busy_loop.
+        is_running (bool): Флаг работы главного цикла.
+        profiler (FrameProfiler): Профилировщик времени кадра.
+    """
+
+    KEY_PROFILER = pygame.K_F3
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        """
+        Создает единственный экземпляр класса (Singleton).
+
+        Returns:
+            SceneManager: Единственный экземпляр класса.
+        """
+        if cls._instance is None:
+            cls._instance = super(SceneManager, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Инициализирует Pygame и окно приложения.
+
+        Если окно нужного размера уже создано, используется оно.
+        """
+        if SceneManager._initialized:
+            return
+
+        pygame.init()
+        window = WindowPattern()
+        self.screen = pygame.display.get_surface()
+        if self.screen is None or self.screen.get_size() != window.get_screen_size():
+            self.screen = pygame.display.set_mode(window.get_screen_size())
+        pygame.display.set_caption(window.get_screen_caption())
+
+        self.fps = window.get_fps()
+        self.is_tick_busy_loop = window.get_tick_busy_loop()
+        self.is_running = False
+        self.profiler = FrameProfiler()
+        self._stack = []
+        self._clock = pygame.time.Clock()
+        SceneManager._initialized = True
+
+    def get_scene(self):
+        """
+        Возвращает сцену на вершине стека.
+
+        Returns:
+            Scene or None: Текущая сцена или None, если стек пуст.
+        """
+        return self._stack[-1] if self._stack else None
+
+    def get_depth(self):
+        """
+        Возвращает количество сцен в стеке.
+
+        Returns:
+            int: Глубина стека сцен.
+        """
+        return len(self._stack)
+
+    def push(self, scene):
+        """
+        Кладет сцену на вершину стека.
+
+        Args:
+            scene (Scene): Новая сцена.
+        """
+        self._stack.append(scene)
+        scene.on_enter()
+
+    def pop(self):
+        """
+        Снимает сцену с вершины стека и возвращается к предыдущей.
+
+        Если снята последняя сцена, главный цикл завершается.
+
+        Returns:
+            Scene or None: Снятая сцена.
+        """
+        scene = self._stack.pop() if self._stack else None
+        if self._stack:
+            self._stack[-1].on_enter()
+        return scene
+
+    def replace(self, scene):
+        """
+        Заменяет сцену на вершине стека.
+
+        Args:
+            scene (Scene): Новая сцена.
+        """
+        if self._stack:
+            self._stack.pop()
+        self.push(scene)
+
+    def pop_to_root(self):
+        """
+        Снимает все сцены, кроме нижней (главного меню).
+        """
+        if len(self._stack) > 1:
+            del self._stack[1:]
+            self._stack[0].on_enter()
+
+    def reset(self, scene):
+        """
+        Заменяет весь стек одной сценой.
+
+        Args:
+            scene (Scene): Новая корневая сцена.
+        """
+        self._stack.clear()
+        self.push(scene)
+
+    def quit(self):
+        """
+        Завершает главный цикл после текущего кадра.
+        """
+        self.is_running = False
+
+    def run(self, scene=None):
+        """
+        Запускает главный цикл приложения.
+
+        Args:
+            scene (Scene, optional): Начальная сцена, которая кладется в стек.
+        """
+        if scene is not None:
+            self.push(scene)
+
+        profiler = self.profiler
+        self.is_running = True
+        frame_time = 0.0
+        while self.is_running and self._stack:
+            scene = self._stack[-1]
+            time_start = time.perf_counter()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.is_running = False
+                elif event.type == pygame.KEYDOWN and event.key == self.KEY_PROFILER:
+                    profiler.toggle_overlay()
+                    scene.invalidate()
+                elif scene is self.get_scene():
+                    scene.handle_event(event)
+            time_events = time.perf_counter()
+
+            if scene is self.get_scene():
+                scene.update(frame_time)
+            time_update = time_draw = time.perf_counter()
+
+            if scene is self.get_scene():
+                scene.draw()
+                rect = profiler.draw_overlay(self.screen) if profiler.is_overlay else None
+                time_draw = time.perf_counter()
+                scene.present(rect)
+            time_present = time.perf_counter()
+
+            if self.is_tick_busy_loop:
+                frame_time = self._clock.tick_busy_loop(self.fps) / 1000
+            else:
+                frame_time = self._clock.tick(self.fps) / 1000
+            if profiler.is_enabled:
+                profiler.add_frame((time_events - time_start, time_update - time_events,
+                                    time_draw - time_update, time_present - time_draw,
+                                    time.perf_counter() - time_present))
+            if scene is not self.get_scene():
+                frame_time = 0.0
+
+        self._stack.clear()
+        pygame.quit()
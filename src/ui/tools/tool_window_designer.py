@@ -2,13 +2,16 @@
 Модуль для создания UI-элементов в Pygame.
 
 Содержит классы для управления паттернами окон, объектами UI
-(кнопки, изображения) и полями ввода текста.
+(кнопки, изображения), полями ввода текста и отрисовкой меню
+по грязным прямоугольникам.
 """
 
 import json
 import pygame
 
+from src.utils.utils_assets import AssetCache, TextCache
 from src.utils.utils_paths import Utils
+from src.utils.utils_profiler import FrameProfiler
 
 
 class WindowPattern:
@@ -23,6 +26,8 @@ class WindowPattern:
         screen_height (int): Высота окна приложения.
         screen_color (tuple): RGB цвет фона окна.
         screen_caption (str): Заголовок окна.
+        fps (int): Целевая частота кадров главного цикла (0 — без ограничения, "fps": null в конфигурации).
+        is_tick_busy_loop (bool): True, если кадр выдерживается через clock.tick_busy_loop.
         text_simple_color (tuple): RGB цвет обычного текста.
         text_successful_color (tuple): RGB цвет успешного текста.
         text_unsuccessful_color (tuple): RGB цвет неуспешного текста.
@@ -70,13 +75,15 @@ class WindowPattern:
         """
         Загружает ресурсы UI из конфигурационных JSON-файлов.
 
-        Загружает параметры окна (размер, цвет) и настройки текста
-        (цвета для различных состояний) из файлов конфигурации.
+        Загружает параметры окна (размер, цвет, частота кадров) и настройки
+        текста (цвета для различных состояний) из файлов конфигурации.
 
         Raises:
             FileNotFoundError: Если конфигурационные файлы не найдены.
             json.JSONDecodeError: Если JSON имеет неверный формат.
             KeyError: Если в JSON отсутствуют необходимые ключи.
+            ValueError: Если частота кадров не является положительным целым числом или null,
+                        либо tick_busy_loop не является логическим значением.
         """
         try:
             with open(Utils().get_asset_path('config_ui', 'config_ui_app.json'), 'r', encoding='utf-8') as file_app:
@@ -85,6 +92,19 @@ class WindowPattern:
                 self.screen_height = data['height']
                 color_data = data['color']
                 self.screen_color = tuple(color_data)
+                if 'asset_cache_mb' in data:
+                    AssetCache().set_budget(int(data['asset_cache_mb'] * 1024 * 1024))
+                if 'profiler' in data:
+                    FrameProfiler().set_mode(data['profiler'])
+                fps = data.get('fps', 60)
+                if fps is not None and (isinstance(fps, bool) or not isinstance(fps, int) or fps <= 0):
+                    print(f"Ошибка: частота кадров должна быть положительным целым числом или null: {fps}")
+                    raise ValueError(f"Некорректная частота кадров: {fps}")
+                self.fps = 0 if fps is None else fps
+                self.is_tick_busy_loop = data.get('tick_busy_loop', False)
+                if not isinstance(self.is_tick_busy_loop, bool):
+                    print(f"Ошибка: tick_busy_loop должен быть true или false: {self.is_tick_busy_loop}")
+                    raise ValueError(f"Некорректное значение tick_busy_loop: {self.is_tick_busy_loop}")
 
             with open(Utils().get_asset_path('config_ui', 'config_ui_text.json'), 'r', encoding='utf-8') as file_text:
                 data = json.load(file_text)
@@ -121,6 +141,24 @@ class WindowPattern:
         """
         return self.screen_color
 
+    def get_fps(self):
+        """
+        Возвращает целевую частоту кадров главного цикла.
+
+        Returns:
+            int: Кадров в секунду; 0 — частота не ограничена.
+        """
+        return self.fps
+
+    def get_tick_busy_loop(self):
+        """
+        Возвращает способ ожидания конца кадра.
+
+        Returns:
+            bool: True, если используется clock.tick_busy_loop.
+        """
+        return self.is_tick_busy_loop
+
     def get_screen_caption(self):
         """
         Возвращает заголовок окна приложения.
@@ -176,6 +214,118 @@ class WindowPattern:
         return fonts.get(size, self.text_middle_size)
 
 
+class DirtyRenderer:
+    """
+    Класс отрисовки меню по грязным прямоугольникам.
+
+    Окно перерисовывается целиком в первом кадре и в кадре после
+    invalidate() без аргументов (смена выбранного элемента, восстановление
+    окна). В остальных кадрах виджеты перерисовывают только свои области,
+    если их состояние изменилось, и отмечают их грязными; present() передает
+    на дисплей только эти области через pygame.display.update(rects).
+    Если ничего не изменилось, кадр не рисуется и дисплей не обновляется.
+
+    Attributes:
+        screen (pygame.Surface): Поверхность экрана.
+        background_color (tuple): RGB цвет фона окна.
+        count_presented (int): Количество кадров, переданных на дисплей.
+    """
+
+    EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                     pygame.WINDOWSIZECHANGED)
+
+    def __init__(self, screen, background_color):
+        """
+        Инициализирует отрисовку; первый кадр рисуется целиком.
+
+        Args:
+            screen (pygame.Surface): Поверхность экрана.
+            background_color (tuple): RGB цвет фона окна.
+        """
+        self.screen = screen
+        self.background_color = background_color
+        self.count_presented = 0
+        self._rects = []
+        self._is_full_redraw = True
+        self._is_full_requested = False
+
+    def invalidate(self, rect=None):
+        """
+        Отмечает область грязной.
+
+        Args:
+            rect (pygame.Rect, optional): Область экрана. По умолчанию запрашивается
+                                          полная перерисовка следующего кадра.
+        """
+        if rect is None:
+            self._is_full_requested = True
+        elif not self._is_full_redraw:
+            self._rects.append(pygame.Rect(rect))
+
+    def is_full_redraw(self):
+        """
+        Проверяет, рисуется ли текущий кадр целиком.
+
+        Returns:
+            bool: True, если окно нужно перерисовать полностью.
+        """
+        return self._is_full_redraw
+
+    def clear(self, rect):
+        """
+        Закрашивает область цветом фона и отмечает ее грязной.
+
+        Args:
+            rect (pygame.Rect): Область экрана.
+        """
+        self.screen.fill(self.background_color, rect)
+        self.invalidate(rect)
+
+    def handle_event(self, event):
+        """
+        Запрашивает полную перерисовку, если окно было перекрыто или восстановлено.
+
+        Args:
+            event (pygame.event.Event): Событие Pygame.
+        """
+        if event.type in self.EXPOSE_EVENTS:
+            self.invalidate()
+
+    def reset(self):
+        """
+        Начинает отрисовку заново: текущий кадр рисуется целиком.
+
+        Вызывается, когда окно снова становится активным и его содержимое
+        на экране было заменено другим окном.
+        """
+        self._rects = []
+        self._is_full_redraw = True
+        self._is_full_requested = False
+
+    def present(self):
+        """
+        Передает на дисплей грязные области кадра и начинает следующий кадр.
+
+        Полная перерисовка, запрошенная во время кадра (например, действием
+        кнопки), выполняется в следующем кадре.
+
+        Returns:
+            bool: True, если дисплей был обновлен.
+        """
+        if self._is_full_redraw:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+        is_presented = self._is_full_redraw or bool(self._rects)
+
+        self._is_full_redraw = self._is_full_requested
+        self._is_full_requested = False
+        self._rects = []
+        if is_presented:
+            self.count_presented += 1
+        return is_presented
+
+
 class WindowObject:
     """
     Класс для создания UI-объектов (кнопки, изображения).
@@ -194,9 +344,11 @@ class WindowObject:
         image (pygame.Surface): Изображение объекта (если есть).
         action (callable): Функция, вызываемая при клике.
         clicked (bool): Флаг состояния клика.
+        rect (pygame.Rect): Область объекта на экране.
     """
 
     _window_pattern = None
+    _theme_version = 0
 
     def __init__(self, screen, coordinate_x, coordinate_y, surface_width, surface_height,
                  radius, text=None, image=None, action=None):
@@ -222,16 +374,48 @@ class WindowObject:
         self.surface_width_stroke = 2
         self.radius = radius
 
+        self.text = text
+        self.image = image
+        self._load_theme()
+        # Кнопка срабатывает только на нажатие, начатое после ее появления:
+        # нажатие, которое открыло окно, не нажимает кнопки нового окна.
+        self.clicked = True
+        self.action = action
+        self.rect = pygame.Rect(coordinate_x, coordinate_y, surface_width, surface_height)
+        self._is_hovered_drawn = None
+        self._is_image_drawn = False
+
+    @classmethod
+    def reset_theme(cls):
+        """
+        Сбрасывает тему всех UI-объектов.
+
+        Цвета и шрифт перечитываются из WindowPattern, а готовые поверхности
+        объектов перерисовываются при следующей отрисовке.
+        """
+        cls._window_pattern = None
+        cls._theme_version += 1
+
+    def _load_theme(self):
+        """
+        Загружает цвета и шрифт текущей темы и сбрасывает готовые поверхности.
+        """
         if WindowObject._window_pattern is None:
             WindowObject._window_pattern = WindowPattern()
 
         self.button_on_color = WindowObject._window_pattern.button_enabled_color
         self.button_off_color = WindowObject._window_pattern.button_disabled_color
-        self.text = text
         self.font = WindowObject._window_pattern.get_font("small")
-        self.image = image
-        self.clicked = False
-        self.action = action
+        self._theme_version_loaded = WindowObject._theme_version
+        self._surface_image = None
+        self._surfaces_button = {}
+
+    def _check_theme(self):
+        """
+        Перезагружает тему, если она была сброшена после создания поверхностей.
+        """
+        if self._theme_version_loaded != WindowObject._theme_version:
+            self._load_theme()
 
     def set_image(self, new_image):
         """
@@ -241,14 +425,42 @@ class WindowObject:
             new_image (pygame.Surface): Новое изображение.
         """
         self.image = new_image
+        self._surface_image = None
+        self._is_image_drawn = False
 
-    def obj_image(self):
+    def obj_image(self, renderer=None):
         """
         Отрисовывает объект с изображением на экране.
 
+        Изображение со скругленными углами и рамкой собирается в
+        _get_image_surface один раз и хранится до set_image или смены темы,
+        поэтому в кадре выполняется один blit.
+
+        Args:
+            renderer (DirtyRenderer, optional): Отрисовка по грязным прямоугольникам.
+                                                Если задана, объект рисуется только при
+                                                полной перерисовке или после set_image.
+        """
+        if renderer is not None:
+            if self._is_image_drawn and not renderer.is_full_redraw():
+                return
+            renderer.clear(self.rect)
+            self._is_image_drawn = True
+
+        self._check_theme()
+        if self._surface_image is None:
+            self._surface_image = self._get_image_surface()
+        self.screen.blit(self._surface_image, (self.coordinate_x, self.coordinate_y))
+
+    def _get_image_surface(self):
+        """
+        Собирает поверхность объекта с изображением.
+
         Создает прямоугольную область со скругленными углами,
-        масштабирует изображение под размер области и отрисовывает
-        с рамкой на экране.
+        масштабирует изображение под размер области и добавляет рамку.
+
+        Returns:
+            pygame.Surface: Поверхность объекта.
         """
         surface = pygame.Surface((self.surface_width, self.surface_height), pygame.SRCALPHA)
         rect = pygame.Rect(0, 0, self.surface_width, self.surface_height)
@@ -263,43 +475,71 @@ class WindowObject:
         surface.blit(rounded_image, (0, 0))
 
         pygame.draw.rect(surface, (0, 0, 0), rect, self.surface_width_stroke, border_radius=self.radius)
-        self.screen.blit(surface, (self.coordinate_x, self.coordinate_y))
+        return surface.convert_alpha()
 
-    def obj_button_with_text(self):
+    def obj_button_with_text(self, renderer=None):
         """
         Отрисовывает интерактивную кнопку с текстом.
 
         Создает кнопку, которая меняет цвет при наведении мыши
         и выполняет действие при клике. Обрабатывает состояния
         наведения и клика для предотвращения множественных срабатываний.
+        Поверхности обычного состояния и наведения собираются один раз
+        и хранятся до смены текста или темы.
+
+        Args:
+            renderer (DirtyRenderer, optional): Отрисовка по грязным прямоугольникам.
+                                                Если задана, кнопка перерисовывается только
+                                                при полной перерисовке или смене наведения.
         """
         mouse = pygame.mouse.get_pos()
         click = pygame.mouse.get_pressed()
 
+        on_button = self.rect.collidepoint(mouse)
+
+        if on_button and click[0] == 1 and not self.clicked:
+            self.clicked = True
+            if self.action:
+                self.action()
+
+        if click[0] == 0:
+            self.clicked = False
+
+        if renderer is not None:
+            if on_button == self._is_hovered_drawn and not renderer.is_full_redraw():
+                return
+            renderer.clear(self.rect)
+            self._is_hovered_drawn = on_button
+
+        self._check_theme()
+        key = (self.text, on_button)
+        surface = self._surfaces_button.get(key)
+        if surface is None:
+            surface = self._surfaces_button[key] = self._get_button_surface(on_button)
+        self.screen.blit(surface, (self.coordinate_x, self.coordinate_y))
+
+    def _get_button_surface(self, on_button):
+        """
+        Собирает поверхность кнопки с текстом.
+
+        Args:
+            on_button (bool): True — кнопка под курсором (цвет активной кнопки).
+
+        Returns:
+            pygame.Surface: Поверхность кнопки.
+        """
         button_surface = pygame.Surface((self.surface_width, self.surface_height), pygame.SRCALPHA)
         rect = pygame.Rect(0, 0, self.surface_width, self.surface_height)
-        screen_rect = pygame.Rect(self.coordinate_x, self.coordinate_y, self.surface_width, self.surface_height)
-        on_button = screen_rect.collidepoint(mouse)
 
-        text_surface = self.font.render(self.text, True, (0, 0, 0))
+        text_surface = TextCache().render(self.font, self.text, (0, 0, 0))
         text_rect = text_surface.get_rect(center=(self.surface_width // 2, self.surface_height // 2))
 
-        if on_button:
-            pygame.draw.rect(button_surface, self.button_on_color, rect, border_radius=self.radius)
-
-            if click[0] == 1 and not self.clicked:
-                self.clicked = True
-                if self.action:
-                    self.action()
-        else:
-            pygame.draw.rect(button_surface, self.button_off_color, rect, border_radius=self.radius)
-
-        if click[0] == 0:
-            self.clicked = False
+        color = self.button_on_color if on_button else self.button_off_color
+        pygame.draw.rect(button_surface, color, rect, border_radius=self.radius)
 
         button_surface.blit(text_surface, text_rect)
         pygame.draw.rect(button_surface, (0, 0, 0), rect, self.surface_width_stroke, border_radius=self.radius)
-        self.screen.blit(button_surface, (self.coordinate_x, self.coordinate_y))
+        return button_surface.convert_alpha()
 
 
 class InputBox:
@@ -346,6 +586,8 @@ class InputBox:
         self.numbers_only = numbers_only
         self.is_rgb = is_rgb
         self.is_valid = True
+        self._state_drawn = None
+        self._rect_drawn = None
 
     def handle_event(self, event):
         """
@@ -408,7 +650,7 @@ class InputBox:
         width = max(200, self.txt_surface.get_width() + 10)
         self.rect.w = width
 
-    def draw(self, screen):
+    def draw(self, screen, renderer=None):
         """
         Отрисовывает поле ввода на экране.
 
@@ -417,7 +659,21 @@ class InputBox:
 
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
-        """
+            renderer (DirtyRenderer, optional): Отрисовка по грязным прямоугольникам.
+                                                Если задана, поле перерисовывается только
+                                                при полной перерисовке или изменении текста,
+                                                цвета или размера.
+        """
+        if renderer is not None:
+            state = (self.text, self.color, self.is_valid, tuple(self.rect))
+            if state == self._state_drawn and not renderer.is_full_redraw():
+                return
+            if self._rect_drawn is not None and not renderer.is_full_redraw():
+                renderer.clear(self._rect_drawn)
+            renderer.clear(self.rect)
+            self._state_drawn = state
+            self._rect_drawn = self.rect.copy()
+
         screen.blit(self.txt_surface, (self.rect.x + 5, self.rect.y + 5))
         border_color = (InputBox._window_pattern.get_text_colors("unsuccess") if not self.is_valid
                         else self.color)
@@ -5,15 +5,15 @@
 позволяющим пользователю изменять размер окна, цветовую схему и другие параметры UI.
 """
 
-import pygame
-import sys
 import json
 
-from src.ui.tools.tool_window_designer import WindowObject, WindowPattern, InputBox
+from src.ui.tools.tool_scene_manager import MenuScene, SceneManager
+from src.ui.tools.tool_window_designer import WindowObject, WindowPattern, InputBox, DirtyRenderer
+from src.utils.utils_assets import TextCache
 from src.utils.utils_paths import Utils
 
 
-class WindowSettings:
+class WindowSettings(MenuScene):
     """
     Класс окна настроек приложения.
 
@@ -24,12 +24,13 @@ class WindowSettings:
     Attributes:
         screen (pygame.Surface): Поверхность экрана для отрисовки.
         user: Объект текущего пользователя.
-        is_running (bool): Флаг работы окна.
         message_text (str): Текст сообщения для отображения.
-        message_timer (int): Таймер отображения сообщения в кадрах.
+        message_timer (float): Оставшееся время отображения сообщения в секундах.
         message_success (bool): Флаг успешности операции для выбора цвета сообщения.
     """
 
+    MESSAGE_TIME = 3.0
+
     def __init__(self, user):
         """
         Инициализирует окно настроек.
@@ -37,14 +38,12 @@ class WindowSettings:
         Args:
             user: Объект пользователя.
         """
-        pygame.init()
+        super().__init__()
 
         window = WindowPattern()
 
-        self.screen = pygame.display.set_mode(window.get_screen_size())
-        pygame.display.set_caption(window.screen_caption)
         self.screen_fill = window.get_screen_color()
-        self.screen.fill(self.screen_fill)
+        self.renderer = DirtyRenderer(self.screen, self.screen_fill)
 
         self.font_large = window.get_font("large")
         self.font_medium = window.get_font("medium")
@@ -57,8 +56,7 @@ class WindowSettings:
         self.user = user
         self._load_resources()
 
-        self.is_running = True
-        self.clock = pygame.time.Clock()
+        self._is_theme_changed = False
 
     def _load_resources(self):
         """
@@ -124,6 +122,7 @@ class WindowSettings:
         self.message_text = ""
         self.message_timer = 0
         self.message_success = False
+        self._message_rect = None
 
         self.label_x = label_x
         self.input_x = input_x
@@ -170,12 +169,14 @@ class WindowSettings:
         """
         Возвращает пользователя в стартовое окно.
 
-        Закрывает текущее окно настроек и открывает стартовое окно.
+        Снимает окно настроек со стека сцен. Если цвета темы были изменены,
+        главное меню создается заново, чтобы отрисоваться в новых цветах.
         """
-        from src.ui.windows.window_start import WindowStart
-        start = WindowStart(self.user)
-        self.is_running = False
-        start.run()
+        if self._is_theme_changed:
+            from src.ui.windows.window_start import WindowStart
+            SceneManager().reset(WindowStart(self.user))
+        else:
+            SceneManager().pop()
 
     def _validate_rgb_value(self, value):
         """
@@ -249,12 +250,14 @@ class WindowSettings:
             success_color = [success_r, success_g, success_b]
             error_color = [error_r, error_g, error_b]
 
+            app_settings = self._load_app_settings()
+            app_settings.update({
+                'width': width,
+                'height': height,
+                'color': bg_color
+            })
             with open(Utils().get_asset_path('config_ui', 'config_ui_app.json'), 'w', encoding='utf-8') as file:
-                json.dump({
-                    'width': width,
-                    'height': height,
-                    'color': bg_color
-                }, file, indent=2, ensure_ascii=False)
+                json.dump(app_settings, file, indent=2, ensure_ascii=False)
 
             with open(Utils().get_asset_path('config_ui', 'config_ui_text.json'), 'w', encoding='utf-8') as file:
                 json.dump({
@@ -265,6 +268,9 @@ class WindowSettings:
 
             WindowPattern._initialized = False
             WindowPattern._instance = None
+            TextCache().clear()
+            WindowObject.reset_theme()
+            self._is_theme_changed = True
 
             self.show_message("Настройки применены! Перезапустите приложение.", True)
 
@@ -304,12 +310,14 @@ class WindowSettings:
                 g_input.text = str(color[1])
                 b_input.text = str(color[2])
 
+            app_settings = self._load_app_settings()
+            app_settings.update({
+                'width': defaults['width'],
+                'height': defaults['height'],
+                'color': defaults['bg_color']
+            })
             with open(Utils().get_asset_path('config_ui', 'config_ui_app.json'), 'w', encoding='utf-8') as file:
-                json.dump({
-                    'width': defaults['width'],
-                    'height': defaults['height'],
-                    'color': defaults['bg_color']
-                }, file, indent=2, ensure_ascii=False)
+                json.dump(app_settings, file, indent=2, ensure_ascii=False)
 
             with open(Utils().get_asset_path('config_ui', 'config_ui_text.json'), 'w', encoding='utf-8') as file:
                 json.dump({
@@ -320,6 +328,9 @@ class WindowSettings:
 
             WindowPattern._initialized = False
             WindowPattern._instance = None
+            TextCache().clear()
+            WindowObject.reset_theme()
+            self._is_theme_changed = True
 
             self.show_message("Настройки сброшены! Перезапустите приложение.", True)
 
@@ -337,99 +348,91 @@ class WindowSettings:
                            False для сообщения об ошибке (красный).
         """
         self.message_text = text
-        self.message_timer = 180
+        self.message_timer = self.MESSAGE_TIME
         self.message_success = success
+        self._clear_message()
 
-    def _handle_events(self):
+    def handle_event(self, event):
         """
-        Обрабатывает события Pygame.
+        Обрабатывает событие Pygame.
+
+        Запрашивает полную перерисовку после восстановления окна и передает
+        событие всем полям ввода для обработки ввода с клавиатуры и мыши.
 
-        Обрабатывает события закрытия окна и передает события
-        всем полям ввода для обработки ввода с клавиатуры и мыши.
+        Args:
+            event (pygame.event.Event): Событие Pygame.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.is_running = False
-
-            input_boxes = [
-                self.input_width, self.input_height,
-                self.input_bg_r, self.input_bg_g, self.input_bg_b,
-                self.input_text_r, self.input_text_g, self.input_text_b,
-                self.input_success_r, self.input_success_g, self.input_success_b,
-                self.input_error_r, self.input_error_g, self.input_error_b
-            ]
+        super().handle_event(event)
 
-            for input_box in input_boxes:
-                input_box.handle_event(event)
+        input_boxes = [
+            self.input_width, self.input_height,
+            self.input_bg_r, self.input_bg_g, self.input_bg_b,
+            self.input_text_r, self.input_text_g, self.input_text_b,
+            self.input_success_r, self.input_success_g, self.input_success_b,
+            self.input_error_r, self.input_error_g, self.input_error_b
+        ]
 
-    def draw(self):
-        """
-        Отрисовывает все элементы окна настроек.
+        for input_box in input_boxes:
+            input_box.handle_event(event)
 
-        Рисует фон, заголовок, все текстовые метки, поля ввода,
-        кнопки и временное сообщение (если активно).
+    def update(self, frame_time):
         """
-        self.screen.fill(self.screen_fill)
+        Отсчитывает время показа временного сообщения и стирает его по истечении.
 
-        title_rect = self.text_title.get_rect(center=(400, 50))
-        self.screen.blit(self.text_title, title_rect)
+        Args:
+            frame_time (float): Длительность предыдущего кадра в секундах.
+        """
+        if self.message_timer > 0:
+            self.message_timer -= frame_time
+            if self.message_timer <= 0:
+                self._clear_message()
 
-        self.button_back.obj_button_with_text()
+    def draw(self):
+        """
+        Отрисовывает все элементы окна настроек.
 
-        self.screen.blit(self.text_window_size, (50, 100))
-        self.input_width.draw(self.screen)
-        self.screen.blit(self.text_x, (450, 105))
-        self.input_height.draw(self.screen)
+        Фон, заголовок и текстовые метки рисуются только при полной перерисовке.
+        Поля ввода перерисовываются при изменении текста или цвета, кнопки — при
+        смене наведения, временное сообщение — при появлении и исчезновении.
+        """
+        if self.renderer.is_full_redraw():
+            self.screen.fill(self.screen_fill)
 
-        self.screen.blit(self.text_bg_color, (50, 150))
-        self.input_bg_r.draw(self.screen)
-        self.input_bg_g.draw(self.screen)
-        self.input_bg_b.draw(self.screen)
+            title_rect = self.text_title.get_rect(center=(400, 50))
+            self.screen.blit(self.text_title, title_rect)
 
-        self.screen.blit(self.text_normal_color, (50, 200))
-        self.input_text_r.draw(self.screen)
-        self.input_text_g.draw(self.screen)
-        self.input_text_b.draw(self.screen)
+            self.screen.blit(self.text_window_size, (50, 100))
+            self.screen.blit(self.text_x, (450, 105))
+            self.screen.blit(self.text_bg_color, (50, 150))
+            self.screen.blit(self.text_normal_color, (50, 200))
+            self.screen.blit(self.text_success_color_label, (50, 250))
+            self.screen.blit(self.text_error_color_label, (50, 300))
+            self._message_rect = None
 
-        self.screen.blit(self.text_success_color_label, (50, 250))
-        self.input_success_r.draw(self.screen)
-        self.input_success_g.draw(self.screen)
-        self.input_success_b.draw(self.screen)
+        self.button_back.obj_button_with_text(self.renderer)
 
-        self.screen.blit(self.text_error_color_label, (50, 300))
-        self.input_error_r.draw(self.screen)
-        self.input_error_g.draw(self.screen)
-        self.input_error_b.draw(self.screen)
+        for input_box in (self.input_width, self.input_height,
+                          self.input_bg_r, self.input_bg_g, self.input_bg_b,
+                          self.input_text_r, self.input_text_g, self.input_text_b,
+                          self.input_success_r, self.input_success_g, self.input_success_b,
+                          self.input_error_r, self.input_error_g, self.input_error_b):
+            input_box.draw(self.screen, self.renderer)
 
-        self.button_apply.obj_button_with_text()
-        self.button_reset.obj_button_with_text()
+        self.button_apply.obj_button_with_text(self.renderer)
+        self.button_reset.obj_button_with_text(self.renderer)
 
         if self.message_timer > 0:
-            color = self.text_success_color if self.message_success else self.text_error_color
-            message_surface = self.font_small.render(self.message_text, True, color)
-            message_rect = message_surface.get_rect(center=(400, 420))
-            self.screen.blit(message_surface, message_rect)
-            self.message_timer -= 1
-
-    def run(self):
-        """
-        Запускает главный цикл окна настроек.
-
-        Обрабатывает события, отрисовывает UI и обновляет экран
-        с частотой 60 кадров в секунду до закрытия окна.
-        """
-        while self.is_running:
-            self._handle_events()
-            self.draw()
-
-            pygame.display.flip()
-            self.clock.tick(60)
-        self.quit()
-
-    @staticmethod
-    def quit():
+            if self._message_rect is None:
+                color = self.text_success_color if self.message_success else self.text_error_color
+                message_surface = self.font_small.render(self.message_text, True, color)
+                self._message_rect = message_surface.get_rect(center=(400, 420))
+                self.screen.blit(message_surface, self._message_rect)
+                self.renderer.invalidate(self._message_rect)
+
+    def _clear_message(self):
         """
-        Завершает работу Pygame и выходит из программы.
+        Стирает с экрана показанное временное сообщение.
         """
-        pygame.quit()
-        sys.exit()
+        if self._message_rect is not None:
+            self.renderer.clear(self._message_rect)
+            self._message_rect = None
@@ -5,312 +5,322 @@
 включая обработку событий, обновление состояния игры и отрисовку.
 """
 
-import datetime
-import sys
 import random
+import time
 
 import pygame
 
-from src.ui.tools.tool_window_designer import WindowPattern
+from src.game.game_ghost import GhostCar
+from src.game.game_race import Race
+from src.game.game_replay import Replay
+from src.game.game_shift_solver import ShiftSolver
+from src.ui.tools.tool_scene_manager import Scene, SceneManager
 from src.ui.windows.window_track_manager import Background
+from src.utils.utils_paths import Utils
 
 
-class RaceManager:
+class RaceManager(Scene):
     """
     Класс менеджера гонки.
 
     Управляет игровым процессом гонки: обрабатывает ввод пользователя,
-    обновляет состояние автомобиля и трека, отрисовывает игровые элементы
-    и подсчитывает результаты гонки.
+    передает его в логику заезда Race, отрисовывает игровые элементы
+    и подсчитывает результаты гонки. Экран финиша показывается FINISH_DELAY
+    секунд, после чего менеджер сцен возвращается в главное меню. Если
+    профилировщик кадров записывает кадры, в конце заезда его отчет
+    сохраняется в assets/cache/profiles.
 
     Attributes:
         user: Объект пользователя.
         car (Car): Объект автомобиля игрока.
         track: Объект трека гонки.
-        speeds (list): Список скоростей для расчета средней скорости.
-        count_lose_shift (int): Количество неудачных переключений передач.
-        frames_warning (int): Таймер отображения предупреждения о плохом переключении.
-        frames_after_shift (int): Таймер блокировки переключения после переключения передачи.
-        time_start_race (datetime.datetime): Время начала гонки.
+        race (Race): Логика заезда: светофор, переключения, таймеры и финиш.
+        simulation_clock (SimulationClock): Часы симуляции с фиксированным шагом.
+        shift_points (dict or None): Оптимальные обороты переключения из кэша ShiftSolver.
+        replay (Replay): Запись заезда: зерно светофора и нажатия клавиш по шагам физики.
+        ghost_track (GhostTrack or None): Траектория призрака лучшего заезда.
     """
 
-    def __init__(self, car, track, user, stock_car_for_mode=None):
+    FINISH_DELAY = 3.0
+
+    def __init__(self, car, track, user, stock_car_for_mode=None, simulation_clock=None, ghost_track=None):
         """
         Инициализирует менеджер гонки.
 
+        Автомобиль и трек возвращаются в состояние перед стартом: окно
+        настроек гонки переиспользует их между заездами.
+
         Args:
             car (Car): Объект автомобиля игрока.
             track: Объект трека гонки.
             user: Объект пользователя.
             stock_car_for_mode: Дополнительный автомобиль для определенных режимов (не используется).
+            simulation_clock (SimulationClock, optional): Часы симуляции с шагом PHYSICS_STEP.
+                                                          По умолчанию создаются часы на 60 шагов
+                                                          в секунду.
+            ghost_track (GhostTrack, optional): Траектория призрака. Если задана, рядом
+                                                с автомобилем едет полупрозрачный призрак.
+
+        Raises:
+            ValueError: Если шаг часов симуляции отличается от PHYSICS_STEP: расстояние,
+                        прокрутка фона и штраф считаются за шаг стандартной длительности.
         """
-        pygame.init()
-        window = WindowPattern()
+        super().__init__()
         self.user = user
-        self._screen_width, self._screen_height = window.get_screen_size()
-
-        self._screen = pygame.display.set_mode((self._screen_width, self._screen_height))
-        pygame.display.set_caption(window.get_screen_caption())
+        self._screen_width, self._screen_height = self.screen.get_size()
 
         self.car = car
         self.track = track
+        self.car.reset()
+        self.track.reset()
 
-        self.track.screen = self._screen
+        self.track.screen = self.screen
+        self.ghost_track = ghost_track
         self._create_instances()
 
-        self.speeds = [0]
-        self.count_lose_shift = 0
-        self.time_start_race = None
+        seed = random.getrandbits(32)
+        self.race = Race(self.car, self.track, seed, simulation_clock)
+        self.simulation_clock = self.race.simulation_clock
+        self._ticks_race_begin = self.simulation_clock.ticks
+        self.replay = Replay(self.car.name, self.track.name, seed, round(1 / self.simulation_clock.step))
+        self.shift_points = ShiftSolver().get_cached(self.car)
 
         if self.car.animation == True:
             self.state = 0
+            self.car.set_frame(self.state)
             self.anim_timer = 1
             self.min_anim_delay = 1
             self.max_anim_delay = 3
             self.speed_for_max_spin = 200
 
-        self.frames_warning = 0
-        self.frames_after_shift = 0
-        self.frames_boost = 0
-        self.frames_start = 0
-        self.frames_bad_shift_penalty = 0
-
-        self.frames_traffic_total = random.randint(300, 480)
-        self.frames_traffic = self.frames_traffic_total
-
-        self._generate_traffic_phases()
-
-        self._is_false_start = False
-        self._is_good_shift = True
-        self._is_boost = False
-
-        self._is_running = True
-        self._is_start = False
-        self._is_finished = False
-
-        self._clock = pygame.time.Clock()
-
-    def _generate_traffic_phases(self):
-        """
-        Генерирует случайные длительности для каждой фазы светофора.
-
-        Разделяет общее время светофора на 4 рандомные части для каждого ряда огней.
-        Гарантирует, что сумма всех фаз равна общему времени.
-        """
-        total = self.frames_traffic_total
-
-        split1 = random.randint(int(total * 0.1), int(total * 0.4))
-        split2 = random.randint(int(total * 0.1), int(total * 0.4))
-        split3 = random.randint(int(total * 0.1), int(total * 0.4))
-
-        split4 = total - split1 - split2 - split3
-
-        if split4 < int(total * 0.1):
-            quarter = total // 4
-            split1 = quarter + random.randint(-20, 20)
-            split2 = quarter + random.randint(-20, 20)
-            split3 = quarter + random.randint(-20, 20)
-            split4 = total - split1 - split2 - split3
-
-        self.traffic_phase_4 = split4
-        self.traffic_phase_3 = split4 + split3
-        self.traffic_phase_2 = split4 + split3 + split2
-        self.traffic_phase_1 = total
+        self._is_finish_drawn = False
+        self._is_finish_presented = False
+        self._time_finish_left = self.FINISH_DELAY
 
     def _create_instances(self):
         """
         Создает игровые объекты и группы спрайтов.
 
-        Инициализирует дорогу, автомобиль и группу спрайтов для отрисовки.
+        Инициализирует дорогу, автомобиль, призрака (если задан)
+        и группу спрайтов для отрисовки.
         """
         self._road = self.track
         self._car = self.car
         self._cars = pygame.sprite.Group()
         self._cars.add(self._car)
 
-    def _handle_events(self):
+        self._ghost = None
+        if self.ghost_track is not None:
+            self._ghost = GhostCar(self._car, self.ghost_track)
+            self._cars.add(self._ghost)
+
+    def handle_event(self, event):
         """
-        Обрабатывает события Pygame.
+        Обрабатывает событие Pygame.
 
-        Обрабатывает события закрытия окна и нажатия клавиш.
+        Передает нажатия клавиш в _handle_keydown.
+
+        Args:
+            event (pygame.event.Event): Событие Pygame.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self._is_running = False
-            elif event.type == pygame.KEYDOWN:
-                self._handle_keydown(event)
+        if event.type == pygame.KEYDOWN:
+            self._handle_keydown(event)
 
     def _handle_keydown(self, event):
         """
         Обрабатывает события нажатия клавиш.
 
-        Обрабатывает переключение передач по нажатию стрелки вверх,
-        проверяет корректность переключения и устанавливает флаги буста.
+        Передает нажатие в логику заезда: любая клавиша до зеленого сигнала
+        означает фальстарт, стрелка вверх переключает передачу.
+        Нажатие записывается в replay с номером текущего шага физики.
 
         Args:
             event (pygame.event.Event): Событие нажатия клавиши.
         """
-        if not self._is_start:
-            self._is_false_start = True
-            self._is_start = True
-            self.start_race()
-            self.frames_start = 60
-
-        if event.key == pygame.K_UP and self.frames_after_shift <= 0 and not self._is_finished:
-            current_gear = self._car.current_gear
-            if current_gear < self._car.engine.count_gear:
-                new_gear = current_gear + 1
-
-                self._is_boost = self._car.engine.is_boost()
-                self._is_good_shift = self._car.shift_gear(new_gear)
-                self.frames_after_shift = self._car.frames_after_shift
-
-                if not self._is_good_shift:
-                    self.count_lose_shift += 1
-                    self.frames_warning = 60
-                    self.frames_bad_shift_penalty = 60
+        if self.race.is_finished:
+            return
 
-    def _update_game_state(self):
-        """
-        Обновляет состояние игры на каждом кадре.
+        is_shift_key = event.key == pygame.K_UP
+        self.replay.add_event(self.simulation_clock.ticks - self._ticks_race_begin, is_shift_key)
+        self.race.press_key(is_shift_key)
 
-        Обновляет состояние автомобиля, записывает текущую скорость,
-        обновляет таймеры и проверяет завершение гонки.
+    def _save_replay(self):
         """
-        if self.car.animation == True:
-            current_speed = self._car.engine.get_current_speed()
+        Сохраняет запись завершенного заезда в директорию записей пользователя.
 
-            k = min(current_speed / self.speed_for_max_spin, 1)
-
-            anim_delay = int(self.max_anim_delay - k * (self.max_anim_delay - self.min_anim_delay))
-            anim_delay = max(self.min_anim_delay, anim_delay)
-
-            if self.anim_timer <= 0 and current_speed != 0:
-                if self.state < 7:
-                    self.state += 1
-                else:
-                    self.state = 0
-                self.car._load_image(self.state)
-                self.anim_timer = anim_delay
-            else:
-                self.anim_timer -= 1
-
-        if not self._is_start:
+        Заезды с фальстартом не сохраняются: они не подходят ни для призрака,
+        ни для проверки лучшего времени. После сохранения на автомобиле и треке
+        остаются только Replay.MAX_PER_TRACK лучших записей.
+        """
+        race = self.race
+        if race.is_false_start:
             return
 
-        if self._is_finished:
+        self.replay.ticks_finish = self.simulation_clock.ticks - race.ticks_start_race
+        try:
+            self.replay.save(self.replay.get_path(self.user.name))
+            Replay.prune(self.user.name, self.car.name, self.track.name)
+        except (IOError, ValueError) as e:
+            print(f"Ошибка записи заезда пользователя '{self.user.name}': {e}")
+
+    def _export_profile(self):
+        """
+        Сохраняет отчет профилировщика о кадрах заезда, если кадры записывались.
+        """
+        profiler = SceneManager().profiler
+        if not profiler.is_enabled:
             return
 
-        is_good_for_update = self.frames_bad_shift_penalty <= 0
-        self._car.update(is_good_for_update)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        path = Utils().get_asset_path('cache', 'profiles', f'profile_{self.car.name}_{stamp}.json')
+        try:
+            profiler.export_json(path, {
+                'car': self.car.name,
+                'track': self.track.name,
+                'fps': SceneManager().fps,
+                'time_spend': self.race.get_time_spend()
+            })
+            print(f"Профиль кадров заезда сохранен: {path}")
+        except IOError as e:
+            print(f"Ошибка записи профиля кадров: {e}")
+
+    def _update_animation(self):
+        """
+        Переключает кадр анимации автомобиля на одном шаге физики.
 
-        self.frames_boost = self._car.boost_frames_remaining
-        self.speeds.append(self._car.engine.get_current_speed())
+        Чем выше скорость, тем меньше задержка между кадрами анимации.
+        Кадры заранее загружены в кэш кадров Car, поэтому переключение
+        не читает файлы.
+        """
+        current_speed = self._car.engine.get_current_speed()
 
-        if self.frames_traffic > 0 and self._is_false_start == True:
-            self.frames_traffic -= 1
+        k = min(current_speed / self.speed_for_max_spin, 1)
 
-        if self.frames_warning > 0:
-            self.frames_warning -= 1
+        anim_delay = int(self.max_anim_delay - k * (self.max_anim_delay - self.min_anim_delay))
+        anim_delay = max(self.min_anim_delay, anim_delay)
 
-        if self.frames_after_shift > 0:
-            self.frames_after_shift -= 1
+        if self.anim_timer <= 0 and current_speed != 0:
+            if self.state < self.car.count_frames - 1:
+                self.state += 1
+            else:
+                self.state = 0
+            self.car.set_frame(self.state)
+            self.anim_timer = anim_delay
+        else:
+            self.anim_timer -= 1
 
-        if self.frames_start > 0:
-            self.frames_start -= 1
+    def _update_game_state(self):
+        """
+        Обновляет состояние игры на одном шаге физики.
 
-        if self.frames_bad_shift_penalty > 0:
-            self.frames_bad_shift_penalty -= 1
-            if self.frames_bad_shift_penalty == 0:
-                self._is_good_shift = True
+        Переключает кадр анимации автомобиля и выполняет шаг логики заезда.
+        """
+        if self.car.animation == True:
+            self._update_animation()
 
-        self._is_finished = self._road.update(self._car.speed)
+        self.race.step()
 
-    def _draw(self):
+    def _draw(self, alpha=1.0):
         """
         Отрисовывает все элементы игры.
 
         Рисует дорогу, автомобиль, светофор (если не начата гонка),
         HUD, предупреждения, индикатор буста и экран финиша при завершении гонки.
-        """
-        self._road.draw(self._screen)
-        self._cars.draw(self._screen)
 
-        if not self._is_start or self.frames_traffic != 0:
-            if self._is_false_start == True:
-                Background.traffic(self._screen, "red")
+        Args:
+            alpha (float): Доля шага физики для интерполяции прокрутки фона.
+        """
+        race = self.race
+
+        self._road.draw(self.screen, alpha)
+        if self._ghost is not None:
+            ticks = 0
+            if race.ticks_start_race is not None:
+                ticks = self.simulation_clock.ticks - race.ticks_start_race
+            self._ghost.set_position(ticks, self._road.get_scroll_offset(alpha), alpha)
+        self._cars.draw(self.screen)
+
+        traffic_state = race.get_traffic_state()
+        if traffic_state is not None:
+            Background.traffic(self.screen, traffic_state)
+
+        shift_revolutions = None
+        if self.shift_points is not None:
+            shift_revolutions = self.shift_points['shift_revolutions'].get(self._car.current_gear)
+        Background.draw_hud(self.screen, self._car, 10, 30, 200, 20, shift_revolutions)
+
+        if race.frames_warning > 0:
+            Background.draw_not_good_shift(self.screen, self._screen_width, self._screen_height)
+
+        if race.frames_boost > 0:
+            Background.draw_boost(self.screen, self._screen_width, self._screen_height)
+
+        if race.frames_start > 0:
+            if race.is_false_start:
+                Background.draw_false_start(self.screen)
             else:
-                if self.frames_traffic > self.traffic_phase_2:
-                    Background.traffic(self._screen, "yellow_1")
-                elif self.frames_traffic > self.traffic_phase_3:
-                    Background.traffic(self._screen, "yellow_2")
-                elif self.frames_traffic > self.traffic_phase_4:
-                    Background.traffic(self._screen, "yellow_3")
-                elif self.frames_traffic <= self.traffic_phase_4:
-                    Background.traffic(self._screen, "green")
-
-            self.frames_traffic -= 1
+                Background.draw_start(self.screen)
 
-            if self.frames_traffic == self.traffic_phase_4:
-                self._is_start = True
-                self.start_race()
-                self.frames_start = 60
+        if race.is_finished:
+            self._save_replay()
+            self._export_profile()
+            Background.draw_finish(self.screen, self._screen_width, self._screen_height,
+                                   race.get_time_spend(), race.is_false_start, race.get_speed_average(),
+                                   race.count_lose_shift, self.car, self.user)
+            self._is_finish_drawn = True
 
-        Background.draw_hud(self._screen, self._car, 10, 30, 200, 20)
-
-        if self.frames_warning > 0:
-            Background.draw_not_good_shift(self._screen, self._screen_width, self._screen_height)
+    def on_enter(self):
+        """
+        Начинает запись кадров профилировщика заново, чтобы отчет описывал только этот заезд.
+        """
+        SceneManager().profiler.reset()
 
-        if self.frames_boost > 0:
-            Background.draw_boost(self._screen, self._screen_width, self._screen_height)
+    def update(self, frame_time):
+        """
+        Выполняет накопленные шаги физики фиксированной длительности.
 
-        if self.frames_start > 0:
-            if self._is_false_start == True:
-                Background.draw_false_start(self._screen)
-            else:
-                Background.draw_start(self._screen)
+        Время кадра влияет только на количество шагов, но не на их результат.
+        После финиша отсчитывает время показа экрана финиша и возвращает
+        в главное меню.
 
-        if self._is_finished:
-            Background.draw_finish(self._screen, self._screen_width, self._screen_height,
-                                   self.time_start_race, self._is_false_start, self.speeds, self.count_lose_shift, self.car, self.user)
-            pygame.display.flip()
-            pygame.time.wait(3000)
+        Args:
+            frame_time (float): Длительность предыдущего кадра в секундах.
+        """
+        if self._is_finish_drawn:
+            self._time_finish_left -= frame_time
+            if self._time_finish_left <= 0:
+                SceneManager().pop_to_root()
+            return
 
-            from src.ui.windows.window_start import WindowStart
-            start = WindowStart(self.user)
-            self._is_running = False
-            start.run()
+        for _ in range(self.simulation_clock.advance(frame_time)):
+            self._update_game_state()
+            if self.race.is_finished:
+                break
 
-    def start_race(self):
+    def draw(self):
         """
-        Запускает гонку.
+        Отрисовывает кадр гонки.
 
-        Инициирует ускорение двигателя автомобиля и фиксирует время старта.
+        Экран финиша рисуется один раз и остается на экране до возврата
+        в главное меню.
         """
-        self._car.start_engine()
-        self.time_start_race = datetime.datetime.now()
+        if self._is_finish_drawn:
+            return
 
-    def run(self):
-        """
-        Запускает главный игровой цикл.
+        self._draw(self.simulation_clock.alpha)
 
-        Обрабатывает события, обновляет состояние игры и отрисовывает кадры
-        с частотой 60 FPS до завершения гонки или закрытия окна.
+    def present(self, rect=None):
         """
-        while self._is_running:
-            self._handle_events()
-            self._update_game_state()
-            self._draw()
+        Передает кадр на дисплей.
 
-            pygame.display.flip()
-            self._clock.tick(60)
+        После показа экрана финиша дисплей обновляется, только если поверх
+        него нарисован оверлей.
 
-        self.quit()
-
-    @staticmethod
-    def quit():
-        """
-        Завершает работу Pygame и выходит из программы.
+        Args:
+            rect (pygame.Rect, optional): Область, нарисованная поверх кадра после draw().
         """
-        pygame.quit()
-        sys.exit()
+        if self._is_finish_presented and rect is None:
+            return
+
+        pygame.display.flip()
+        self._is_finish_presented = self._is_finish_drawn
@@ -5,17 +5,19 @@
 трека и режима игры перед началом гонки.
 """
 
-import sys
 import pygame
 
-from src.ui.tools.tool_window_designer import WindowObject, WindowPattern
+from src.ui.tools.tool_scene_manager import MenuScene, SceneManager
+from src.ui.tools.tool_window_designer import WindowObject, WindowPattern, DirtyRenderer
 from src.ui.windows.window_race_manager import RaceManager
+from src.utils.utils_assets import AssetCache
 from src.utils.utils_paths import Utils
 from src.game.game_car import Car
+from src.game.game_ghost import GhostTrack
 from src.ui.windows.window_track_manager import WindowBackgroundSegments
 
 
-class RaceSettings:
+class RaceSettings(MenuScene):
     """
     Класс настроек гонки.
 
@@ -23,6 +25,11 @@ class RaceSettings:
     Проверяет доступность выбранных элементов на основе счета пользователя
     и позволяет начать гонку при выполнении всех условий.
 
+    Каталог автомобилей и треков загружается один раз: главное меню хранит
+    экземпляр окна и переиспользует его между посещениями, а при входе
+    в окно обновляются только статусы доступности и тексты по текущему
+    счету пользователя.
+
     Attributes:
         user: Объект текущего пользователя.
         screen (pygame.Surface): Поверхность экрана для отрисовки.
@@ -32,7 +39,6 @@ class RaceSettings:
         car_current_index (int): Индекс текущего выбранного автомобиля.
         is_not_locked_car (bool): Флаг доступности выбранного автомобиля.
         is_not_locked_track (bool): Флаг доступности выбранного трека.
-        is_running (bool): Флаг работы окна.
     """
 
     def __init__(self, user):
@@ -42,13 +48,11 @@ class RaceSettings:
         Args:
             user: Объект пользователя.
         """
-        pygame.init()
+        super().__init__()
         window = WindowPattern()
 
-        self.screen = pygame.display.set_mode(window.get_screen_size())
-        pygame.display.set_caption(window.get_screen_caption())
         self.screen_fill = window.get_screen_color()
-        self.screen.fill(self.screen_fill)
+        self.renderer = DirtyRenderer(self.screen, self.screen_fill)
 
         self.font_large = window.get_font("large")
         self.font_middle = window.get_font("medium")
@@ -75,12 +79,6 @@ class RaceSettings:
 
         self._load_resources()
 
-        self.is_not_locked_car = False
-        self.is_not_locked_track = False
-        self.is_running = True
-
-        self.clock = pygame.time.Clock()
-
     def _load_resources(self):
         """
         Загружает ресурсы и создает UI-элементы окна настроек.
@@ -93,18 +91,19 @@ class RaceSettings:
 
         self.is_not_locked_car = self.get_status_access_to_car()
         self.is_not_locked_track = self.get_status_access_to_track()
+        self._score_shown = self.user.score
 
         try:
-            self.image_track = pygame.image.load(
-                Utils().get_resource_path('images', 'tracks', self.track_current.image)).convert_alpha()
+            self.image_track = AssetCache().get_image(
+                Utils().get_resource_path('images', 'tracks', self.track_current.image))
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки изображения трека: {e}")
             self.image_track = pygame.Surface((200, 100))
             self.image_track.fill((100, 100, 100))
 
         try:
-            self.image_car = pygame.image.load(
-                Utils().get_resource_path('images', 'cars',f'car_{self.car_current.name}', f'car_{self.car_current.name}_state{0}.png')).convert_alpha()
+            self.image_car = AssetCache().get_image(
+                Utils().get_resource_path('images', 'cars',f'car_{self.car_current.name}', f'car_{self.car_current.name}_state{0}.png'))
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки изображения автомобиля: {e}")
             self.image_car = pygame.Surface((200, 100))
@@ -131,9 +130,12 @@ class RaceSettings:
         self.button_car_right_choice = WindowObject(self.screen, 350, 320, 30, 30,
                                                     10, ">", None, self.next_car)
 
-        self.button_mode_alone = WindowObject(self.screen, 300, 450, 225, 125,
+        self.button_mode_alone = WindowObject(self.screen, 150, 450, 225, 125,
                                               15, "! Погнали !", None, self.switch_to_race)
 
+        self.button_mode_ghost = WindowObject(self.screen, 425, 450, 225, 125,
+                                              15, "С призраком", None, self.switch_to_race_with_ghost)
+
         self.text_choice_track = self.font_middle.render("Выберите карту", True, self.text_color_simple)
         self.text_choice_car = self.font_middle.render("Выберите машину", True, self.text_color_simple)
 
@@ -161,12 +163,9 @@ class RaceSettings:
         """
         Возвращает пользователя в стартовое окно.
 
-        Закрывает текущее окно настроек и открывает стартовое окно.
+        Снимает окно настроек гонки со стека сцен.
         """
-        from src.ui.windows.window_start import WindowStart
-        start = WindowStart(self.user)
-        self.is_running = False
-        start.run()
+        SceneManager().pop()
 
     def previous_track(self):
         """
@@ -214,8 +213,8 @@ class RaceSettings:
         self.track_current = self.list_tracks[self.track_current_index]
 
         try:
-            new_image = pygame.image.load(
-                Utils().get_resource_path('images', 'tracks', self.track_current.image)).convert_alpha()
+            new_image = AssetCache().get_image(
+                Utils().get_resource_path('images', 'tracks', self.track_current.image))
             self.button_track.set_image(new_image)
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки изображения трека {self.track_current.name}: {e}")
@@ -225,6 +224,7 @@ class RaceSettings:
 
         self.is_not_locked_track = self.get_status_access_to_track()
         self._update_current_texts()
+        self.renderer.invalidate()
 
     def _update_car(self):
         """
@@ -236,8 +236,8 @@ class RaceSettings:
         self.car_current = self.list_cars[self.car_current_index]
 
         try:
-            new_image = pygame.image.load(
-                Utils().get_resource_path('images', 'cars',f'car_{self.car_current.name}', f'car_{self.car_current.name}_state{0}.png')).convert_alpha()
+            new_image = AssetCache().get_image(
+                Utils().get_resource_path('images', 'cars',f'car_{self.car_current.name}', f'car_{self.car_current.name}_state{0}.png'))
             self.button_car.set_image(new_image)
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки изображения автомобиля {self.car_current.title}: {e}")
@@ -247,6 +247,19 @@ class RaceSettings:
 
         self.is_not_locked_car = self.get_status_access_to_car()
         self._update_current_texts()
+        self.renderer.invalidate()
+
+    def _refresh_access(self):
+        """
+        Обновляет статусы доступности и тексты, если счет пользователя изменился.
+        """
+        if self.user.score == self._score_shown:
+            return
+
+        self._score_shown = self.user.score
+        self.is_not_locked_car = self.get_status_access_to_car()
+        self.is_not_locked_track = self.get_status_access_to_track()
+        self._update_current_texts()
 
     def _update_current_texts(self):
         """
@@ -293,50 +306,73 @@ class RaceSettings:
                 f"Нужно очков: {self.track_current.score_to_unlocking}", True,
                 self.text_color_unsuccess)
 
-    def switch_to_race(self):
+    def switch_to_race(self, ghost_track=None):
         """
         Переключает на окно гонки при выполнении всех условий.
 
         Запускает гонку только если выбранный автомобиль и трек доступны
         пользователю на основе его счета.
+
+        Args:
+            ghost_track (GhostTrack, optional): Траектория призрака. По умолчанию None.
         """
         if self.is_not_locked_car and self.is_not_locked_track:
-            race_manager = RaceManager(self.car_current, self.track_current, self.user, self.stock_car_for_mode)
-            self.is_running = False
-            race_manager.run()
+            race_manager = RaceManager(self.car_current, self.track_current, self.user, self.stock_car_for_mode,
+                                       ghost_track=ghost_track)
+            SceneManager().push(race_manager)
+
+    def switch_to_race_with_ghost(self):
+        """
+        Переключает на окно гонки с призраком лучшего заезда.
 
-    def _handle_events(self):
+        Если записей заездов на выбранных автомобиле и треке нет,
+        гонка запускается без призрака.
         """
-        Обрабатывает события Pygame.
+        if self.is_not_locked_car and self.is_not_locked_track:
+            ghost_track = GhostTrack.load_best(self.user.name, self.car_current.name, self.track_current.name)
+            if ghost_track is None:
+                print(f"Записей заездов на '{self.car_current.title}' по треку '{self.track_current.name}' нет")
+            self.switch_to_race(ghost_track)
 
-        Обрабатывает события закрытия окна.
+    def on_enter(self):
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.is_running = False
+        Обновляет статусы доступности и перерисовывает окно целиком,
+        когда оно становится активным.
+        """
+        self._refresh_access()
+        super().on_enter()
 
-    def _draw(self):
+    def draw(self):
         """
         Отрисовывает все элементы окна настроек гонки.
 
         Рисует фон, кнопки выбора автомобиля и трека, информацию о характеристиках,
-        статус доступности и разделительную линию.
+        статус доступности и разделительную линию. Все, кроме кнопок с текстом,
+        рисуется только при полной перерисовке (после смены автомобиля или трека);
+        кнопки перерисовываются при смене состояния наведения.
         """
-        self.screen.fill(self.screen_fill)
+        if self.renderer.is_full_redraw():
+            self._draw_selection()
 
-        self.button_back.obj_button_with_text()
+        self.button_back.obj_button_with_text(self.renderer)
+        self.button_track_left_choice.obj_button_with_text(self.renderer)
+        self.button_track_right_choice.obj_button_with_text(self.renderer)
+        self.button_car_left_choice.obj_button_with_text(self.renderer)
+        self.button_car_right_choice.obj_button_with_text(self.renderer)
+        self.button_mode_alone.obj_button_with_text(self.renderer)
+        self.button_mode_ghost.obj_button_with_text(self.renderer)
+
+    def _draw_selection(self):
+        """
+        Рисует фон, изображения и характеристики выбранных автомобиля и трека.
+        """
+        self.screen.fill(self.screen_fill)
 
         self.screen.blit(self.text_choice_track, (130, 20))
-        self.button_track_left_choice.obj_button_with_text()
-        self.button_track.obj_image()
-        self.button_track_right_choice.obj_button_with_text()
+        self.button_track.obj_image(self.renderer)
 
         self.screen.blit(self.text_choice_car, (130, 220))
-        self.button_car_left_choice.obj_button_with_text()
-        self.button_car.obj_image()
-        self.button_car_right_choice.obj_button_with_text()
-
-        self.button_mode_alone.obj_button_with_text()
+        self.button_car.obj_image(self.renderer)
 
         pygame.draw.rect(self.screen, (255, 255, 255), pygame.Rect(420, 10, 2, 380))
 
@@ -362,28 +398,3 @@ class RaceSettings:
             self.screen.blit(self.text_access_to_track_line1, (450, y_offset_track))
             self.screen.blit(self.text_access_to_track_line2, (450, y_offset_track + 30))
             self.screen.blit(self.text_access_to_track_line3, (450, y_offset_track + 60))
-
-    def run(self):
-        """
-        Запускает главный цикл окна настроек гонки.
-
-        Обрабатывает события, обновляет статусы доступности и отрисовывает UI
-        с частотой 60 кадров в секунду до закрытия окна.
-        """
-        self._update_car()
-        self._update_track()
-        while self.is_running:
-            self._handle_events()
-            self._draw()
-
-            pygame.display.flip()
-            self.clock.tick(60)
-        self.quit()
-
-    @staticmethod
-    def quit():
-        """
-        Завершает работу Pygame и выходит из программы.
-        """
-        pygame.quit()
-        sys.exit()
@@ -5,23 +5,22 @@
 предоставляющим доступ к началу игры, статистике, настройкам и выходу.
 """
 
-import pygame
-import sys
+from src.ui.tools.tool_scene_manager import MenuScene, SceneManager
+from src.ui.tools.tool_window_designer import WindowPattern, WindowObject, DirtyRenderer
 
-from src.ui.tools.tool_window_designer import WindowPattern, WindowObject
 
-
-class WindowStart:
+class WindowStart(MenuScene):
     """
     Класс стартового окна игры.
 
     Предоставляет главное меню с кнопками для навигации по различным
-    разделам игры: начало игры, статистика, настройки и выход.
+    разделам игры: начало игры, статистика, настройки и выход. Окно
+    настроек гонки создается заранее, в первом кадре после показа меню,
+    и переиспользуется при каждом переходе.
 
     Attributes:
         user: Объект текущего пользователя.
         screen (pygame.Surface): Поверхность экрана для отрисовки.
-        is_running (bool): Флаг работы окна.
     """
 
     def __init__(self, user):
@@ -31,23 +30,20 @@ class WindowStart:
         Args:
             user: Объект пользователя.
         """
-        pygame.init()
+        super().__init__()
 
         self.user = user
 
         window = WindowPattern()
-        self.screen = pygame.display.set_mode(window.get_screen_size())
-        pygame.display.set_caption(window.get_screen_caption())
         self.screen_fill = window.get_screen_color()
-        self.screen.fill(self.screen_fill)
+        self.renderer = DirtyRenderer(self.screen, self.screen_fill)
 
         self.font_middle = window.get_font("medium")
         self.text_simple_color = window.get_text_colors("simple")
 
         self._load_resources()
 
-        self.is_running = True
-        self.clock = pygame.time.Clock()
+        self._race_settings = None
 
     def _load_resources(self):
         """
@@ -93,87 +89,76 @@ class WindowStart:
         """
         Переключает на окно настроек гонки.
 
-        Закрывает стартовое окно и открывает окно выбора автомобиля и трека.
+        Кладет окно выбора автомобиля и трека поверх главного меню.
+        """
+        SceneManager().push(self._get_race_settings())
+
+    def _get_race_settings(self):
         """
-        self.is_running = False
-        from src.ui.windows.window_race_settings import RaceSettings
-        race_settings = RaceSettings(self.user)
-        race_settings.run()
+        Возвращает окно настроек гонки, создавая его при первом обращении.
+
+        Returns:
+            RaceSettings: Окно выбора автомобиля и трека.
+        """
+        if self._race_settings is None:
+            from src.ui.windows.window_race_settings import RaceSettings
+            self._race_settings = RaceSettings(self.user)
+        return self._race_settings
 
     def switch_to_window_statistic(self):
         """
         Переключает на окно статистики.
 
-        Закрывает стартовое окно и открывает окно со статистикой игрока.
+        Кладет окно со статистикой игрока поверх главного меню.
         """
-        self.is_running = False
         from src.ui.windows.window_statistic import WindowStatistic
-        statistic = WindowStatistic(self.user)
-        statistic.run()
+        SceneManager().push(WindowStatistic(self.user))
 
     def switch_to_window_settings(self):
         """
         Переключает на окно настроек приложения.
 
-        Закрывает стартовое окно и открывает окно настроек UI.
+        Кладет окно настроек UI поверх главного меню.
         """
-        self.is_running = False
         from src.ui.windows.window_config_app import WindowSettings
-        settings = WindowSettings(self.user)
-        settings.run()
+        SceneManager().push(WindowSettings(self.user))
 
     def switch_to_exit(self):
         """
         Завершает работу приложения.
 
-        Устанавливает флаг завершения работы главного цикла.
+        Останавливает главный цикл менеджера сцен.
         """
-        self.is_running = False
+        SceneManager().quit()
 
-    def _handle_events(self):
+    def update(self, frame_time):
         """
-        Обрабатывает события Pygame.
+        Заранее загружает окно настроек гонки, когда меню уже показано.
 
-        Обрабатывает события закрытия окна.
+        Args:
+            frame_time (float): Длительность предыдущего кадра в секундах.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.is_running = False
+        if self._race_settings is None and self.renderer.count_presented > 0:
+            self._get_race_settings()
 
-    def _draw(self):
+    def draw(self):
         """
         Отрисовывает все элементы стартового окна.
 
-        Рисует фон, приветственный текст и все кнопки меню.
+        Фон и приветственный текст рисуются только при полной перерисовке,
+        кнопки — при смене состояния наведения.
         """
-        self.screen.fill(self.screen_fill)
+        if self.renderer.is_full_redraw():
+            self.screen.fill(self.screen_fill)
+            self.screen.blit(self.text_welcome, self.text_welcome_pos)
 
-        self.screen.blit(self.text_welcome, self.text_welcome_pos)
-
-        self.button_window_race_settings.obj_button_with_text()
-        self.button_window_statistic.obj_button_with_text()
-        self.button_window_settings.obj_button_with_text()
-        self.button_exit.obj_button_with_text()
+        self.button_window_race_settings.obj_button_with_text(self.renderer)
+        self.button_window_statistic.obj_button_with_text(self.renderer)
+        self.button_window_settings.obj_button_with_text(self.renderer)
+        self.button_exit.obj_button_with_text(self.renderer)
 
     def run(self):
         """
-        Запускает главный цикл стартового окна.
-
-        Обрабатывает события и отрисовывает UI с частотой 60 кадров
-        в секунду до закрытия окна.
-        """
-        while self.is_running:
-            self._handle_events()
-            self._draw()
-
-            pygame.display.flip()
-            self.clock.tick(60)
-        self.quit()
-
-    @staticmethod
-    def quit():
-        """
-        Завершает работу Pygame и выходит из программы.
+        Запускает приложение с главным меню в качестве корневой сцены.
         """
-        pygame.quit()
-        sys.exit()
+        SceneManager().run(self)
@@ -6,13 +6,14 @@
 """
 
 import pygame
-import sys
 
-from src.ui.tools.tool_window_designer import WindowObject, WindowPattern
+from src.ui.tools.tool_scene_manager import MenuScene, SceneManager
+from src.ui.tools.tool_window_designer import WindowObject, WindowPattern, DirtyRenderer
+from src.utils.utils_assets import AssetCache
 from src.utils.utils_paths import Utils
 
 
-class WindowStatistic:
+class WindowStatistic(MenuScene):
     """
     Класс окна статистики игрока.
 
@@ -22,7 +23,6 @@ class WindowStatistic:
     Attributes:
         user: Объект текущего пользователя.
         screen (pygame.Surface): Поверхность экрана для отрисовки.
-        is_running (bool): Флаг работы окна.
     """
 
     def __init__(self, user):
@@ -32,25 +32,20 @@ class WindowStatistic:
         Args:
             user: Объект пользователя.
         """
-        pygame.init()
+        super().__init__()
 
         self.user = user
 
         window = WindowPattern()
 
-        self.screen = pygame.display.set_mode(window.get_screen_size())
-        pygame.display.set_caption(window.get_screen_caption())
         self.screen_fill = window.get_screen_color()
-        self.screen.fill(self.screen_fill)
+        self.renderer = DirtyRenderer(self.screen, self.screen_fill)
 
         self.font_large = window.get_font("large")
         self.text_simple_color = window.get_text_colors("simple")
 
         self._load_resource()
 
-        self.is_running = True
-        self.clock = pygame.time.Clock()
-
     def _load_resource(self):
         """
         Загружает ресурсы и создает UI-элементы окна статистики.
@@ -63,9 +58,8 @@ class WindowStatistic:
             pygame.error: Если возникла ошибка загрузки изображения.
         """
         try:
-            self.user_image = pygame.image.load(
-                Utils().get_resource_path('images', 'users', self.user.image)
-            ).convert_alpha()
+            self.user_image = AssetCache().get_image(
+                Utils().get_resource_path('images', 'users', self.user.image))
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки аватара пользователя: {e}")
             self.user_image = pygame.Surface((200, 200))
@@ -91,18 +85,31 @@ class WindowStatistic:
         """
         Возвращает пользователя в стартовое окно.
 
-        Закрывает текущее окно статистики и открывает главное меню.
+        Снимает окно статистики со стека сцен.
         """
-        from src.ui.windows.window_start import WindowStart
-        start = WindowStart(self.user)
-        self.is_running = False
-        start.run()
+        SceneManager().pop()
 
     def draw(self):
+        """
+        Отрисовывает окно статистики.
+
+        Данные пользователя перечитываются и окно рисуется целиком только
+        при полной перерисовке; в остальных кадрах перерисовывается лишь
+        кнопка «Назад» при смене наведения.
+        """
+        if self.renderer.is_full_redraw():
+            self.user._load_resources(self.user.name)
+            self._draw_statistic()
+
+        self.button_back.obj_button_with_text(self.renderer)
+
+    def _draw_statistic(self):
+        """
+        Рисует аватар, данные пользователя и лучшие времена по машинам.
+        """
         self.screen.fill(self.screen_fill)
 
-        self.button_back.obj_button_with_text()
-        self.user_avatar.obj_image()
+        self.user_avatar.obj_image(self.renderer)
 
         rect_title = self.text_title.get_rect(center=(400, 40))
         self.screen.blit(self.text_title, rect_title)
@@ -136,37 +143,3 @@ class WindowStatistic:
         else:
             text_surface = self.font_large.render("Здесь пока пусто!", True, color)
             self.screen.blit(text_surface, (250, y_start + line_height))
-
-    def _handle_events(self):
-        """
-        Обрабатывает события Pygame.
-
-        Обрабатывает события закрытия окна.
-        """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.is_running = False
-
-    def run(self):
-        """
-        Запускает главный цикл окна статистики.
-
-        Обрабатывает события и отрисовывает UI с частотой 60 кадров
-        в секунду до закрытия окна.
-        """
-        while self.is_running:
-            self._handle_events()
-            self.user._load_resources(self.user.name)
-            self.draw()
-
-            pygame.display.flip()
-            self.clock.tick(60)
-        self.quit()
-
-    @staticmethod
-    def quit():
-        """
-        Завершает работу Pygame и выходит из программы.
-        """
-        pygame.quit()
-        sys.exit()
\ No newline at end of file
@@ -2,28 +2,35 @@
 Модуль управления фоном и треком гонки.
 
 Содержит классы WindowBackgroundSegments и Background для управления
-отрисовкой трека, расчета пройденного расстояния и отображения HUD.
+отрисовкой трека и слоев параллакса, расчета пройденного расстояния
+и отображения HUD.
 """
 
 import pygame
-import datetime
 import json
 
+from src.game.game_race import TrackDistance
 from src.ui.tools.tool_window_designer import WindowPattern
+from src.utils.utils_assets import AssetCache, TextCache
 from src.utils.utils_paths import Utils
 
 
-class WindowBackgroundSegments:
+class WindowBackgroundSegments(TrackDistance):
     """
-    Класс управления сегментами фона трека.
+    Класс управления фоном трека.
 
-    Управляет прокруткой фона, состоящего из повторяющихся сегментов,
-    отслеживает пройденное расстояние и определяет завершение гонки.
+    Управляет прокруткой фона, состоящего из повторяющихся по горизонтали
+    плиток изображения трека и необязательных слоев параллакса.
+    Положение плиток вычисляется из одного смещения прокрутки по модулю
+    ширины плитки, поэтому в кадре рисуются только видимые плитки.
+    Пройденное расстояние и завершение гонки считает модель TrackDistance.
 
     Attributes:
         screen (pygame.Surface): Поверхность экрана для отрисовки.
-        segments (pygame.sprite.Group): Группа спрайтов сегментов фона.
+        layers (list): Слои параллакса из JSON трека: словари с ключами 'image',
+                       'parallax' (доля скорости прокрутки), 'y' и 'height'.
         distance_traveled (float): Пройденное расстояние в метрах.
+        scroll_offset (float): Суммарное смещение фона в пикселях.
         distance_total (float): Общая длина трека в метрах.
         is_finished (bool): Флаг завершения гонки.
         name (str): Название трека.
@@ -32,36 +39,64 @@ class WindowBackgroundSegments:
 
     def __init__(self, screen, name, user):
         """
-        Инициализирует систему фоновых сегментов трека.
+        Инициализирует фон трека.
 
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
             name (str): Идентификатор трека для загрузки конфигурации.
             user: Объект пользователя.
         """
+        super().__init__()
         self.screen = screen
 
-        self.segments = pygame.sprite.Group()
-        self.segment_width = self.screen.get_width()
-        self.segments_total = 5
-
         self.user = user
         self._load_data_track(name)
+        self._surface = None
+        self._layer_surfaces = None
+
+        self.scroll_offset = 0.0
+        self._scroll_offset_previous = 0.0
 
-        for i in range(self.segments_total):
-            segment = Background(self.screen, self.image, self.user)
-            segment.rect.x = i * self.screen.get_width()
-            self.segments.add(segment)
+    def get_surface(self):
+        """
+        Возвращает изображение трека размером с экран, общее для всех плиток.
 
-        self.distance_traveled = 0
-        self.distance_total = 4020
+        Изображение загружается при первом обращении, поэтому треки,
+        которые только перечисляются в настройках гонки, не декодируются,
+        а заезд держит одну копию фона.
 
-        self._is_finished = False
+        Returns:
+            pygame.Surface: Изображение трека.
+        """
+        if self._surface is None:
+            self._surface = Background.load_surface(self.screen, self.image)
+        return self._surface
+
+    def get_layer_surfaces(self):
+        """
+        Возвращает изображения слоев параллакса, загружая их при первом обращении.
+
+        Returns:
+            list: Кортежи (изображение, доля скорости прокрутки, y) в порядке отрисовки.
+        """
+        if self._layer_surfaces is None:
+            self._layer_surfaces = []
+            for layer in self.layers:
+                size = (self.screen.get_width(), layer['height'])
+                surface = Background.load_surface(self.screen, layer['image'], size, is_alpha=True)
+                self._layer_surfaces.append((surface, layer['parallax'], layer['y']))
+        return self._layer_surfaces
 
     def _load_data_track(self, name):
         """
         Загружает данные трека из JSON-файла.
 
+        Необязательный ключ 'layers' — список слоев параллакса, которые
+        рисуются поверх изображения трека в указанном порядке. У слоя
+        обязателен ключ 'image' (файл в resources/images/tracks); 'parallax'
+        (по умолчанию 1.0) задает долю скорости прокрутки, 'y' (по умолчанию 0)
+        и 'height' (по умолчанию высота экрана) — положение и высоту слоя.
+
         Args:
             name (str): Идентификатор трека.
 
@@ -69,129 +104,173 @@ class WindowBackgroundSegments:
             FileNotFoundError: Если файл трека не найден.
             json.JSONDecodeError: Если JSON имеет неверный формат.
             KeyError: Если в JSON отсутствуют необходимые ключи.
+            ValueError: Если у слоя параллакса некорректные параметры.
         """
         try:
-            with open(Utils().get_asset_path('tracks', f'track_{name}.json'), 'r',
-                      encoding='utf-8') as asset_track:
-                data = json.load(asset_track)
-                self.image = data['image']
-                self.name = data['name']
-                self.score_to_unlocking = data['score_to_unlocking']
+            data = AssetCache().get_json(Utils().get_asset_path('tracks', f'track_{name}.json'))
+            self.image = data['image']
+            self.name = data['name']
+            self.score_to_unlocking = data['score_to_unlocking']
+            self.layers = [{
+                'image': layer['image'],
+                'parallax': float(layer.get('parallax', 1.0)),
+                'y': int(layer.get('y', 0)),
+                'height': int(layer.get('height', self.screen.get_height()))
+            } for layer in data.get('layers', [])]
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             print(f"Ошибка загрузки данных трека '{name}': {e}")
             raise
+        except (TypeError, ValueError) as e:
+            print(f"Ошибка: некорректный слой параллакса трека '{name}': {e}")
+            raise ValueError(f"Слои параллакса трека '{name}' заданы неверно: {e}")
+
+        for layer in self.layers:
+            if layer['height'] <= 0:
+                print(f"Ошибка: высота слоя '{layer['image']}' трека '{name}' должна быть больше 0")
+                raise ValueError(f"Некорректная высота слоя параллакса: {layer['height']}")
 
     def update(self, car_speed):
         """
-        Обновляет положение сегментов фона на основе скорости автомобиля.
+        Обновляет смещение фона на одном шаге физики.
 
-        Перемещает сегменты влево для создания эффекта движения,
-        пересоздает сегменты, вышедшие за пределы экрана, справа
-        и отслеживает пройденное расстояние.
+        Добавляет пройденное расстояние и увеличивает смещение фона
+        для создания эффекта движения.
 
         Args:
-            car_speed (float): Текущая скорость автомобиля.
+            car_speed (float): Текущая скорость автомобиля (пикселей за шаг).
 
         Returns:
             bool: True, если гонка завершена; False в противном случае.
         """
-        if self._is_finished:
+        if super().update(car_speed):
             return True
 
-        self.distance_traveled += car_speed * 0.1
+        self._scroll_offset_previous = self.scroll_offset
+        self.scroll_offset += car_speed
 
-        if self.distance_traveled >= self.distance_total:
-            self._is_finished = True
-            return True
+        return False
 
-        for segment in self.segments:
-            segment.rect.x -= car_speed
+    def get_scroll_offset(self, alpha=1.0):
+        """
+        Возвращает смещение фона, интерполированное между двумя последними шагами физики.
 
-            if segment.rect.x <= -self.segment_width:
-                max_x = max(s.rect.x for s in self.segments)
-                segment.rect.x = max_x + self.segment_width
+        Args:
+            alpha (float): Доля шага физики для интерполяции (0.0-1.0).
 
-        return False
+        Returns:
+            float: Суммарное смещение фона в пикселях.
+        """
+        return self._scroll_offset_previous + (self.scroll_offset - self._scroll_offset_previous) * alpha
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
-        Отрисовывает все сегменты фона на экране.
+        Отрисовывает видимые плитки фона и слоев параллакса на экране.
+
+        Смещение интерполируется между двумя последними шагами физики,
+        поэтому прокрутка остается плавной при любой частоте кадров.
+        Количество blit в кадре зависит только от ширины экрана и числа
+        слоев: по две плитки на слой шириной с экран.
 
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
+            alpha (float): Доля шага физики для интерполяции (0.0-1.0).
         """
-        self.segments.draw(screen)
+        offset = self.get_scroll_offset(alpha)
 
-class Circle(pygame.sprite.Sprite):
-    def __init__(self, color, center):
-        super().__init__()
-        self.color = color
-        self.center = center
-
-    def traffic_circle(self, screen, radius=25):
-        pygame.draw.circle(screen, self.color, self.center, radius)
+        Background.draw_tiled(screen, self.get_surface(), offset, 0)
+        for surface, parallax, y in self.get_layer_surfaces():
+            Background.draw_tiled(screen, surface, offset * parallax, y)
 
-    def set_color(self, new_color):
-        self.color = new_color
+    def reset(self):
+        """
+        Возвращает трек и прокрутку фона в состояние перед стартом.
+        """
+        super().reset()
+        self.scroll_offset = 0.0
+        self._scroll_offset_previous = 0.0
 
-class Background(pygame.sprite.Sprite):
+class Background:
     """
-    Класс фонового сегмента трека.
-
-    Представляет один сегмент фона, который повторяется для создания
-    эффекта бесконечной дороги. Также содержит статические методы
-    для отрисовки HUD, сообщений и финишного экрана.
+    Класс отрисовки фона трека и игровых сообщений.
 
-    Attributes:
-        screen (pygame.Surface): Поверхность экрана.
-        image (pygame.Surface): Изображение сегмента фона.
-        rect (pygame.Rect): Прямоугольная область сегмента.
+    Содержит статические методы для загрузки и вывода плиток фона,
+    отрисовки HUD, светофора, сообщений и финишного экрана.
     """
 
-    def __init__(self, screen, image, user):
-        """
-        Инициализирует сегмент фона.
+    OFF = (0, 0, 0)
+    YELLOW = (255, 255, 0)
+    TRAFFIC_STATES = {
+        'red': (OFF, OFF, OFF, OFF, (255, 0, 0)),
+        'yellow_1': (YELLOW, OFF, OFF, OFF, OFF),
+        'yellow_2': (YELLOW, YELLOW, OFF, OFF, OFF),
+        'yellow_3': (YELLOW, YELLOW, YELLOW, OFF, OFF),
+        'green': (OFF, OFF, OFF, (0, 255, 0), OFF),
+        'off': (OFF, OFF, OFF, OFF, OFF)
+    }
+    TRAFFIC_COLORKEY = (255, 0, 255)
+
+    _tachometer_layers = {}
+    _traffic_surfaces = {}
 
-        Args:
-            screen (pygame.Surface): Поверхность экрана.
-            image (str): Имя файла изображения фона.
-            user: Объект пользователя.
+    @staticmethod
+    def load_surface(screen, image, size=None, is_alpha=False):
         """
-        super().__init__()
-        self.screen = screen
-        self.screen_width, self.screen_height = self.screen.get_width(), self.screen.get_height()
+        Загружает изображение трека или слоя параллакса нужного размера.
 
-        self.image_path = Utils().get_resource_path('images', 'tracks', image)
-        self.load_image()
+        Изображение берется из AssetCache, поэтому все экземпляры одного
+        трека получают одну и ту же поверхность. При ошибке загрузки
+        возвращается серая заливка (для слоя — прозрачная поверхность).
 
-        self.user = user
-
-    def load_image(self):
-        """
-        Загружает и масштабирует изображение фона.
+        Args:
+            screen (pygame.Surface): Поверхность экрана.
+            image (str): Имя файла изображения в resources/images/tracks.
+            size (tuple, optional): Размер (ширина, высота). По умолчанию размер экрана.
+            is_alpha (bool): True — изображение с прозрачностью (слой параллакса).
 
-        Raises:
-            FileNotFoundError: Если файл изображения не найден.
-            pygame.error: Если возникла ошибка загрузки изображения.
+        Returns:
+            pygame.Surface: Изображение нужного размера.
         """
+        size = size or screen.get_size()
         try:
-            self.image_original = pygame.image.load(self.image_path).convert()
-            self.image = pygame.transform.scale(self.image_original,
-                                                (self.screen_width, self.screen_height))
-            self.rect = self.image.get_rect()
+            return AssetCache().get_image(Utils().get_resource_path('images', 'tracks', image),
+                                          is_alpha=is_alpha, size=size)
         except (FileNotFoundError, pygame.error) as e:
             print(f"Ошибка загрузки изображения фона: {e}")
-            self.image = pygame.Surface((self.screen_width, self.screen_height))
-            self.image.fill((50, 50, 50))
-            self.rect = self.image.get_rect()
+            if is_alpha:
+                return pygame.Surface(size, pygame.SRCALPHA)
+            surface = pygame.Surface(size)
+            surface.fill((50, 50, 50))
+            return surface
+
+    @staticmethod
+    def draw_tiled(screen, surface, offset, y):
+        """
+        Выводит изображение, повторенное по горизонтали со смещением прокрутки.
+
+        Рисуются только плитки, которые попадают на экран.
+
+        Args:
+            screen (pygame.Surface): Поверхность экрана.
+            surface (pygame.Surface): Изображение плитки.
+            offset (float): Смещение прокрутки в пикселях.
+            y (int): Y-координата плиток.
+        """
+        width = surface.get_width()
+        tile_x = -int(offset % width)
+        screen_width = screen.get_width()
+        while tile_x < screen_width:
+            screen.blit(surface, (tile_x, y))
+            tile_x += width
 
     @staticmethod
-    def draw_hud(screen, car, x, y, width, height):
+    def draw_hud(screen, car, x, y, width, height, shift_revolutions=None):
         """
         Отрисовывает HUD с информацией о состоянии автомобиля.
 
         Рисует шкалу оборотов с цветовой индикацией, маркеры зон
         переключения и буста, а также текстовую информацию о передаче и скорости.
+        Рамка и маркеры зон берутся из слоев get_tachometer_layers, поэтому
+        в каждом кадре выводится пустая шкала и часть залитой по оборотам.
 
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
@@ -200,58 +279,98 @@ class Background(pygame.sprite.Sprite):
             y (int): Y-координата шкалы оборотов.
             width (int): Ширина шкалы оборотов.
             height (int): Высота шкалы оборотов.
+            shift_revolutions (float, optional): Оптимальные обороты переключения
+                                                 с текущей передачи (белый маркер).
         """
         info = car.get_engine_info()
+        engine = car.engine
 
         font_small = WindowPattern().get_font("small")
         text_color_simple = WindowPattern().get_text_colors("simple")
-        text_color_success = WindowPattern().get_text_colors("success")
-        text_color_unsuccess = WindowPattern().get_text_colors("unsuccess")
-
-        text_gear = font_small.render(f"Текущая передача: {info['gear']}", True, text_color_simple)
-        text_speed = font_small.render(f"Скорость: {info['speed_kmh']} км/ч", True, text_color_simple)
-
-        rpm = car.engine.revolutions
 
-        rpm_max = car.engine.max_revolutions
-        rpm_max_to_good_shift = car.engine.max_revolutions_to_good_shift
-        rpm_max_to_boost = car.engine.max_revolutions_to_boost
+        text_gear = TextCache().render(font_small, f"Текущая передача: {info['gear']}", text_color_simple)
+        text_speed = TextCache().render(font_small, f"Скорость: {info['speed_kmh']} км/ч", text_color_simple)
 
-        rpm_min_to_good_shift = car.engine.min_revolutions_to_good_shift
-        rpm_min_to_boost = car.engine.min_revolutions_to_boost
+        rpm = engine.revolutions
+        rpm_max = engine.max_revolutions
+        layers = Background.get_tachometer_layers(engine, width, height)
 
-        progress = rpm / rpm_max
+        screen.blit(layers['empty'], (x, y))
+        fill_width = min(int(width * rpm / rpm_max), width)
+        if fill_width > 0:
+            if engine.min_revolutions_to_good_shift <= rpm <= engine.max_revolutions_to_good_shift:
+                screen.blit(layers['success'], (x, y), (0, 0, fill_width, height))
+            else:
+                screen.blit(layers['unsuccess'], (x, y), (0, 0, fill_width, height))
+        for rect, color in layers['outside']:
+            screen.fill(color, rect.move(x, y))
 
-        pygame.draw.rect(screen, (50, 50, 50), (x, y, width, height))
+        text_rpm = TextCache().render(font_small, f"Обороты: {round(rpm)}", text_color_simple)
 
-        fill_width = int(width * progress)
+        if shift_revolutions is not None:
+            whiteline_shift = x + int(width * shift_revolutions / rpm_max)
+            pygame.draw.line(screen, (255, 255, 255), (whiteline_shift, y - 4), (whiteline_shift, y + height + 4), 2)
 
-        if rpm_min_to_good_shift <= rpm <= rpm_max_to_good_shift:
-            color = text_color_success
-        else:
-            color = text_color_unsuccess
-
-        pygame.draw.rect(screen, color, (x, y, fill_width, height))
-
-        pygame.draw.rect(screen, (200, 200, 200), (x, y, width, height), 2)
-
-        text_rpm = font_small.render(f"Обороты: {round(rpm)}", True, text_color_simple)
-
-        redline_start_good_shift = x + int(width * rpm_max_to_good_shift / rpm_max)
-        redline_end_good_shift = x + int(width * rpm_min_to_good_shift / rpm_max)
+        screen.blit(text_rpm, (x, y - 25))
+        screen.blit(text_gear, (10, 60))
+        screen.blit(text_speed, (10, 90))
 
-        blueline_start_boost = x + int(width * rpm_max_to_boost / rpm_max)
-        blueline_end_boost = x + int(width * rpm_min_to_boost / rpm_max)
+    @staticmethod
+    def get_tachometer_layers(engine, width, height):
+        """
+        Возвращает заранее нарисованные слои шкалы оборотов автомобиля.
 
-        pygame.draw.line(screen, (255, 0, 0), (redline_start_good_shift, y), (redline_start_good_shift, y + height), 2)
-        pygame.draw.line(screen, (255, 0, 0), (redline_end_good_shift, y), (redline_end_good_shift, y + height), 2)
+        Слои 'empty', 'success' и 'unsuccess' — непрозрачная шкала размером
+        (width, height) с рамкой и маркерами зон поверх фона шкалы или полной
+        заливки цветом успеха или ошибки; в кадре рисуется пустая шкала и
+        часть залитой шириной по оборотам. Красные маркеры ограничивают зону
+        хорошего переключения, синие — зону буста. Пиксели маркеров, которые
+        выходят за шкалу, хранятся в 'outside' списком (прямоугольник, цвет).
+        Слои рисуются один раз для границ зон, размера шкалы и цветов темы
+        и хранятся в Background._tachometer_layers.
 
-        pygame.draw.line(screen, (0, 0, 255), (blueline_start_boost, y), (blueline_start_boost, y + height), 2)
-        pygame.draw.line(screen, (0, 0, 255), (blueline_end_boost, y), (blueline_end_boost, y + height), 2)
+        Args:
+            engine (Engine): Двигатель автомобиля.
+            width (int): Ширина шкалы оборотов.
+            height (int): Высота шкалы оборотов.
 
-        screen.blit(text_rpm, (x, y - 25))
-        screen.blit(text_gear, (10, 60))
-        screen.blit(text_speed, (10, 90))
+        Returns:
+            dict: Слои с ключами 'empty', 'success', 'unsuccess' и 'outside'.
+        """
+        color_success = WindowPattern().get_text_colors("success")
+        color_unsuccess = WindowPattern().get_text_colors("unsuccess")
+        rpm_max = engine.max_revolutions
+        key = (rpm_max, engine.min_revolutions_to_good_shift, engine.max_revolutions_to_good_shift,
+               engine.min_revolutions_to_boost, engine.max_revolutions_to_boost, width, height,
+               color_success, color_unsuccess)
+        layers = Background._tachometer_layers.get(key)
+        if layers is not None:
+            return layers
+
+        markers = pygame.Surface((width + 2, height + 1), pygame.SRCALPHA)
+        pygame.draw.rect(markers, (200, 200, 200), (0, 0, width, height), 2)
+        for rpm_marker, marker_color in ((engine.max_revolutions_to_good_shift, (255, 0, 0)),
+                                         (engine.min_revolutions_to_good_shift, (255, 0, 0)),
+                                         (engine.max_revolutions_to_boost, (0, 0, 255)),
+                                         (engine.min_revolutions_to_boost, (0, 0, 255))):
+            marker_x = int(width * rpm_marker / rpm_max)
+            pygame.draw.line(markers, marker_color, (marker_x, 0), (marker_x, height), 2)
+
+        layers = {'outside': []}
+        for name, color in (('empty', (50, 50, 50)), ('success', color_success), ('unsuccess', color_unsuccess)):
+            layer = pygame.Surface((width, height)).convert()
+            layer.fill(color)
+            layer.blit(markers, (0, 0))
+            layers[name] = layer
+
+        for pixel_x in range(width + 2):
+            for pixel_y in range(height + 1):
+                if (pixel_x >= width or pixel_y >= height) and markers.get_at((pixel_x, pixel_y)).a:
+                    layers['outside'].append((pygame.Rect(pixel_x, pixel_y, 1, 1),
+                                              tuple(markers.get_at((pixel_x, pixel_y)))[:3]))
+
+        Background._tachometer_layers[key] = layers
+        return layers
 
     @staticmethod
     def draw_not_good_shift(screen, width, height):
@@ -265,8 +384,8 @@ class Background(pygame.sprite.Sprite):
         """
         font_small = WindowPattern().get_font("small")
         text_color_unsuccess = WindowPattern().get_text_colors("unsuccess")
-        text_not_good_shift = font_small.render("!Плохое переключение передачи! Потеря мощности!", True,
-                                                text_color_unsuccess)
+        text_not_good_shift = TextCache().render(font_small, "!Плохое переключение передачи! Потеря мощности!",
+                                                 text_color_unsuccess)
         screen.blit(text_not_good_shift, ((width / 4) - 20, (height / 4) + 80))
 
     @staticmethod
@@ -281,7 +400,7 @@ class Background(pygame.sprite.Sprite):
         """
         font_small = WindowPattern().get_font("small")
         text_color_success = WindowPattern().get_text_colors("success")
-        text_boost = font_small.render("!Прекрасное переключение! Буст активирован!", True, text_color_success)
+        text_boost = TextCache().render(font_small, "!Прекрасное переключение! Буст активирован!", text_color_success)
         screen.blit(text_boost, ((width / 4) - 20, (height / 4) + 80))
 
     @staticmethod
@@ -292,87 +411,40 @@ class Background(pygame.sprite.Sprite):
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
             state (str): Состояние светофора - "red", "yellow_1", "yellow_2", "yellow_3", "green".
+                         Для любого другого значения все секции выключены.
         """
+        screen.blit(Background.get_traffic_surface(state), (screen.get_width() - 175, 100))
 
-        rect_x = screen.get_width() - 175
-        rect_y = 100
-        rect_width = 150
-        rect_height = 320
-        pygame.draw.rect(screen, (82,82,82), (rect_x, rect_y, rect_width, rect_height), border_radius=20)
-
-        radius = 15
-        offset_x1 = rect_x + 40
-        offset_x2 = rect_x + 110
-        pos_y = [rect_y + 50, rect_y + 100, rect_y + 150, rect_y + 200, rect_y + 250]
-
-        if state == "red":
-            yellow_color_1 = (0, 0, 0)
-            yellow_color_2 = (0, 0, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 0, 0)
-            red_color = (255, 0, 0)
-        elif state == "yellow_1":
-            yellow_color_1 = (255, 255, 0)
-            yellow_color_2 = (0, 0, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 0, 0)
-            red_color = (0, 0, 0)
-        elif state == "yellow_2":
-            yellow_color_1 = (255, 255, 0)
-            yellow_color_2 = (255, 255, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 0, 0)
-            red_color = (0, 0, 0)
-        elif state == "yellow_3":
-            yellow_color_1 = (255, 255, 0)
-            yellow_color_2 = (255, 255, 0)
-            yellow_color_3 = (255, 255, 0)
-            green_color = (0, 0, 0)
-            red_color = (0, 0, 0)
-        elif state == "green":
-            yellow_color_1 = (0, 0, 0)
-            yellow_color_2 = (0, 0, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 255, 0)
-            red_color = (0, 0, 0)
-        elif state == "red":
-            yellow_color_1 = (0, 0, 0)
-            yellow_color_2 = (0, 0, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 0, 0)
-            red_color = (255, 0, 0)
-        else:
-            yellow_color_1 = (0, 0, 0)
-            yellow_color_2 = (0, 0, 0)
-            yellow_color_3 = (0, 0, 0)
-            green_color = (0, 0, 0)
-            red_color = (0, 0, 0)
-
-
-        circle_yellow_1_1 = Circle(yellow_color_1, (offset_x1, pos_y[0]))
-        circle_yellow_1_1.traffic_circle(screen, radius)
-        circle_yellow_1_2 = Circle(yellow_color_1, (offset_x2, pos_y[0]))
-        circle_yellow_1_2.traffic_circle(screen, radius)
-
-        circle_yellow_2_1 = Circle(yellow_color_2, (offset_x1, pos_y[1]))
-        circle_yellow_2_1.traffic_circle(screen, radius)
-        circle_yellow_2_2 = Circle(yellow_color_2, (offset_x2, pos_y[1]))
-        circle_yellow_2_2.traffic_circle(screen, radius)
-
-        circle_yellow_3_1 = Circle(yellow_color_3, (offset_x1, pos_y[2]))
-        circle_yellow_3_1.traffic_circle(screen, radius)
-        circle_yellow_3_2 = Circle(yellow_color_3, (offset_x2, pos_y[2]))
-        circle_yellow_3_2.traffic_circle(screen, radius)
-
-        circle_green_4_1 = Circle(green_color, (offset_x1, pos_y[3]))
-        circle_green_4_1.traffic_circle(screen, radius)
-        circle_green_4_2 = Circle(green_color, (offset_x2, pos_y[3]))
-        circle_green_4_2.traffic_circle(screen, radius)
-
-        circle_red_5_1 = Circle(red_color, (offset_x1, pos_y[4]))
-        circle_red_5_1.traffic_circle(screen, radius)
-        circle_red_5_2 = Circle(red_color, (offset_x2, pos_y[4]))
-        circle_red_5_2.traffic_circle(screen, radius)
+    @staticmethod
+    def get_traffic_surface(state):
+        """
+        Возвращает заранее нарисованное изображение светофора в состоянии.
+
+        Изображения всех состояний рисуются при первом обращении и хранятся
+        в Background._traffic_surfaces. Углы корпуса прозрачны за счет
+        цветового ключа с RLE-ускорением, поэтому изображение выводится
+        одним blit без смешивания альфа-канала.
+
+        Args:
+            state (str): Состояние светофора.
+
+        Returns:
+            pygame.Surface: Изображение светофора размером 150x320.
+        """
+        if not Background._traffic_surfaces:
+            for state_name, lights in Background.TRAFFIC_STATES.items():
+                surface = pygame.Surface((150, 320)).convert()
+                surface.fill(Background.TRAFFIC_COLORKEY)
+                surface.set_colorkey(Background.TRAFFIC_COLORKEY, pygame.RLEACCEL)
+                pygame.draw.rect(surface, (82, 82, 82), (0, 0, 150, 320), border_radius=20)
+
+                for section, color in enumerate(lights):
+                    for offset_x in (40, 110):
+                        pygame.draw.circle(surface, color, (offset_x, 50 + section * 50), 15)
+
+                Background._traffic_surfaces[state_name] = surface
+
+        return Background._traffic_surfaces.get(state, Background._traffic_surfaces['off'])
 
     @staticmethod
     def draw_start(screen):
@@ -385,7 +457,7 @@ class Background(pygame.sprite.Sprite):
         font_large = WindowPattern().get_font("large")
         text_color_success = WindowPattern().get_text_colors("success")
 
-        text = font_large.render("СТАРТ", True, text_color_success)
+        text = TextCache().render(font_large, "СТАРТ", text_color_success)
         rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
         screen.blit(text, rect)
 
@@ -400,31 +472,28 @@ class Background(pygame.sprite.Sprite):
         font_large = WindowPattern().get_font("large")
         text_color_error = WindowPattern().get_text_colors("unsuccess")
 
-        text = font_large.render("!ФАЛЬСТАРТ!", True, text_color_error)
+        text = TextCache().render(font_large, "!ФАЛЬСТАРТ!", text_color_error)
         rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
         screen.blit(text, rect)
 
     @staticmethod
-    def draw_finish(screen, width, height, time_start_race, is_false_start, speeds, count_lose_shift, car, user):
+    def draw_finish(screen, width, height, time_spend, is_false_start, speed_average, count_lose_shift, car, user):
         """
         Отрисовывает финишный экран с результатами гонки.
 
-        Вычисляет время заезда, среднюю скорость, начисляет очки пользователю
+        Начисляет очки пользователю по времени и средней скорости заезда
         и отображает всю информацию на экране.
 
         Args:
             screen (pygame.Surface): Поверхность экрана для отрисовки.
             width (int): Ширина экрана.
             height (int): Высота экрана.
-            time_start_race (datetime.datetime): Время начала гонки.
-            speeds (list): Список зафиксированных скоростей.
+            time_spend (float): Время заезда по часам симуляции в секундах.
+            is_false_start (bool): True, если был фальстарт.
+            speed_average (float): Средняя скорость заезда в км/ч.
             count_lose_shift (int): Количество неудачных переключений.
             user: Объект пользователя.
         """
-        time_end_race = datetime.datetime.now()
-        time_spend = (time_end_race - time_start_race).total_seconds()
-        speed_average = sum(speeds) / len(speeds) if speeds else 0
-
         if is_false_start != True:
             user_score = user.set_user_score(time_spend, speed_average, count_lose_shift)
 
@@ -448,7 +517,7 @@ class Background(pygame.sprite.Sprite):
             text_user_score = font_small.render(f"Заработано {user_score} очков", True, text_color_simple)
 
         text_last_best_statistics = font_small.render('Последние результаты на машине:', True, text_color_simple)
-        text_last_best_statistics_time = font_small.render(f'Время: {user.data[car.title].get('best_time')}', True, text_color_simple)
+        text_last_best_statistics_time = font_small.render(f"Время: {user.data[car.title].get('best_time')}", True, text_color_simple)
 
         if is_false_start != True:
             user.set_statistic_races(car_name=car.title, spend_time=round(time_spend, 2))
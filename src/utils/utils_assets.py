@@ -0,0 +1,341 @@
+"""
+Модуль кэша ресурсов.
+
+Содержит класс AssetCache — общий для процесса кэш изображений и JSON-файлов
+с ограничением объема памяти, вытеснением давно неиспользуемых ресурсов (LRU)
+и счетчиками попаданий, промахов и занятых байт, и класс TextCache — кэш
+отрисованных надписей с ограничением количества записей.
+"""
+
+import copy
+import json
+from collections import OrderedDict
+
+import pygame
+
+
+class AssetCache:
+    """
+    Класс кэша ресурсов (Singleton).
+
+    Ключ кэша — путь, полученный из Utils.get_resource_path или
+    Utils.get_asset_path, и параметры преобразования (прозрачность, размер).
+    При превышении бюджета вытесняются ресурсы, к которым дольше всего
+    не обращались. Объекты, которые уже получили вызывающие, продолжают
+    жить, пока на них есть ссылки.
+
+    Attributes:
+        budget_bytes (int): Бюджет памяти кэша в байтах.
+        bytes (int): Объем ресурсов в кэше в байтах.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов (загрузок с диска или преобразований).
+        evictions (int): Количество вытесненных ресурсов.
+    """
+
+    DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        """
+        Создает единственный экземпляр класса (Singleton).
+
+        Returns:
+            AssetCache: Единственный экземпляр класса.
+        """
+        if cls._instance is None:
+            cls._instance = super(AssetCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Инициализирует пустой кэш с бюджетом по умолчанию.
+        """
+        if AssetCache._initialized:
+            return
+
+        self.budget_bytes = self.DEFAULT_BUDGET_BYTES
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        AssetCache._initialized = True
+
+    def set_budget(self, budget_bytes):
+        """
+        Устанавливает бюджет памяти и при необходимости вытесняет ресурсы.
+
+        Args:
+            budget_bytes (int): Бюджет памяти кэша в байтах.
+
+        Raises:
+            ValueError: Если бюджет отрицательный.
+        """
+        if budget_bytes < 0:
+            print(f"Ошибка: бюджет кэша ресурсов не может быть отрицательным: {budget_bytes}")
+            raise ValueError(f"Некорректный бюджет кэша ресурсов: {budget_bytes}")
+
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def get_image(self, path, is_alpha=True, scale=1.0, size=None):
+        """
+        Возвращает изображение из кэша, загружая его при промахе.
+
+        Args:
+            path (str): Абсолютный путь к файлу изображения.
+            is_alpha (bool): True — convert_alpha(), False — convert(). По умолчанию True.
+            scale (float): Коэффициент масштабирования. По умолчанию 1.0.
+            size (tuple, optional): Точный размер (ширина, высота). Если задан, scale не используется.
+
+        Для масштабированного изображения исходное берется из кэша, если оно
+        уже там есть; иначе оно декодируется без сохранения в кэше, чтобы
+        в памяти оставалась только масштабированная копия.
+
+        Returns:
+            pygame.Surface: Изображение. Его нельзя изменять: оно общее для всех вызывающих.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            pygame.error: Если изображение не удалось загрузить.
+        """
+        key = ('image', path, is_alpha, tuple(size) if size is not None else scale)
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        if size is None and scale == 1.0:
+            surface = self._load_image(path, is_alpha)
+        else:
+            entry = self._entries.get(('image', path, is_alpha, 1.0))
+            original = entry[0] if entry is not None else self._load_image(path, is_alpha)
+            if size is None:
+                size = (int(original.get_width() * scale), int(original.get_height() * scale))
+            surface = pygame.transform.scale(original, size)
+
+        self._put(key, surface, surface.get_pitch() * surface.get_height())
+        return surface
+
+    @staticmethod
+    def _load_image(path, is_alpha):
+        """
+        Загружает изображение с диска и конвертирует его в формат экрана.
+
+        Args:
+            path (str): Абсолютный путь к файлу изображения.
+            is_alpha (bool): True — convert_alpha(), False — convert().
+
+        Returns:
+            pygame.Surface: Изображение.
+        """
+        surface = pygame.image.load(path)
+        return surface.convert_alpha() if is_alpha else surface.convert()
+
+    def get_json(self, path):
+        """
+        Возвращает содержимое JSON-файла из кэша, читая его при промахе.
+
+        Подходит для неизменяемых описаний (машины, треки); файлы, которые
+        игра перезаписывает, читать через кэш не нужно.
+
+        Args:
+            path (str): Абсолютный путь к JSON-файлу.
+
+        Returns:
+            Копия разобранных данных, которую можно изменять.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            json.JSONDecodeError: Если JSON имеет неверный формат.
+        """
+        key = ('json', path)
+        data = self._get(key)
+        if data is None:
+            with open(path, 'rb') as file:
+                raw = file.read()
+            data = json.loads(raw.decode('utf-8'))
+            self._put(key, data, len(raw))
+        return copy.deepcopy(data)
+
+    def invalidate(self, path=None):
+        """
+        Удаляет из кэша ресурсы файла или весь кэш.
+
+        Args:
+            path (str, optional): Путь к файлу. По умолчанию очищается весь кэш.
+        """
+        for key in [key for key in self._entries if path is None or key[1] == path]:
+            self.bytes -= self._entries.pop(key)[1]
+
+    def get_stats(self):
+        """
+        Возвращает счетчики кэша.
+
+        Returns:
+            dict: Ключи 'hits', 'misses', 'evictions', 'entries', 'bytes', 'budget_bytes'
+                  и 'hit_rate' (доля попаданий от 0 до 1).
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'budget_bytes': self.budget_bytes,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def _get(self, key):
+        """
+        Ищет ресурс в кэше и отмечает его как недавно использованный.
+
+        Args:
+            key (tuple): Ключ ресурса.
+
+        Returns:
+            Ресурс или None при промахе.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, key, value, size):
+        """
+        Добавляет ресурс в кэш и вытесняет старые ресурсы сверх бюджета.
+
+        Args:
+            key (tuple): Ключ ресурса.
+            value: Ресурс.
+            size (int): Объем ресурса в байтах.
+        """
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.bytes += size
+        self._evict(key)
+
+    def _evict(self, key_keep=None):
+        """
+        Вытесняет давно неиспользуемые ресурсы, пока объем превышает бюджет.
+
+        Args:
+            key_keep (tuple, optional): Ключ, который нельзя вытеснять (только что добавленный).
+        """
+        while self.bytes > self.budget_bytes and self._entries:
+            key = next(iter(self._entries))
+            if key == key_keep:
+                if len(self._entries) == 1:
+                    break
+                self._entries.move_to_end(key)
+                continue
+            self.bytes -= self._entries.pop(key)[1]
+            self.evictions += 1
+
+
+class TextCache:
+    """
+    Класс кэша отрисованных надписей (Singleton).
+
+    Ключ кэша — шрифт, строка, цвет и сглаживание, поэтому постоянная
+    надпись (кнопка, баннер, подпись HUD) отрисовывается шрифтом один раз,
+    а дальше стоит одного blit. Количество записей ограничено; при
+    превышении вытесняются надписи, которые дольше всего не запрашивались,
+    поэтому часто меняющиеся числа (обороты, скорость) не вытесняют
+    постоянные надписи, используемые в каждом кадре.
+
+    Attributes:
+        max_entries (int): Наибольшее количество надписей в кэше.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов (отрисовок шрифтом).
+        evictions (int): Количество вытесненных надписей.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        """
+        Создает единственный экземпляр класса (Singleton).
+
+        Returns:
+            TextCache: Единственный экземпляр класса.
+        """
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Инициализирует пустой кэш надписей.
+        """
+        if TextCache._initialized:
+            return
+
+        self.max_entries = self.DEFAULT_MAX_ENTRIES
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        TextCache._initialized = True
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Возвращает отрисованную надпись из кэша, отрисовывая ее при промахе.
+
+        Args:
+            font (pygame.font.Font): Шрифт.
+            text (str): Текст надписи.
+            color (tuple): RGB цвет текста.
+            antialias (bool): Сглаживание. По умолчанию True.
+
+        Returns:
+            pygame.Surface: Надпись. Ее нельзя изменять: она общая для всех вызывающих.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """
+        Удаляет все надписи из кэша (например, после смены шрифтов или цветов темы).
+        """
+        self._entries.clear()
+
+    def get_stats(self):
+        """
+        Возвращает счетчики кэша.
+
+        Returns:
+            dict: Ключи 'hits', 'misses', 'evictions', 'entries', 'max_entries'
+                  и 'hit_rate' (доля попаданий от 0 до 1).
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hit_rate': self.hits / total if total else 0.0
+        }
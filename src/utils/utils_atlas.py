@@ -0,0 +1,273 @@
+"""
+Модуль атласа спрайтов автомобилей.
+
+Содержит класс SpriteAtlas, который упаковывает все кадры всех автомобилей
+(уже масштабированные по полю scale из car_{name}.json) в одну или несколько
+страниц атласа с JSON-индексом кадров и выдает кадры как подповерхности
+страниц. Вместо десятков открытий и декодирования PNG на автомобиль
+загружается одна страница.
+
+Сборка атласа:
+    python -m src.utils.utils_atlas
+"""
+
+import json
+import os
+
+import pygame
+
+from src.utils.utils_assets import AssetCache
+from src.utils.utils_paths import Utils
+
+
+class SpriteAtlas:
+    """
+    Класс атласа спрайтов автомобилей (Singleton).
+
+    Индекс хранится в assets/cache/atlas/atlas_cars.json, страницы —
+    рядом в atlas_cars_{N}.png. Для каждого автомобиля индекс содержит
+    масштаб, флаг анимации, количество и время изменения исходных кадров
+    и прямоугольники кадров на страницах. Если атласа нет, исходные кадры
+    или флаг анимации изменились после сборки, get_frames возвращает None,
+    и автомобиль загружает кадры из отдельных файлов.
+
+    Attributes:
+        index (dict or None): Загруженный индекс атласа.
+    """
+
+    VERSION = 2
+    MAX_PAGE_SIZE = 2048
+    PADDING = 1
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        """
+        Создает единственный экземпляр класса (Singleton).
+
+        Returns:
+            SpriteAtlas: Единственный экземпляр класса.
+        """
+        if cls._instance is None:
+            cls._instance = super(SpriteAtlas, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Инициализирует атлас без загрузки индекса.
+        """
+        if SpriteAtlas._initialized:
+            return
+
+        self.index = None
+        self._is_loaded = False
+        SpriteAtlas._initialized = True
+
+    @staticmethod
+    def get_atlas_path(*path):
+        """
+        Возвращает путь внутри директории атласа.
+
+        Args:
+            *path: Компоненты пути относительно assets/cache/atlas.
+
+        Returns:
+            str: Абсолютный путь.
+        """
+        return Utils().get_asset_path('cache', 'atlas', *path)
+
+    @staticmethod
+    def get_frame_paths(car_name):
+        """
+        Возвращает пути к кадрам автомобиля по порядку.
+
+        Args:
+            car_name (str): Идентификатор автомобиля.
+
+        Returns:
+            list: Пути к car_{name}_state{N}.png до первого отсутствующего кадра.
+        """
+        paths = []
+        while True:
+            path = Utils().get_resource_path('images', 'cars', f'car_{car_name}',
+                                             f'car_{car_name}_state{len(paths)}.png')
+            if not os.path.isfile(path):
+                return paths
+            paths.append(path)
+
+    @staticmethod
+    def _get_sources_mtime(paths):
+        """
+        Возвращает время последнего изменения исходных кадров.
+
+        Args:
+            paths (list): Пути к кадрам.
+
+        Returns:
+            int: Наибольшее время изменения в наносекундах.
+        """
+        return max((os.stat(path).st_mtime_ns for path in paths), default=0)
+
+    def build(self):
+        """
+        Собирает атлас всех автомобилей из assets/cars.
+
+        В атлас попадают те же кадры, что загружает Car: все кадры
+        анимированного автомобиля и только нулевой кадр остальных. Кадры
+        масштабируются по полю scale автомобиля и раскладываются по полкам
+        (строкам) страниц от самых высоких к самым низким.
+
+        Returns:
+            dict: Индекс собранного атласа.
+
+        Raises:
+            ValueError: Если кадр не помещается на страницу атласа.
+        """
+        frames = []
+        cars = {}
+        for car_name in sorted(Utils().get_list_cars()):
+            with open(Utils().get_asset_path('cars', f'car_{car_name}.json'), 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            scale = data['scale']
+            paths_all = self.get_frame_paths(car_name)
+            paths = paths_all if data['animation'] else paths_all[:1]
+            if not paths:
+                continue
+
+            cars[car_name] = {
+                'scale': scale,
+                'animation': data['animation'],
+                'sources_total': len(paths_all),
+                'sources_mtime': self._get_sources_mtime(paths),
+                'frames': [None] * len(paths)
+            }
+            for state, path in enumerate(paths):
+                image = pygame.image.load(path)
+                if scale != 1.0:
+                    image = pygame.transform.scale(
+                        image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+                frames.append((car_name, state, image))
+
+        pages = self._pack(frames, cars)
+
+        os.makedirs(self.get_atlas_path(), exist_ok=True)
+        page_names = []
+        for number, page in enumerate(pages):
+            page_name = f'atlas_cars_{number}.png'
+            pygame.image.save(page, self.get_atlas_path(page_name))
+            page_names.append(page_name)
+
+        index = {'version': self.VERSION, 'pages': page_names, 'cars': cars}
+        with open(self.get_atlas_path('atlas_cars.json'), 'w', encoding='utf-8') as file:
+            json.dump(index, file, indent=2, ensure_ascii=False)
+
+        AssetCache().invalidate()
+        self.index = index
+        self._is_loaded = True
+        return index
+
+    def _pack(self, frames, cars):
+        """
+        Раскладывает кадры по страницам атласа.
+
+        Args:
+            frames (list): Кортежи (автомобиль, номер кадра, pygame.Surface).
+            cars (dict): Записи индекса по автомобилям; в них заполняются прямоугольники кадров.
+
+        Returns:
+            list: Страницы атласа (pygame.Surface).
+
+        Raises:
+            ValueError: Если кадр не помещается на страницу атласа.
+        """
+        placements = []
+        page = 0
+        x = y = shelf_height = 0
+        page_sizes = [[0, 0]]
+
+        for car_name, state, image in sorted(frames, key=lambda item: -item[2].get_height()):
+            width, height = image.get_size()
+            if width > self.MAX_PAGE_SIZE or height > self.MAX_PAGE_SIZE:
+                print(f"Ошибка: кадр {state} машины '{car_name}' больше страницы атласа")
+                raise ValueError(f"Кадр {width}x{height} не помещается в атлас {self.MAX_PAGE_SIZE}")
+
+            if x + width > self.MAX_PAGE_SIZE:
+                x = 0
+                y += shelf_height + self.PADDING
+                shelf_height = 0
+            if y + height > self.MAX_PAGE_SIZE:
+                page += 1
+                page_sizes.append([0, 0])
+                x = y = shelf_height = 0
+
+            placements.append((page, x, y, image))
+            cars[car_name]['frames'][state] = {'page': page, 'x': x, 'y': y, 'w': width, 'h': height}
+            page_sizes[page][0] = max(page_sizes[page][0], x + width)
+            page_sizes[page][1] = max(page_sizes[page][1], y + height)
+            x += width + self.PADDING
+            shelf_height = max(shelf_height, height)
+
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+        for page_number, page_x, page_y, image in placements:
+            pages[page_number].blit(image, (page_x, page_y))
+        return pages
+
+    def _load_index(self):
+        """
+        Загружает индекс атласа один раз за работу программы.
+        """
+        self._is_loaded = True
+        try:
+            index = AssetCache().get_json(self.get_atlas_path('atlas_cars.json'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if index.get('version') == self.VERSION:
+            self.index = index
+
+    def get_frames(self, car_name, scale, animation):
+        """
+        Возвращает кадры автомобиля из атласа.
+
+        Запись атласа считается устаревшей, если после сборки изменились
+        масштаб или флаг анимации автомобиля, количество файлов кадров
+        (например, добавлен новый кадр) или время изменения кадров.
+
+        Args:
+            car_name (str): Идентификатор автомобиля.
+            scale (float): Масштаб автомобиля.
+            animation (bool): Флаг анимации автомобиля из car_{name}.json.
+
+        Returns:
+            list or None: Подповерхности страниц атласа по номеру кадра или None,
+                          если в атласе нет актуальных кадров автомобиля.
+        """
+        if not self._is_loaded:
+            self._load_index()
+        if self.index is None:
+            return None
+
+        entry = self.index['cars'].get(car_name)
+        if entry is None or entry['scale'] != scale or entry['animation'] != animation:
+            return None
+        paths_all = self.get_frame_paths(car_name)
+        paths = paths_all if animation else paths_all[:1]
+        if (entry['sources_total'] != len(paths_all) or len(paths) != len(entry['frames'])
+                or entry['sources_mtime'] != self._get_sources_mtime(paths)):
+            return None
+
+        try:
+            pages = [AssetCache().get_image(self.get_atlas_path(page)) for page in self.index['pages']]
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"Ошибка загрузки страницы атласа: {e}")
+            return None
+
+        return [pages[frame['page']].subsurface((frame['x'], frame['y'], frame['w'], frame['h']))
+                for frame in entry['frames']]
+
+
+if __name__ == "__main__":
+    atlas_index = SpriteAtlas().build()
+    count = sum(len(entry['frames']) for entry in atlas_index['cars'].values())
+    print(f"Атлас собран: {count} кадров, {len(atlas_index['cars'])} машин, "
+          f"страниц: {len(atlas_index['pages'])} в {SpriteAtlas.get_atlas_path()}")
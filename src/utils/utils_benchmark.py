@@ -0,0 +1,478 @@
+"""
+Модуль набора замеров производительности.
+
+Содержит класс Benchmark, который без дисплея (SDL_VIDEODRIVER=dummy)
+замеряет горячие пути игры: шаг двигателя и автомобиля, кадр RaceManager
+на заезде по сценарию, создание автомобиля, трека и окна настроек гонки,
+отрисовку HUD и сохранение результатов пользователя. Результаты сохраняются
+в JSON и сравниваются с базовой линией: замер, который стал медленнее
+больше чем на порог, считается регрессией.
+
+Сохранение базовой линии и сравнение с ней:
+    python -m src.utils.utils_benchmark baseline
+    python -m src.utils.utils_benchmark compare --threshold 0.2
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import time
+
+# Драйверы без дисплея задаются до импорта Pygame и сцен, чтобы ни один импорт
+# не успел инициализировать настоящий дисплей или звук.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src.game.game_car import Car
+from src.game.game_clock import PHYSICS_STEP
+from src.game.game_user import User
+from src.ui.tools.tool_scene_manager import SceneManager
+from src.ui.windows.window_race_manager import RaceManager
+from src.ui.windows.window_race_settings import RaceSettings
+from src.ui.windows.window_track_manager import Background, WindowBackgroundSegments
+from src.utils.utils_assets import AssetCache, TextCache
+from src.utils.utils_paths import Utils
+
+
+class Benchmark:
+    """
+    Класс набора замеров производительности.
+
+    Каждый замер повторяется несколько раз и возвращает длительности одной
+    операции (шага, кадра, создания объекта или сохранения) в микросекундах.
+    По ним считаются медиана, p95 и минимум; регрессия определяется по медиане.
+    Перед замерами создания объектов кэши ресурсов очищаются, поэтому они
+    включают загрузку файлов. Сохранение результатов пользователя замеряется
+    на временной копии его файлов, исходные файлы не изменяются.
+
+    Attributes:
+        car_name (str): Идентификатор автомобиля для замеров.
+        track_name (str): Идентификатор трека для замеров.
+        user_name (str): Идентификатор пользователя для замеров.
+        seed (int): Зерно светофора заезда по сценарию.
+    """
+
+    CASES = {
+        'engine_step': "Шаг двигателя Engine",
+        'car_step': "Шаг автомобиля Car",
+        'race_frame': "Кадр RaceManager (update, draw, present)",
+        'car_create': "Создание Car с изображением",
+        'track_create': "Создание трека WindowBackgroundSegments с загрузкой фона",
+        'race_settings_create': "Создание окна настроек гонки RaceSettings",
+        'draw_hud': "Отрисовка HUD Background.draw_hud",
+        'user_save': "Сохранение очков и лучшего времени User"
+    }
+    STEPS = 20000
+    HUD_FRAMES = 2000
+    SAVES = 20
+    MAX_RACE_FRAMES = 5000
+    DEFAULT_THRESHOLD = 0.2
+    USER_COPY_NAME = 'benchmark'
+
+    def __init__(self, car_name='audi_rs6', track_name='rainy_highway', user_name='admin', seed=1):
+        """
+        Инициализирует набор замеров.
+
+        Args:
+            car_name (str): Идентификатор автомобиля. По умолчанию 'audi_rs6'.
+            track_name (str): Идентификатор трека. По умолчанию 'rainy_highway'.
+            user_name (str): Идентификатор пользователя. По умолчанию 'admin'.
+            seed (int): Зерно светофора заезда по сценарию. По умолчанию 1.
+        """
+        self.car_name = car_name
+        self.track_name = track_name
+        self.user_name = user_name
+        self.seed = seed
+
+    @staticmethod
+    def get_baseline_path():
+        """
+        Возвращает путь к файлу базовой линии по умолчанию.
+
+        Returns:
+            str: Путь к assets/cache/benchmarks/benchmark_baseline.json.
+        """
+        return Utils().get_asset_path('cache', 'benchmarks', 'benchmark_baseline.json')
+
+    def run(self, names=None):
+        """
+        Выполняет замеры.
+
+        Args:
+            names (list, optional): Имена замеров из CASES. По умолчанию все.
+
+        Returns:
+            dict: Ключи 'meta' (автомобиль, трек, пользователь, версии, время) и 'cases'
+                  (по имени замера: 'median', 'p95', 'min' в микросекундах
+                  и 'count' — количество длительностей).
+
+        Raises:
+            ValueError: Если имя замера неизвестно.
+        """
+        names = list(self.CASES) if names is None else names
+        for name in names:
+            if name not in self.CASES:
+                print(f"Ошибка: неизвестный замер '{name}', допустимы {list(self.CASES)}")
+                raise ValueError(f"Некорректный замер: {name}")
+
+        self._screen = SceneManager().screen
+        self._user = User(self.user_name)
+
+        cases = {}
+        for name in names:
+            gc.collect()
+            samples = [sample * 1e6 for sample in getattr(self, f'_measure_{name}')()]
+            samples.sort()
+            cases[name] = {
+                'median': statistics.median(samples),
+                'p95': samples[min(len(samples) - 1, int(0.95 * len(samples)))],
+                'min': samples[0],
+                'count': len(samples)
+            }
+
+        return {
+            'meta': {
+                'car': self.car_name,
+                'track': self.track_name,
+                'user': self.user_name,
+                'seed': self.seed,
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'platform': platform.platform(),
+                'time': time.strftime('%Y-%m-%d %H:%M:%S')
+            },
+            'cases': cases
+        }
+
+    def _measure_engine_step(self, repeats=5):
+        """
+        Замеряет шаг двигателя: рост дросселя и оборотов с переключением передач.
+
+        Returns:
+            list: Средняя длительность шага в секундах для каждого повтора.
+        """
+        car = Car(self.car_name, is_headless=True)
+        engine = car.engine
+        samples = []
+        for _ in range(repeats):
+            time_start = time.perf_counter()
+            for step in range(self.STEPS):
+                if step % 900 == 0:
+                    car.reset()
+                    engine.start_acceleration()
+                elif step % 120 == 0 and engine.current_gear < engine.count_gear:
+                    engine.shift_gear(engine.current_gear + 1)
+                engine.update_throttle(PHYSICS_STEP)
+            samples.append((time.perf_counter() - time_start) / self.STEPS)
+        return samples
+
+    def _measure_car_step(self, repeats=5):
+        """
+        Замеряет шаг автомобиля: двигатель, скорость с бустом и переключения.
+
+        Returns:
+            list: Средняя длительность шага в секундах для каждого повтора.
+        """
+        car = Car(self.car_name, is_headless=True)
+        samples = []
+        for _ in range(repeats):
+            time_start = time.perf_counter()
+            for step in range(self.STEPS):
+                if step % 900 == 0:
+                    car.reset()
+                    car.start_engine()
+                elif step % 120 == 0 and car.current_gear < car.engine.count_gear:
+                    car.shift_gear(car.current_gear + 1)
+                car.update(True)
+            samples.append((time.perf_counter() - time_start) / self.STEPS)
+        return samples
+
+    def _measure_race_frame(self, repeats=3):
+        """
+        Замеряет кадры заезда RaceManager по сценарию.
+
+        Заезд идет с фиксированным зерном светофора, по одному шагу физики
+        на кадр; передача повышается в зоне буста. Экран финиша не рисуется,
+        поэтому очки пользователя и запись заезда не сохраняются.
+
+        Returns:
+            list: Длительность каждого кадра всех повторов в секундах.
+        """
+        event_shift = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
+        car = Car(self.car_name)
+        track = WindowBackgroundSegments(self._screen, self.track_name, self._user)
+        samples = []
+        for _ in range(repeats):
+            random.seed(self.seed)
+            race_manager = RaceManager(car, track, self._user)
+            race = race_manager.race
+            for _ in range(self.MAX_RACE_FRAMES):
+                time_start = time.perf_counter()
+                if (race.is_start and race.frames_after_shift <= 0 and car.current_gear < car.engine.count_gear
+                        and (car.current_gear == 0 or car.engine.is_boost())):
+                    race_manager.handle_event(event_shift)
+                race_manager.update(PHYSICS_STEP)
+                if race.is_finished:
+                    break
+                race_manager.draw()
+                race_manager.present()
+                samples.append(time.perf_counter() - time_start)
+        return samples
+
+    def _measure_car_create(self, repeats=10):
+        """
+        Замеряет создание автомобиля с загрузкой изображения и кадров.
+
+        Returns:
+            list: Длительность создания в секундах для каждого повтора.
+        """
+        return self._measure_create(lambda: Car(self.car_name), repeats)
+
+    def _measure_track_create(self, repeats=10):
+        """
+        Замеряет создание трека с загрузкой фона и слоев.
+
+        Изображения трека загружаются при первой отрисовке, поэтому замер
+        включает get_surface() и get_layer_surfaces().
+
+        Returns:
+            list: Длительность создания в секундах для каждого повтора.
+        """
+        def create():
+            track = WindowBackgroundSegments(self._screen, self.track_name, self._user)
+            track.get_surface()
+            track.get_layer_surfaces()
+
+        return self._measure_create(create, repeats)
+
+    def _measure_race_settings_create(self, repeats=3):
+        """
+        Замеряет создание окна настроек гонки со всеми автомобилями и треками.
+
+        Returns:
+            list: Длительность создания в секундах для каждого повтора.
+        """
+        return self._measure_create(lambda: RaceSettings(self._user), repeats)
+
+    @staticmethod
+    def _measure_create(create, repeats):
+        """
+        Замеряет создание объекта с пустыми кэшами ресурсов.
+
+        Args:
+            create (callable): Функция, создающая объект.
+            repeats (int): Количество повторов.
+
+        Returns:
+            list: Длительность создания в секундах для каждого повтора.
+        """
+        samples = []
+        for _ in range(repeats):
+            AssetCache().invalidate()
+            TextCache().clear()
+            time_start = time.perf_counter()
+            create()
+            samples.append(time.perf_counter() - time_start)
+        return samples
+
+    def _measure_draw_hud(self, repeats=5):
+        """
+        Замеряет отрисовку HUD при оборотах, меняющихся от кадра к кадру.
+
+        Returns:
+            list: Средняя длительность отрисовки в секундах для каждого повтора.
+        """
+        car = Car(self.car_name, is_headless=True)
+        engine = car.engine
+        range_revolutions = engine.max_revolutions - engine.min_revolutions
+        samples = []
+        for _ in range(repeats):
+            time_start = time.perf_counter()
+            for frame in range(self.HUD_FRAMES):
+                engine.revolutions = engine.min_revolutions + range_revolutions * (frame % 600) / 600
+                Background.draw_hud(self._screen, car, 10, 30, 200, 20, engine.min_revolutions)
+            samples.append((time.perf_counter() - time_start) / self.HUD_FRAMES)
+        return samples
+
+    def _measure_user_save(self, repeats=5):
+        """
+        Замеряет сохранение очков и лучшего времени пользователя после заезда.
+
+        Файлы пользователя копируются во временную директорию пользователя
+        USER_COPY_NAME, которая удаляется после замера.
+
+        Returns:
+            list: Средняя длительность сохранения в секундах для каждого повтора.
+        """
+        path_source = Utils().get_asset_path('users', f'user_{self.user_name}')
+        path_copy = Utils().get_asset_path('users', f'user_{self.USER_COPY_NAME}')
+        os.makedirs(path_copy, exist_ok=True)
+        try:
+            for kind in ('statistics', 'races'):
+                shutil.copyfile(os.path.join(path_source, f'user_{self.user_name}_{kind}.json'),
+                                os.path.join(path_copy, f'user_{self.USER_COPY_NAME}_{kind}.json'))
+            user = User(self.USER_COPY_NAME)
+            car_title = Car(self.car_name, is_headless=True).title
+
+            samples = []
+            for _ in range(repeats):
+                time_start = time.perf_counter()
+                for save in range(self.SAVES):
+                    user.set_user_score(10.0 + save, 200.0, 0)
+                    user.set_statistic_races(car_title, 10.0 + save)
+                samples.append((time.perf_counter() - time_start) / self.SAVES)
+            return samples
+        finally:
+            shutil.rmtree(path_copy, ignore_errors=True)
+
+    @staticmethod
+    def save(results, path):
+        """
+        Сохраняет результаты замеров в JSON-файл.
+
+        Args:
+            results (dict): Результаты run().
+            path (str): Путь к файлу.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def load(path):
+        """
+        Загружает результаты замеров из JSON-файла.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            dict: Результаты в формате run().
+
+        Raises:
+            ValueError: Если файл не найден или имеет неверный формат.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                results = json.load(file)
+            if 'cases' not in results:
+                raise KeyError('cases')
+            return results
+        except FileNotFoundError:
+            print(f"Ошибка: файл результатов замеров '{path}' не найден.")
+            raise ValueError(f"Файл результатов замеров '{path}' не существует.")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Ошибка: неверный формат файла результатов замеров '{path}': {e}")
+            raise ValueError(f"Некорректный файл результатов замеров '{path}'.")
+
+    @staticmethod
+    def compare(baseline, results, threshold=DEFAULT_THRESHOLD):
+        """
+        Сравнивает результаты с базовой линией по медианам.
+
+        Args:
+            baseline (dict): Результаты базовой линии.
+            results (dict): Новые результаты.
+            threshold (float): Допустимое замедление в долях (0.2 — на 20%).
+
+        Returns:
+            dict: По имени замера: 'baseline' и 'current' (медианы в микросекундах
+                  или None, если замера нет в одном из результатов), 'change'
+                  (относительное изменение) и 'is_regression'.
+        """
+        report = {}
+        for name in results['cases']:
+            current = results['cases'][name]['median']
+            base = baseline['cases'].get(name, {}).get('median')
+            change = None if not base else current / base - 1
+            report[name] = {
+                'baseline': base,
+                'current': current,
+                'change': change,
+                'is_regression': change is not None and change > threshold
+            }
+        return report
+
+
+def print_results(results):
+    """
+    Выводит результаты замеров таблицей.
+
+    Args:
+        results (dict): Результаты Benchmark.run().
+    """
+    print(f"{'замер':22} {'медиана, мкс':>14} {'p95, мкс':>12} {'мин, мкс':>12}")
+    for name, case in results['cases'].items():
+        print(f"{name:22} {case['median']:14.2f} {case['p95']:12.2f} {case['min']:12.2f}")
+
+
+def main():
+    """
+    Точка входа командной строки замеров производительности.
+    """
+    parser = argparse.ArgumentParser(description="Замеры производительности без дисплея.")
+    parser.add_argument('command', choices=('run', 'baseline', 'compare'),
+                        help="run — замерить, baseline — сохранить базовую линию, compare — сравнить с ней")
+    parser.add_argument('--cases', nargs='+', choices=list(Benchmark.CASES), help="Замеры (по умолчанию все)")
+    parser.add_argument('--baseline', default=Benchmark.get_baseline_path(), help="Файл базовой линии")
+    parser.add_argument('--output', help="Файл для сохранения результатов run и compare")
+    parser.add_argument('--results', help="Сравнить сохраненные результаты вместо нового замера")
+    parser.add_argument('--threshold', type=float, default=Benchmark.DEFAULT_THRESHOLD,
+                        help="Допустимое замедление медианы в долях (по умолчанию 0.2)")
+    parser.add_argument('--car', default='audi_rs6', help="Идентификатор автомобиля")
+    parser.add_argument('--track', default='rainy_highway', help="Идентификатор трека")
+    parser.add_argument('--user', default='admin', help="Идентификатор пользователя для замера сохранения")
+    args = parser.parse_args()
+
+    baseline = None
+    results = None
+    if args.command == 'compare':
+        try:
+            baseline = Benchmark.load(args.baseline)
+            if args.results:
+                results = Benchmark.load(args.results)
+        except ValueError:
+            print("Базовая линия сохраняется командой: python -m src.utils.utils_benchmark baseline")
+            sys.exit(2)
+    if results is None:
+        results = Benchmark(args.car, args.track, args.user).run(args.cases)
+        print_results(results)
+
+    if args.command == 'baseline':
+        Benchmark.save(results, args.baseline)
+        print(f"Базовая линия сохранена: {args.baseline}")
+        return
+    if args.output:
+        Benchmark.save(results, args.output)
+        print(f"Результаты сохранены: {args.output}")
+    if args.command == 'run':
+        return
+
+    report = Benchmark.compare(baseline, results, args.threshold)
+    print(f"\nСравнение с {args.baseline} (порог {args.threshold:.0%}):")
+    for name, item in report.items():
+        if item['change'] is None:
+            print(f"{name:22} нет в базовой линии")
+            continue
+        status = "РЕГРЕССИЯ" if item['is_regression'] else "ок"
+        print(f"{name:22} {item['baseline']:12.2f} -> {item['current']:12.2f} мкс  {item['change']:+7.1%}  {status}")
+
+    count_regressions = sum(item['is_regression'] for item in report.values())
+    if count_regressions:
+        print(f"Регрессий: {count_regressions}")
+        sys.exit(1)
+    print("Регрессий нет")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Модуль профилировщика времени кадра.
+
+Содержит класс FrameProfiler, который хранит длительности фаз кадра главного
+цикла (события, обновление, отрисовка, передача на дисплей, ожидание
+clock.tick) за скользящее окно кадров, считает по ним p50/p95/p99 и
+гистограмму, рисует оверлей поверх кадра и выгружает отчет в JSON.
+
+Режим задается ключом "profiler" в config_ui_app.json:
+    "off"      — профилировщик выключен (F3 включает оверлей);
+    "overlay"  — запись и оверлей с начала работы;
+    "headless" — запись без оверлея и выгрузка отчета в конце каждого заезда.
+"""
+
+import json
+import os
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+
+import pygame
+
+
+class FrameProfiler:
+    """
+    Класс профилировщика времени кадра (Singleton).
+
+    Для каждой фазы хранится окно из последних window кадров и гистограмма
+    по корзинам BUCKETS_MS, которая обновляется при добавлении и вытеснении
+    кадра. Процентили считаются по отсортированному окну при запросе отчета,
+    а для оверлея — раз в OVERLAY_REFRESH кадров по последним OVERLAY_WINDOW
+    кадрам, чтобы сборка оверлея не нагружала кадр.
+
+    Attributes:
+        mode (str): Режим из MODES.
+        is_enabled (bool): True, если кадры записываются.
+        is_overlay (bool): True, если оверлей рисуется поверх кадра.
+        window (int): Размер скользящего окна в кадрах.
+        frames (int): Количество записанных кадров с последнего reset().
+    """
+
+    PHASES = ('events', 'update', 'draw', 'present', 'wait')
+    SERIES = PHASES + ('frame',)
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.7, 33.3, 50.0, 100.0)
+    MODES = ('off', 'overlay', 'headless')
+    DEFAULT_WINDOW = 3600
+    OVERLAY_REFRESH = 30
+    OVERLAY_WINDOW = 120
+    OVERLAY_MARGIN = 8
+    OVERLAY_SIZE = (330, 120)
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        """
+        Создает единственный экземпляр класса (Singleton).
+
+        Returns:
+            FrameProfiler: Единственный экземпляр класса.
+        """
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Инициализирует выключенный профилировщик с окном по умолчанию.
+        """
+        if FrameProfiler._initialized:
+            return
+
+        self.mode = 'off'
+        self.is_enabled = False
+        self.is_overlay = False
+        self.window = self.DEFAULT_WINDOW
+        self._font = None
+        self._overlay_surface = None
+        self.reset()
+        FrameProfiler._initialized = True
+
+    def set_mode(self, mode):
+        """
+        Устанавливает режим профилировщика.
+
+        Args:
+            mode (str): 'off', 'overlay' или 'headless'.
+
+        Raises:
+            ValueError: Если режим неизвестен.
+        """
+        if mode not in self.MODES:
+            print(f"Ошибка: неизвестный режим профилировщика '{mode}', допустимы {self.MODES}")
+            raise ValueError(f"Некорректный режим профилировщика: {mode}")
+
+        self.mode = mode
+        self.is_overlay = mode == 'overlay'
+        self.is_enabled = mode != 'off'
+
+    def set_window(self, window):
+        """
+        Устанавливает размер скользящего окна и очищает записанные кадры.
+
+        Args:
+            window (int): Количество кадров в окне.
+
+        Raises:
+            ValueError: Если размер окна меньше 1.
+        """
+        if window < 1:
+            print(f"Ошибка: окно профилировщика должно быть не меньше 1 кадра: {window}")
+            raise ValueError(f"Некорректное окно профилировщика: {window}")
+
+        self.window = window
+        self.reset()
+
+    def toggle_overlay(self):
+        """
+        Показывает или скрывает оверлей.
+
+        Пока оверлей показан, кадры записываются в любом режиме.
+        """
+        self.is_overlay = not self.is_overlay
+        self.is_enabled = self.is_overlay or self.mode != 'off'
+        self._overlay_surface = None
+
+    def reset(self):
+        """
+        Удаляет все записанные кадры.
+        """
+        self.frames = 0
+        self._samples = {series: deque() for series in self.SERIES}
+        self._histograms = {series: [0] * (len(self.BUCKETS_MS) + 1) for series in self.SERIES}
+        self._overlay_surface = None
+
+    def add_frame(self, durations):
+        """
+        Записывает длительности фаз одного кадра.
+
+        Args:
+            durations (tuple): Длительности фаз в секундах в порядке PHASES.
+        """
+        values = [duration * 1000 for duration in durations]
+        values.append(sum(values))
+        for series, value in zip(self.SERIES, values):
+            samples = self._samples[series]
+            histogram = self._histograms[series]
+            if len(samples) == self.window:
+                histogram[bisect_left(self.BUCKETS_MS, samples.popleft())] -= 1
+            samples.append(value)
+            histogram[bisect_left(self.BUCKETS_MS, value)] += 1
+        self.frames += 1
+
+    def get_stats(self, series, last=None):
+        """
+        Возвращает статистику фазы за скользящее окно.
+
+        Args:
+            series (str): Фаза из PHASES или 'frame' (сумма фаз).
+            last (int, optional): Считать процентили только по последним кадрам окна.
+                                  Гистограмма всегда описывает все окно.
+
+        Returns:
+            dict: Ключи 'p50', 'p95', 'p99', 'mean', 'max' (в миллисекундах),
+                  'count' и 'histogram' (количество кадров по корзинам BUCKETS_MS,
+                  последняя корзина — длительности больше последней границы).
+        """
+        samples = self._samples[series]
+        if last is not None and last < len(samples):
+            samples = islice(samples, len(samples) - last, None)
+        samples = sorted(samples)
+        count = len(samples)
+
+        def percentile(fraction):
+            return samples[min(count - 1, int(fraction * count))] if count else 0.0
+
+        return {
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'mean': sum(samples) / count if count else 0.0,
+            'max': samples[-1] if count else 0.0,
+            'count': count,
+            'histogram': list(self._histograms[series])
+        }
+
+    def get_report(self):
+        """
+        Возвращает отчет по всем фазам.
+
+        Returns:
+            dict: Ключи 'frames' (записано с последнего reset), 'window', 'buckets_ms'
+                  и 'phases' (статистика get_stats по каждой фазе и 'frame').
+        """
+        return {
+            'frames': self.frames,
+            'window': self.window,
+            'buckets_ms': list(self.BUCKETS_MS),
+            'phases': {series: self.get_stats(series) for series in self.SERIES}
+        }
+
+    def export_json(self, path, meta=None):
+        """
+        Сохраняет отчет в JSON-файл.
+
+        Args:
+            path (str): Путь к файлу отчета.
+            meta (dict, optional): Дополнительные сведения (автомобиль, трек, частота кадров).
+        """
+        report = self.get_report()
+        if meta is not None:
+            report['meta'] = meta
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+
+    def draw_overlay(self, screen):
+        """
+        Рисует оверлей с p50/p95/p99 фаз поверх кадра.
+
+        Оверлей находится в правом верхнем углу. Его поверхность собирается
+        заново раз в OVERLAY_REFRESH кадров, в остальных кадрах она только
+        копируется на экран.
+
+        Args:
+            screen (pygame.Surface): Поверхность экрана.
+
+        Returns:
+            pygame.Rect: Область экрана, занятая оверлеем.
+        """
+        if self._overlay_surface is None or self.frames % self.OVERLAY_REFRESH == 0:
+            self._overlay_surface = self._build_overlay()
+        position = (screen.get_width() - self.OVERLAY_SIZE[0] - self.OVERLAY_MARGIN, self.OVERLAY_MARGIN)
+        return screen.blit(self._overlay_surface, position)
+
+    def _build_overlay(self):
+        """
+        Собирает поверхность оверлея.
+
+        Надписи рисуются шрифтом напрямую, без общего TextCache: значения
+        процентилей меняются при каждой сборке и вытесняли бы из кэша
+        надписи меню и HUD.
+
+        Returns:
+            pygame.Surface: Непрозрачная поверхность размера OVERLAY_SIZE.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        surface = pygame.Surface(self.OVERLAY_SIZE)
+        surface.fill((20, 20, 20))
+        rows = [('мс', 'p50', 'p95', 'p99', f'кадров: {self.frames}')]
+        for series in self.SERIES:
+            stats = self.get_stats(series, self.OVERLAY_WINDOW)
+            rows.append((series, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}", ''))
+
+        for number, row in enumerate(rows):
+            for column, (x, cell) in enumerate(zip((6, 80, 135, 190, 245), row)):
+                color = (230, 230, 230) if column == 0 or number == 0 else (150, 230, 150)
+                surface.blit(self._font.render(cell, True, color), (x, 4 + number * 16))
+        return surface